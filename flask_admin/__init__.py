@@ -10,19 +10,27 @@
     :license: BSD, see LICENSE for more details.
 """
 from __future__ import absolute_import
+from __future__ import with_statement
 
 import datetime
 from functools import wraps
+import hashlib
 import inspect
+import mimetypes
+import multiprocessing
 import os
+import posixpath
+import threading
 import time
 import types
 
 import flask
 from flask import flash, render_template, redirect, request, url_for
 
-from flask.ext.admin.wtforms import has_file_field
+from flask.ext.admin.wtforms import get_field_names, has_file_field
 from flask.ext.admin.datastore import AdminDatastore
+from flask.ext.admin import assets, util
+from flask.ext.admin.util import FILTER_OPERATORS, ListRow
 
 
 def create_admin_blueprint(*args, **kwargs):
@@ -65,6 +73,110 @@ def create_admin_blueprint(*args, **kwargs):
     The `list_view_pagination` parameter sets the number of items that
     will be listed per page in the list view.
 
+    Set `keyset_pagination` to True to page through the list view with
+    keyset (seek) pagination instead of page numbers. Rather than an
+    offset, each page is located by an opaque `cursor` url parameter
+    that encodes the key of the last row on the previous page, so the
+    deep pages of large tables are as fast as the first. Keyset
+    pagination only offers previous/next links. Alternatively, set
+    `max_offset_page` to a page number and requests for pages past it
+    will be redirected to the equivalent keyset pagination cursor,
+    while the pages before it keep their page numbers. Both options
+    require a datastore that supports keyset pagination (see
+    :attr:`AdminDatastore.supports_keyset_pagination`); with other
+    datastores the list is paged by offset.
+
+    Requested with the `fragment` url parameter or by an
+    XMLHttpRequest, the list view only renders the rows and pagination
+    of the list (the ``admin/list_fragment.html`` template), which the
+    admin's JavaScript swaps in to page through the list in place.
+
+    Set `stream_list_view` to True to stream the list view as it is
+    rendered, with the rows read from the datastore as they are
+    rendered rather than all up front, so that large pages (a high
+    `list_view_pagination`) start arriving sooner and don't have to be
+    held in memory. This requires Flask 0.9 or later, for
+    :func:`flask.stream_with_context`; with older versions the list
+    view is rendered as usual. Keyset pagination pages aren't
+    streamed.
+
+    The list view can be sorted with the `sort` and `dir` url
+    parameters, filtered with ``flt_<column>__<operator>`` parameters
+    and searched with the `q` parameter, on the columns the datastore
+    allows; see :meth:`AdminDatastore.get_sortable_columns`,
+    :meth:`AdminDatastore.get_filter_columns` and
+    :meth:`AdminDatastore.get_search_columns`. Search results are
+    always paged by offset, even with `keyset_pagination`.
+
+    The rows of a model can be exported from the export view as a CSV
+    (``?format=csv``) or JSON lines (``?format=jsonl``) file, with the
+    same sort, filter and search parameters as the list view and an
+    optional comma separated list of `columns`. The file is streamed
+    as the rows are read from the datastore, `export_batch_size` rows
+    at a time.
+
+    The list view has checkboxes to delete several model instances at
+    once. They are deleted `bulk_delete_batch_size` at a time, with
+    each batch committed separately so that deleting many rows
+    doesn't hold locks for long.
+
+    CSV and JSON lines files can be uploaded to the import view to add
+    model instances in bulk. The rows are validated and then saved
+    `import_batch_size` at a time. Set `import_processes` to a number
+    of worker processes to validate the rows of imports in parallel;
+    the processes are started by the first import, shared by the ones
+    after it and shut down when the interpreter exits.
+
+    Relationship fields that the datastore looks up remotely (see the
+    `lookup_columns` option of
+    :class:`~flask.ext.admin.datastore.sqlalchemy.SQLAlchemyDatastore`)
+    get their options from the lookup view as the user types, at most
+    `lookup_limit` at a time.
+
+    Set `conditional_get` to True to give the list and edit pages an
+    ETag derived from the request url and the datastore's version of
+    the model (see
+    :meth:`~flask.ext.admin.datastore.AdminDatastore.get_model_version`),
+    so that reloading a page that hasn't changed is answered with
+    ``304 Not Modified`` without querying the database. The versions
+    are kept by each process and only notice changes made through the
+    datastore, so this should only be used when the admin is served
+    by a single process and is the only thing changing the data:
+    otherwise a process that didn't see a change answers with a stale
+    304. Datastores that don't keep versions (such as
+    :class:`~flask.ext.admin.datastore.mongoalchemy.MongoAlchemyDatastore`)
+    give no ETags, so their pages are always rendered.
+
+    Each model also has a JSON API, for clients that would otherwise
+    have to scrape the admin pages. ``GET /api/<model_name>/`` lists
+    the model's rows, taking the list view's sort, filter, search,
+    `page` and `cursor` url parameters plus `per_page` (at most
+    `api_max_per_page`). ``GET``, ``PATCH`` and ``DELETE`` on
+    ``/api/<model_name>/<key>/`` read, update and delete a model
+    instance, and ``POST /api/<model_name>/`` adds one. Rows are
+    given as objects of column values, with their url key as `_key`;
+    the `fields` url parameter is a comma separated list of the
+    columns to include (by default, every
+    :meth:`~flask.ext.admin.datastore.AdminDatastore.get_export_columns`),
+    and only those columns are read from the datastore when listing.
+    Data is sent as a JSON object (or form data) of field names
+    matched to values, which is validated with the model's form;
+    ``PATCH`` only changes the fields it is given. In JSON, null
+    clears a field and false unchecks a checkbox.
+
+    Set `template_cache_dir` to a directory for Jinja to cache the
+    compiled admin templates in (unless the app already has a
+    bytecode cache), shared by all of the app's processes, and set
+    `precompile_templates` to True to compile every admin template
+    when the blueprint is registered instead of on first use, so that
+    the first requests to a new process aren't slower than the rest.
+
+    Static files are served with far-future cache headers and, where
+    the static folder has precompressed copies of them, compressed.
+    Set `static_sendfile` to ``'x-sendfile'`` or
+    ``'x-accel-redirect'`` to have the front end server send static
+    files instead of Flask; see :class:`AdminBlueprint`.
+
     Finally, the `empty_sequence` keyword can be used to designate a
     sequence of characters that can be used as a substitute for cases
     where part of the key url may be empty.  This should be a rare
@@ -87,6 +199,131 @@ def create_admin_blueprint(*args, **kwargs):
         return create_admin_blueprint_new(*args, **kwargs)
 
 
+class AdminBlueprint(flask.Blueprint):
+    """The blueprint class of admin blueprints. Its static files are
+    fingerprinted: urls built for them with ``url_for`` get a `v`
+    argument with a hash of the file's content, computed when the
+    blueprint is created (or whenever the file changes, in debug
+    mode). Requests that have the current hash are served with
+    far-future cache headers, since a changed file gets a new url.
+
+    Templates get an `asset_bundles` dict that matches the name of
+    each of the static bundles built by :mod:`flask.ext.admin.assets`
+    to the static files that a page should include for it: the bundle
+    itself, or the files it is built from in debug mode or if the
+    bundle hasn't been built in this static folder.
+
+    Static files that have precompressed copies next to them (see
+    :func:`flask.ext.admin.assets.compress_static`) are served
+    compressed to the clients that accept it. With `static_sendfile`
+    set to ``'x-sendfile'``, static files are handed to the front end
+    server with an ``X-Sendfile`` header instead of being read by
+    Flask. With ``'x-accel-redirect'``, they are handed to nginx with
+    an ``X-Accel-Redirect`` header to `static_accel_prefix` followed
+    by the file name, which should be an internal location aliased to
+    the static folder; nginx picks the compressed copies itself there,
+    with its ``gzip_static`` option.
+    """
+    #: how long browsers may cache fingerprinted static files for
+    static_max_age = 365 * 24 * 60 * 60
+
+    def __init__(self, *args, **kwargs):
+        self.static_sendfile = kwargs.pop('static_sendfile', None)
+        self.static_accel_prefix = kwargs.pop('static_accel_prefix', None)
+        if self.static_sendfile not in (None, 'x-sendfile',
+                                        'x-accel-redirect'):
+            raise ValueError('invalid static_sendfile: %r'
+                             % self.static_sendfile)
+        if self.static_sendfile == 'x-accel-redirect' and \
+               not self.static_accel_prefix:
+            raise ValueError('x-accel-redirect requires a '
+                             'static_accel_prefix')
+        super(AdminBlueprint, self).__init__(*args, **kwargs)
+        self.static_fingerprints = None
+        if self.static_folder and os.path.isdir(self.static_folder):
+            self.static_fingerprints = util.StaticFingerprints(
+                self.static_folder)
+        self.url_defaults(self._fingerprint_static_url)
+        self.context_processor(self._asset_bundles_context)
+
+    def get_static_fingerprint(self, filename):
+        """Returns the fingerprint of a static file, or None."""
+        if self.static_fingerprints is None or not filename:
+            return None
+        return self.static_fingerprints.get(
+            filename, check_mtime=flask.current_app.debug)
+
+    def send_static_file(self, filename):
+        path = self._get_static_path(filename)
+        if path is None:
+            response = super(AdminBlueprint, self).send_static_file(
+                filename)
+        else:
+            response = self._send_static_path(filename, path)
+        fingerprint = request.args.get('v')
+        if fingerprint and \
+               fingerprint == self.get_static_fingerprint(filename):
+            response.headers['Cache-Control'] = \
+                'public, max-age=%d, immutable' % self.static_max_age
+        return response
+
+    def _get_static_path(self, filename):
+        """Returns the path of a file in the static folder, or None if
+        there is no such file.
+        """
+        if not self.static_folder:
+            return None
+        filename = posixpath.normpath(filename)
+        if filename.startswith(('/', '../')) or filename == '..':
+            return None
+        path = os.path.join(self.static_folder, *filename.split('/'))
+        if not os.path.isfile(path):
+            return None
+        return path
+
+    def _send_static_path(self, filename, path):
+        mimetype = mimetypes.guess_type(filename)[0] or \
+            'application/octet-stream'
+        if self.static_sendfile == 'x-accel-redirect':
+            response = flask.current_app.response_class(mimetype=mimetype)
+            response.headers['X-Accel-Redirect'] = '%s/%s' % (
+                self.static_accel_prefix.rstrip('/'),
+                posixpath.normpath(filename))
+            return response
+
+        encoding, path_to_send = assets.find_compressed(
+            path, lambda encoding: request.accept_encodings[encoding],
+            check_mtime=flask.current_app.debug)
+        if self.static_sendfile == 'x-sendfile':
+            response = flask.current_app.response_class(mimetype=mimetype)
+            response.headers['X-Sendfile'] = path_to_send
+            response.cache_control.public = True
+        else:
+            response = flask.send_file(path_to_send, mimetype=mimetype,
+                                       conditional=True)
+        if encoding is not None:
+            response.headers['Content-Encoding'] = encoding
+        if assets.has_compressed(path):
+            response.vary.add('Accept-Encoding')
+        return response
+
+    def _asset_bundles_context(self):
+        bundles = {}
+        for bundle, filenames in assets.BUNDLES.items():
+            if flask.current_app.debug or \
+                   self.get_static_fingerprint(bundle) is None:
+                bundles[bundle] = filenames
+            else:
+                bundles[bundle] = [bundle]
+        return dict(asset_bundles=bundles)
+
+    def _fingerprint_static_url(self, endpoint, values):
+        if endpoint == self.name + '.static' and 'v' not in values:
+            fingerprint = self.get_static_fingerprint(values.get('filename'))
+            if fingerprint:
+                values['v'] = fingerprint
+
+
 def create_admin_blueprint_deprecated(
     models, db_session, name='admin', model_forms=None, exclude_pks=True,
     list_view_pagination=25, view_decorator=None, **kwargs):
@@ -102,7 +339,12 @@ def create_admin_blueprint_deprecated(
 def create_admin_blueprint_new(
     datastore, name='admin', list_view_pagination=25, view_decorator=None,
     empty_sequence=u'\x1a', template_folder=None, static_folder=None,
-    **kwargs):
+    keyset_pagination=False, max_offset_page=None, export_batch_size=1000,
+    bulk_delete_batch_size=500, import_batch_size=1000,
+    import_processes=None, lookup_limit=20, conditional_get=False,
+    static_sendfile=None, static_accel_prefix=None, api_max_per_page=100,
+    stream_list_view=False, template_cache_dir=None,
+    precompile_templates=False, **kwargs):
     if not template_folder:
         template_folder = os.path.join(
             _get_admin_extension_dir(), 'templates')
@@ -110,10 +352,27 @@ def create_admin_blueprint_new(
         static_folder = os.path.join(
             _get_admin_extension_dir(), 'static')
 
-    admin_blueprint = flask.Blueprint(
+    admin_blueprint = AdminBlueprint(
         name, 'flask.ext.admin',
         static_folder=static_folder, template_folder=template_folder,
-        **kwargs)
+        static_sendfile=static_sendfile,
+        static_accel_prefix=static_accel_prefix, **kwargs)
+
+    @admin_blueprint.record_once
+    def setup_templates(state):
+        if not (template_cache_dir or precompile_templates):
+            return
+        jinja_env = state.app.jinja_env
+        if template_cache_dir and jinja_env.bytecode_cache is None:
+            jinja_env.bytecode_cache = util.TemplateBytecodeCache(
+                template_cache_dir)
+        if precompile_templates:
+            for template_name in util.list_templates(template_folder):
+                jinja_env.get_template(template_name)
+
+    # datastores without keyset pagination are always paged by offset
+    supports_keyset = getattr(datastore, 'supports_keyset_pagination',
+                              False)
 
     # if no view decorator was assigned, let view_decorator be a dummy
     # decorator that doesn't really do anything
@@ -124,14 +383,160 @@ def create_admin_blueprint_new(
                 return f(*args, **kwds)
             return wrapper
 
+    def memoized(method):
+        """Wraps a datastore method so that its result for given
+        arguments is remembered for the rest of the request.
+        """
+        @wraps(method)
+        def wrapper(*args):
+            if not flask.has_request_context():
+                return method(*args)
+            # kept on the request context rather than flask.g, which
+            # lives as long as the app context and so can outlast the
+            # request (e.g. when the app context was pushed by hand)
+            request_ctx = flask._request_ctx_stack.top
+            memo = getattr(request_ctx, '_admin_memo', None)
+            if memo is None:
+                memo = request_ctx._admin_memo = {}
+            key = (admin_blueprint.name, method.__name__, args)
+            if key not in memo:
+                memo[key] = method(*args)
+            return memo[key]
+        return wrapper
+
+    list_model_names = memoized(datastore.list_model_names)
+    get_model_class = memoized(datastore.get_model_class)
+    get_model_form = memoized(datastore.get_model_form)
+
+    # the navigation menu of each url root (the model names and their
+    # urls don't change once the blueprint is registered)
+    nav_cache = {}
+
+    @admin_blueprint.context_processor
+    def nav_context():
+        """Gives templates the sorted model names and the html of the
+        navigation menu's links to them, which is rendered once and
+        then cached (except in debug mode, so template changes show).
+        """
+        model_names = list_model_names()
+        key = (request.url_root, tuple(model_names))
+        nav = nav_cache.get(key)
+        if nav is None:
+            sorted_names = sorted(model_names, key=lambda name: name.lower())
+            nav = flask.Markup(flask.current_app.jinja_env.get_template(
+                'admin/_nav.html').render(model_names=sorted_names,
+                                          url_for=url_for))
+            if not flask.current_app.debug:
+                nav_cache[key] = nav
+        return dict(admin_nav=nav)
+
+    # the worker processes that import rows are validated by, started
+    # by the first import that needs them and shut down when the
+    # interpreter exits (including the reloader's restarts)
+    import_pool = {}
+    import_pool_lock = threading.Lock()
+
+    def get_import_pool():
+        if not import_processes:
+            return None
+        with import_pool_lock:
+            if 'pool' not in import_pool:
+                import_pool['pool'] = util.close_pool_at_exit(
+                    multiprocessing.Pool(import_processes))
+            return import_pool['pool']
+
     def get_model_url_key(model_instance):
         """Helper function that turns a set of model keys into a
         unique key for a url.
         """
-        values = datastore.get_model_keys(model_instance)
+        if isinstance(model_instance, ListRow):
+            values = model_instance.keys
+        else:
+            values = datastore.get_model_keys(model_instance)
         return '/'.join([unicode(value) if value else empty_sequence
                          for value in values])
 
+    def conditional(view):
+        """Decorator for views of a model that answers a GET request
+        with 304 Not Modified if the request's If-None-Match header has
+        the page's ETag. The ETag is derived from the model's version
+        before the view runs, so a change made while the page is being
+        rendered gives the next request a different one. Versions only
+        cover the changes seen by this process, so with several
+        processes a page can be answered with a stale 304. Pages of
+        models the datastore has no version for, and pages with
+        flashed messages waiting to be shown, are always rendered.
+        """
+        @wraps(view)
+        def wrapper(model_name, *args, **kwargs):
+            etag = None
+            if conditional_get and request.method == 'GET' and \
+                   model_name in list_model_names() and \
+                   not flask.session.get('_flashes'):
+                version = datastore.get_model_version(model_name)
+                if version is not None:
+                    etag = hashlib.sha1(repr((
+                        admin_blueprint.name, request.path,
+                        sorted(request.args.items(multi=True)),
+                        request.is_xhr, version))).hexdigest()
+            if etag is not None and etag in request.if_none_match:
+                response = flask.Response(status=304)
+            else:
+                response = flask.make_response(
+                    view(model_name, *args, **kwargs))
+                if etag is None or response.status_code != 200:
+                    return response
+            response.set_etag(etag)
+            response.headers['Cache-Control'] = 'private, no-cache'
+            return response
+        return wrapper
+
+    def api_response(payload, status=200):
+        """Returns a compact JSON response for the API views."""
+        return flask.current_app.response_class(
+            flask.json.dumps(payload, separators=(',', ':')),
+            status=status, mimetype='application/json')
+
+    def api_error(message, status, **kwargs):
+        return api_response(dict(kwargs, error=message), status)
+
+    def get_api_fields(model_name):
+        """Returns the columns requested by the `fields` url arg, or
+        every export column. Raises a ValueError for columns that can't
+        be exported.
+        """
+        export_columns = datastore.get_export_columns(model_name)
+        fields = request.args.get('fields')
+        if not fields:
+            return export_columns
+        fields = [name for name in fields.split(',') if name]
+        for name in fields:
+            if name not in export_columns:
+                raise ValueError('%s.%s cannot be exported' % (
+                    model_name, name))
+        return fields
+
+    def get_api_item(model_instance, fields):
+        if isinstance(model_instance, ListRow):
+            values = model_instance.values
+        else:
+            values = [getattr(model_instance, name, None)
+                      for name in fields]
+        item = util.json_object(fields, values)
+        item['_key'] = get_model_url_key(model_instance)
+        return item
+
+    def get_api_form_data():
+        """Returns a (formdata, names) tuple for the data sent to the
+        API, as a JSON object or form data, where names are the names
+        of the fields that were given.
+        """
+        if request.json is None:
+            return request.form, request.form.keys()
+        if not isinstance(request.json, dict):
+            flask.abort(400)
+        return util.json_form_data(request.json), request.json.keys()
+
     def create_index_view():
         @view_decorator
         def index():
@@ -139,45 +544,148 @@ def create_admin_blueprint_new(
             """
             return render_template(
                 'admin/index.html',
-                model_names=datastore.list_model_names())
+                model_names=list_model_names())
         return index
 
     def create_list_view():
         @view_decorator
+        @conditional
         def list_view(model_name):
             """Lists instances of a given model, so they can
-            beselected for editing or deletion.
+            beselected for editing or deletion. Asked for a fragment
+            (with the `fragment` url arg or an XMLHttpRequest), only
+            the rows and pagination are rendered, for paging through
+            the list in place.
             """
-            if not model_name in datastore.list_model_names():
+            if not model_name in list_model_names():
                 return "%s cannot be accessed through this admin page" % (
                     model_name,)
             per_page = list_view_pagination
-            page = int(request.args.get('page', '1'))
-            pagination = datastore.create_model_pagination(
-                model_name, page, per_page)
+            sortable_columns = datastore.get_sortable_columns(model_name)
+            filter_columns = datastore.get_filter_columns(model_name)
+            (sort, sort_desc, sort_args, filters, filter_args,
+             search) = _parse_list_args(datastore, model_name, request.args)
+            if search and not datastore.has_search_index(model_name):
+                flash('The %s search index has not been created, so the '
+                      'list has not been searched.' % model_name, 'error')
+                search = None
 
-            return render_template(
-                'admin/list.html',
-                model_names=datastore.list_model_names(),
+            # the url args that are kept when changing pages
+            list_args = dict(sort_args, **filter_args)
+            if search:
+                list_args['q'] = search
+
+            def list_url(**kwargs):
+                args = dict(list_args, **kwargs)
+                return url_for('.list', model_name=model_name, **args)
+
+            stream = stream_list_view and \
+                hasattr(flask, 'stream_with_context')
+            cursor = request.args.get('cursor')
+            # a page number that isn't a number isn't a reason to drop
+            # the filters
+            try:
+                page = max(1, int(request.args.get('page', '1')))
+            except ValueError:
+                page = 1
+            if not supports_keyset:
+                cursor = None
+            try:
+                # search results are ranked, so they are paged by offset
+                if supports_keyset and not search and \
+                       (cursor is not None or keyset_pagination):
+                    stream = False
+                    pagination = datastore.create_model_keyset_pagination(
+                        model_name, cursor, per_page, sort=sort,
+                        sort_desc=sort_desc, filters=filters)
+                else:
+                    if supports_keyset and max_offset_page and \
+                           page > max_offset_page and not search:
+                        cursor = datastore.get_page_cursor(
+                            model_name, page, per_page, sort=sort,
+                            sort_desc=sort_desc, filters=filters)
+                        if cursor:
+                            return redirect(list_url(cursor=cursor))
+                    pagination = datastore.create_model_pagination(
+                        model_name, page, per_page, sort=sort,
+                        sort_desc=sort_desc, filters=filters, search=search,
+                        stream=stream)
+            except ValueError:
+                # an invalid cursor is dropped; if that doesn't help,
+                # the filters must be invalid so drop them too
+                if cursor:
+                    return redirect(list_url())
+                flash('Invalid filter: the %s list has not been '
+                      'filtered.' % model_name, 'error')
+                return redirect(url_for('.list', model_name=model_name,
+                                        **sort_args))
+
+            context = dict(
+                model_names=list_model_names(),
                 get_model_url_key=get_model_url_key,
+                list_columns=datastore.get_list_columns(model_name),
+                sortable_columns=sortable_columns,
+                sort=sort,
+                sort_desc=sort_desc,
+                sort_args=sort_args,
+                filter_columns=filter_columns,
+                filters=filters,
+                filter_args=filter_args,
+                searchable=bool(datastore.get_search_columns(model_name)),
+                search=search,
+                list_args=list_args,
+                list_url=list_url,
                 model_name=model_name,
                 pagination=pagination)
+            template = 'admin/list.html'
+            if request.args.get('fragment') or request.is_xhr:
+                template = 'admin/list_fragment.html'
+            if stream:
+                response = flask.Response(flask.stream_with_context(
+                    stream_list(model_name, template, context)))
+            elif not flask.current_app.debug:
+                response = flask.make_response(
+                    render_template(template, **context))
+            else:
+                with datastore.warn_lazy_loads(model_name):
+                    response = flask.make_response(
+                        render_template(template, **context))
+            response.vary.add('X-Requested-With')
+            return response
+
+        def stream_list(model_name, template, context):
+            """Yields the chunks of a streamed list view."""
+            app = flask.current_app
+            app.update_template_context(context)
+            stream = app.jinja_env.get_or_select_template(
+                template).stream(context)
+            # send a chunk every few hundred template events rather
+            # than every one
+            stream.enable_buffering(256)
+            if not app.debug:
+                for chunk in stream:
+                    yield chunk
+                return
+            with datastore.warn_lazy_loads(model_name):
+                for chunk in stream:
+                    yield chunk
         return list_view
 
     def create_edit_view():
         @view_decorator
+        @conditional
         def edit(model_name, model_url_key):
             """Edit a particular instance of a model."""
             model_keys = [key if key != empty_sequence else u''
                          for key in model_url_key.split('/')]
 
-            if not model_name in datastore.list_model_names():
+            if not model_name in list_model_names():
                 return "%s cannot be accessed through this admin page" % (
                     model_name,)
 
-            model_form = datastore.get_model_form(model_name)
+            model_form = get_model_form(model_name)
             model_instance = datastore.find_model_instance(
-                model_name, model_keys)
+                model_name, model_keys, load=get_field_names(model_form))
 
             if not model_instance:
                 return "%s not found: %s" % (model_name, model_key)
@@ -185,15 +693,17 @@ def create_admin_blueprint_new(
             if request.method == 'GET':
                 form = model_form(obj=model_instance)
                 form._has_file_field = has_file_field(form)
+                datastore.load_form_choices(form)
                 return render_template(
                     'admin/edit.html',
-                    model_names=datastore.list_model_names(),
+                    model_names=list_model_names(),
                     model_instance=model_instance,
                     model_name=model_name, form=form)
 
             elif request.method == 'POST':
                 form = model_form(request.form, obj=model_instance)
                 form._has_file_field = has_file_field(form)
+                datastore.load_form_choices(form)
                 if form.validate():
                     model_instance = datastore.update_from_form(
                         model_instance, form)
@@ -209,7 +719,7 @@ def create_admin_blueprint_new(
                           'error')
                     return render_template(
                         'admin/edit.html',
-                        model_names=datastore.list_model_names(),
+                        model_names=list_model_names(),
                         model_instance=model_instance,
                         model_name=model_name, form=form)
         return edit
@@ -218,23 +728,25 @@ def create_admin_blueprint_new(
         @view_decorator
         def add(model_name):
             """Create a new instance of a model."""
-            if not model_name in datastore.list_model_names():
+            if not model_name in list_model_names():
                 return "%s cannot be accessed through this admin page" % (
                     model_name)
-            model_class = datastore.get_model_class(model_name)
-            model_form = datastore.get_model_form(model_name)
+            model_class = get_model_class(model_name)
+            model_form = get_model_form(model_name)
             model_instance = model_class()
             if request.method == 'GET':
                 form = model_form()
                 form._has_file_field = has_file_field(form)
+                datastore.load_form_choices(form)
                 return render_template(
                     'admin/add.html',
-                    model_names=datastore.list_model_names(),
+                    model_names=list_model_names(),
                     model_name=model_name,
                     form=form)
             elif request.method == 'POST':
                 form = model_form(request.form)
                 form._has_file_field = has_file_field(form)
+                datastore.load_form_choices(form)
                 if form.validate():
                     model_instance = datastore.update_from_form(
                         model_instance, form)
@@ -248,7 +760,7 @@ def create_admin_blueprint_new(
                           '%s has not been saved.' % model_name, 'error')
                     return render_template(
                         'admin/add.html',
-                        model_names=datastore.list_model_names(),
+                        model_names=list_model_names(),
                         model_name=model_name,
                         form=form)
         return add
@@ -260,7 +772,7 @@ def create_admin_blueprint_new(
             model_keys = [key if key != empty_sequence else u''
                           for key in model_url_key.split('/')]
 
-            if not model_name in datastore.list_model_names():
+            if not model_name in list_model_names():
                 return "%s cannot be accessed through this admin page" % (
                     model_name,)
             model_instance = datastore.delete_model_instance(
@@ -274,6 +786,270 @@ def create_admin_blueprint_new(
 
         return delete
 
+    def create_bulk_delete_view():
+        @view_decorator
+        def bulk_delete(model_name):
+            """Delete the instances of a model selected in the list
+            view, in batches.
+            """
+            if not model_name in list_model_names():
+                return "%s cannot be accessed through this admin page" % (
+                    model_name,)
+            model_keys_list = [
+                [key if key != empty_sequence else u''
+                 for key in model_url_key.split('/')]
+                for model_url_key in request.form.getlist('model_url_key')]
+            if not model_keys_list:
+                flash('No %s was selected.' % model_name, 'error')
+                return redirect(url_for('.list', model_name=model_name))
+
+            try:
+                counts = datastore.delete_model_instances(
+                    model_name, model_keys_list,
+                    batch_size=bulk_delete_batch_size)
+            except ValueError:
+                flash('There was an error with the selection. No %s has '
+                      'been deleted.' % model_name, 'error')
+                return redirect(url_for('.list', model_name=model_name))
+            except util.BulkDeleteError as e:
+                deleted = sum([count for count in e.counts
+                               if count is not None])
+                flash(u'%s could not be deleted: %s. %d of %d selected %s '
+                      u'deleted before the error.' % (
+                          model_name, unicode(e), deleted,
+                          len(model_keys_list), model_name), 'error')
+                return redirect(url_for('.list', model_name=model_name))
+
+            deleted = sum([count for count in counts if count is not None])
+            flash('%d of %d selected %s deleted in %d batch%s: %s' % (
+                deleted, len(model_keys_list), model_name, len(counts),
+                len(counts) != 1 and 'es' or '',
+                ', '.join([count is None and '?' or str(count)
+                           for count in counts])), 'success')
+            return redirect(url_for('.list', model_name=model_name))
+        return bulk_delete
+
+    def create_export_view():
+        @view_decorator
+        def export(model_name):
+            """Streams the rows of a given model as a CSV or JSON lines
+            file, sorted, filtered and searched like the list view.
+            """
+            if not model_name in list_model_names():
+                return "%s cannot be accessed through this admin page" % (
+                    model_name,)
+            format = request.args.get('format', 'csv')
+            if format not in _export_formats:
+                return "unknown export format: %s" % format, 400
+            columns = request.args.get('columns')
+            if columns:
+                columns = columns.split(',')
+
+            (sort, sort_desc, sort_args, filters, filter_args,
+             search) = _parse_list_args(datastore, model_name, request.args)
+            try:
+                rows = datastore.iter_model_rows(
+                    model_name, columns, sort=sort, sort_desc=sort_desc,
+                    filters=filters, search=search,
+                    batch_size=export_batch_size)
+            except ValueError:
+                flash('There was an error with the export options. The %s '
+                      'list has not been exported.' % model_name, 'error')
+                return redirect(url_for('.list', model_name=model_name))
+            columns = columns or datastore.get_list_columns(model_name) or \
+                datastore.get_export_columns(model_name)
+
+            iter_file, mimetype = _export_formats[format]
+            response = flask.Response(iter_file(columns, rows),
+                                      mimetype=mimetype)
+            response.headers['Content-Disposition'] = \
+                'attachment; filename=%s.%s' % (model_name, format)
+            return response
+        return export
+
+    def create_import_view():
+        @view_decorator
+        def import_view(model_name):
+            """Imports instances of a given model from an uploaded CSV
+            or JSON lines file.
+            """
+            if not model_name in list_model_names():
+                return "%s cannot be accessed through this admin page" % (
+                    model_name,)
+            context = dict(model_names=list_model_names(),
+                           model_name=model_name,
+                           formats=sorted(_import_formats))
+            if request.method == 'GET':
+                return render_template('admin/import.html', **context)
+
+            upload = request.files.get('file')
+            format = request.form.get('format', 'csv')
+            if not upload or format not in _import_formats:
+                flash('Choose a CSV or JSON lines file to import.', 'error')
+                return render_template('admin/import.html', **context)
+
+            rows = _import_formats[format](upload.stream)
+            result = datastore.import_model_rows(
+                model_name, rows, batch_size=import_batch_size,
+                pool=get_import_pool())
+
+            flash('%d %s rows imported, %d rejected.' % (
+                result.accepted, model_name, result.rejected),
+                  result.rejected and 'error' or 'success')
+            return render_template('admin/import.html', result=result,
+                                   **context)
+        return import_view
+
+    def create_api_list_view():
+        @view_decorator
+        @conditional
+        def api_list(model_name):
+            """Lists the rows of a given model as JSON, or adds a model
+            instance from the data that is posted.
+            """
+            if not model_name in list_model_names():
+                return api_error('unknown model: %s' % model_name, 404)
+            if request.method == 'POST':
+                return api_add(model_name)
+
+            try:
+                per_page = int(request.args.get('per_page',
+                                                list_view_pagination))
+            except ValueError:
+                per_page = list_view_pagination
+            per_page = max(1, min(per_page, api_max_per_page))
+            (sort, sort_desc, sort_args, filters, filter_args,
+             search) = _parse_list_args(datastore, model_name, request.args)
+
+            cursor = request.args.get('cursor')
+            try:
+                fields = get_api_fields(model_name)
+                if supports_keyset and not search and \
+                       (cursor is not None or keyset_pagination):
+                    pagination = datastore.create_model_keyset_pagination(
+                        model_name, cursor, per_page, sort=sort,
+                        sort_desc=sort_desc, filters=filters, columns=fields)
+                else:
+                    page = max(1, int(request.args.get('page', '1')))
+                    pagination = datastore.create_model_pagination(
+                        model_name, page, per_page, sort=sort,
+                        sort_desc=sort_desc, filters=filters, search=search,
+                        columns=fields)
+            except ValueError:
+                return api_error('invalid fields, filters, page or cursor',
+                                 400)
+
+            payload = dict(
+                items=[get_api_item(item, fields)
+                       for item in pagination.items],
+                per_page=per_page,
+                has_next=bool(pagination.has_next))
+            if pagination.cursor_based:
+                payload.update(next_cursor=pagination.next_cursor,
+                               prev_cursor=pagination.prev_cursor)
+            else:
+                total = None
+                if pagination.exact:
+                    total = pagination.total
+                payload.update(page=pagination.page, total=total)
+            return api_response(payload)
+
+        def api_add(model_name):
+            model_class = get_model_class(model_name)
+            formdata, names = get_api_form_data()
+            form = get_model_form(model_name)(formdata)
+            datastore.load_form_choices(form)
+            if not form.validate():
+                return api_error('invalid data', 400, errors=form.errors)
+            model_instance = datastore.update_from_form(model_class(), form)
+            datastore.save_model(model_instance)
+            response = api_response(get_api_item(
+                model_instance, datastore.get_export_columns(model_name)),
+                201)
+            response.headers['Location'] = url_for(
+                '.api_detail', model_name=model_name,
+                model_url_key=get_model_url_key(model_instance),
+                _external=True)
+            return response
+        return api_list
+
+    def create_api_detail_view():
+        @view_decorator
+        @conditional
+        def api_detail(model_name, model_url_key):
+            """Returns, updates or deletes a model instance through
+            the JSON API.
+            """
+            model_keys = [key if key != empty_sequence else u''
+                          for key in model_url_key.split('/')]
+            if not model_name in list_model_names():
+                return api_error('unknown model: %s' % model_name, 404)
+
+            if request.method == 'DELETE':
+                if not datastore.delete_model_instance(model_name,
+                                                       model_keys):
+                    return api_error('not found', 404)
+                return flask.Response(status=204)
+
+            try:
+                fields = get_api_fields(model_name)
+            except ValueError:
+                return api_error('invalid fields', 400)
+            model_instance = datastore.find_model_instance(
+                model_name, model_keys)
+            if not model_instance:
+                return api_error('not found', 404)
+
+            if request.method == 'PATCH':
+                formdata, names = get_api_form_data()
+                form = get_model_form(model_name)(
+                    formdata, obj=model_instance)
+                # only the fields that were given are changed
+                for name in list(form._fields):
+                    if name not in names:
+                        del form[name]
+                # the form ignores form data that is empty, but the
+                # fields that were given as false or empty lists must
+                # still be cleared
+                if not formdata:
+                    for field in form:
+                        field.raw_data = []
+                        field.process_formdata([])
+                datastore.load_form_choices(form)
+                if not form.validate():
+                    return api_error('invalid data', 400,
+                                     errors=form.errors)
+                model_instance = datastore.update_from_form(
+                    model_instance, form)
+                datastore.save_model(model_instance)
+            return api_response(get_api_item(model_instance, fields))
+        return api_detail
+
+    def create_lookup_view():
+        @view_decorator
+        def lookup(model_name, field_name):
+            """Returns the options of a remotely looked up relationship
+            field as JSON: the related instances whose label starts
+            with the `q` argument.
+            """
+            if not model_name in list_model_names():
+                flask.abort(404)
+            try:
+                limit = int(request.args.get('limit', lookup_limit))
+            except ValueError:
+                limit = lookup_limit
+            if not 0 < limit < lookup_limit:
+                limit = lookup_limit
+            try:
+                options = datastore.lookup_related(
+                    model_name, field_name, request.args.get('q', u''),
+                    limit)
+            except (KeyError, NotImplementedError):
+                flask.abort(404)
+            return flask.jsonify(options=[
+                {'value': key, 'label': label} for key, label in options])
+        return lookup
+
     admin_blueprint.add_url_rule('/', 'index',
                                  view_func=create_index_view())
     list_view = create_list_view()
@@ -286,13 +1062,94 @@ def create_admin_blueprint_new(
                                  methods=['GET', 'POST'])
     admin_blueprint.add_url_rule('/delete/<model_name>/<path:model_url_key>/',
                                  'delete', view_func=create_delete_view())
+    admin_blueprint.add_url_rule('/delete/<model_name>/',
+                                 'bulk_delete',
+                                 view_func=create_bulk_delete_view(),
+                                 methods=['POST'])
     admin_blueprint.add_url_rule('/add/<model_name>/',
                                  'add', view_func=create_add_view(),
                                  methods=['GET', 'POST'])
+    admin_blueprint.add_url_rule('/import/<model_name>/',
+                                 'import', view_func=create_import_view(),
+                                 methods=['GET', 'POST'])
+    admin_blueprint.add_url_rule('/export/<model_name>/',
+                                 'export', view_func=create_export_view())
+    admin_blueprint.add_url_rule('/lookup/<model_name>/<field_name>/',
+                                 'lookup', view_func=create_lookup_view())
+    admin_blueprint.add_url_rule('/api/<model_name>/',
+                                 'api_list', view_func=create_api_list_view(),
+                                 methods=['GET', 'POST'])
+    admin_blueprint.add_url_rule('/api/<model_name>/<path:model_url_key>/',
+                                 'api_detail',
+                                 view_func=create_api_detail_view(),
+                                 methods=['GET', 'PATCH', 'DELETE'])
 
     return admin_blueprint
 
 
+#: the export file formats, matched to a function that yields the
+#: chunks of a file given the columns and rows, and a mimetype
+_export_formats = {
+    'csv': (util.iter_csv, 'text/csv'),
+    'jsonl': (util.iter_jsonl, 'application/x-ndjson'),
+}
+
+
+#: the import file formats, matched to a function that yields the
+#: (line number, row) tuples of a file
+_import_formats = {
+    'csv': util.iter_csv_rows,
+    'jsonl': util.iter_jsonl_rows,
+}
+
+
+def _parse_list_args(datastore, model_name, args):
+    """Returns a (sort, sort_desc, sort_args, filters, filter_args,
+    search) tuple for how the list of a given model should be sorted,
+    filtered and searched according to the url `args`, where
+    sort_args and filter_args are the url args that were used.
+    """
+    sort = args.get('sort')
+    if sort not in datastore.get_sortable_columns(model_name):
+        sort = None
+    sort_desc = args.get('dir') == 'desc'
+    sort_args = {}
+    if sort:
+        sort_args.update(sort=sort, dir=sort_desc and 'desc' or 'asc')
+
+    filters, filter_args = _parse_filters(
+        args, [name for name, kind in
+               datastore.get_filter_columns(model_name)])
+
+    search = None
+    if datastore.get_search_columns(model_name):
+        search = args.get('q', '').strip() or None
+
+    return sort, sort_desc, sort_args, filters, filter_args, search
+
+
+def _parse_filters(args, filter_names):
+    """Returns a (filters, filter_args) tuple for the list view
+    filters given in the url `args`. Filters are given as
+    ``flt_<column>__<operator>=<value>``. The filters are a list of
+    (column name, operator, value) tuples for the datastore, and
+    filter_args is a dict of the url args they came from. Filters on
+    columns that aren't in `filter_names`, with unknown operators or
+    with empty values are ignored.
+    """
+    filters = []
+    filter_args = {}
+    for key, value in args.items():
+        if not key.startswith('flt_') or not value:
+            continue
+        name, sep, operator = key[4:].rpartition('__')
+        if name in filter_names and operator in FILTER_OPERATORS:
+            filters.append((name, operator, value))
+            filter_args[key] = value
+    filters.sort()
+    return filters, filter_args
+
+
 def _get_admin_extension_dir():
     """Returns the directory path of this admin extension. This is
     necessary for setting the static_folder and templates_folder
@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+"""
+    flask.ext.admin.assets
+    ~~~~~~~~~~~~~~
+
+    Bundles the static CSS and JavaScript files of the admin pages, so
+    that each page only requests one stylesheet and one script, and
+    precompresses the static text files into ``.gz`` (and, if the
+    `brotli` module is installed, ``.br``) files next to them, for the
+    admin blueprint to serve to browsers that accept those encodings.
+    The bundles and compressed files are checked in to the static
+    folder; after changing any of the static files, rebuild them with::
+
+        python -m flask_admin.assets
+
+    :copyright: (c) 2011 by wilsaj.
+    :license: BSD, see LICENSE for more details.
+"""
+from __future__ import absolute_import
+
+import gzip
+import io
+import os
+import posixpath
+import re
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+#: the bundles, matched to the static files they are built from, in
+#: order; paths are relative to the static folder
+BUNDLES = {
+    'css/admin.bundle.css': [
+        'css/bootstrap.min.css',
+        'css/Aristo/Aristo.css',
+        'css/chosen.css',
+        'css/style.css',
+    ],
+    'js/admin.bundle.js': [
+        'js/libs/jquery-1.7.1.min.js',
+        'js/libs/jquery-ui-1.8.17.custom.min.js',
+        'js/libs/jquery-ui-timepicker-addon.js',
+        'js/libs/chosen.jquery.min.js',
+        'js/libs/bootstrap.min.js',
+        'js/plugins.js',
+        'js/admin.js',
+    ],
+}
+
+
+#: the extensions of the static files that are precompressed; images
+#: are left out since their formats are compressed already
+COMPRESSED_EXTENSIONS = ('.css', '.js', '.svg', '.html', '.json', '.txt')
+
+#: files smaller than this aren't worth compressing
+COMPRESS_MIN_SIZE = 1024
+
+#: the precompressed encodings, matched to their file name suffix, in
+#: order of preference
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+
+_css_comment_re = re.compile(r'/\*(?!!).*?\*/', re.DOTALL)
+_css_space_re = re.compile(r'\s*([{};,])\s*')
+_css_url_re = re.compile(r'''url\(\s*(['"]?)([^'")]+)\1\s*\)''')
+
+
+def build_bundle(static_folder, bundle):
+    """Returns the content of a bundle, built from the files in a
+    static folder. Stylesheets are minified and the relative urls in
+    them are rewritten to be relative to the bundle; scripts are
+    joined as they are, since the libraries are already minified.
+    """
+    bundle_dir = posixpath.dirname(bundle)
+    parts = []
+    for filename in BUNDLES[bundle]:
+        f = io.open(os.path.join(static_folder, *filename.split('/')),
+                    encoding='utf-8')
+        try:
+            content = f.read()
+        finally:
+            f.close()
+        if bundle.endswith('.css'):
+            content = minify_css(rebase_css_urls(
+                content, posixpath.dirname(filename), bundle_dir))
+        else:
+            # a file that doesn't end its last statement mustn't run
+            # into the next one
+            content = content.strip() + u'\n;'
+        parts.append(u'/* %s */\n%s\n' % (filename, content))
+    return u''.join(parts)
+
+
+def build_bundles(static_folder=None):
+    """Builds every bundle in a static folder (by default the admin's
+    own) and returns their paths.
+    """
+    if static_folder is None:
+        static_folder = os.path.join(os.path.dirname(__file__), 'static')
+    paths = []
+    for bundle in sorted(BUNDLES):
+        path = os.path.join(static_folder, *bundle.split('/'))
+        f = io.open(path, 'w', encoding='utf-8', newline='\n')
+        try:
+            f.write(build_bundle(static_folder, bundle))
+        finally:
+            f.close()
+        paths.append(path)
+    return paths
+
+
+def compress_static(static_folder=None):
+    """Writes compressed copies of the static text files in a static
+    folder (by default the admin's own) next to them, and returns the
+    paths of the compressed files. ``.br`` files are only written if
+    the `brotli` module is installed.
+    """
+    if static_folder is None:
+        static_folder = os.path.join(os.path.dirname(__file__), 'static')
+    paths = []
+    for dirpath, dirnames, filenames in os.walk(static_folder):
+        for name in sorted(filenames):
+            path = os.path.join(dirpath, name)
+            if not name.endswith(COMPRESSED_EXTENSIONS) or \
+                   os.path.getsize(path) < COMPRESS_MIN_SIZE:
+                continue
+            f = open(path, 'rb')
+            try:
+                content = f.read()
+            finally:
+                f.close()
+            compressed = [(path + '.gz', gzip_compress(content))]
+            if brotli is not None:
+                compressed.append((path + '.br', brotli.compress(content)))
+            for compressed_path, data in compressed:
+                f = open(compressed_path, 'wb')
+                try:
+                    f.write(data)
+                finally:
+                    f.close()
+                paths.append(compressed_path)
+    return paths
+
+
+def gzip_compress(content):
+    """Returns gzipped content. The gzip header has no file name or
+    time, so the output only changes when the content does.
+    """
+    buffer = io.BytesIO()
+    f = gzip.GzipFile(filename='', mode='wb', compresslevel=9,
+                      fileobj=buffer, mtime=0)
+    try:
+        f.write(content)
+    finally:
+        f.close()
+    return buffer.getvalue()
+
+
+def find_compressed(path, accept_encoding, check_mtime=False):
+    """Returns an (encoding, path) tuple for the best precompressed
+    copy of the file at `path` that a client accepts, where
+    `accept_encoding` is a function returning the quality a client
+    gives an encoding (e.g. ``request.accept_encodings.__getitem__``).
+    If `check_mtime` is True, copies that are older than the file are
+    ignored, which is handy while developing. Returns (None, path) if
+    there is no such copy.
+    """
+    for encoding, suffix in ENCODINGS:
+        if not accept_encoding(encoding):
+            continue
+        try:
+            if not check_mtime or os.path.getmtime(path + suffix) >= \
+                   os.path.getmtime(path):
+                if os.path.isfile(path + suffix):
+                    return encoding, path + suffix
+        except (IOError, OSError):
+            pass
+    return None, path
+
+
+def has_compressed(path):
+    """Returns True if the file at `path` has any precompressed
+    copies, i.e. if its response varies by Accept-Encoding.
+    """
+    return any([os.path.isfile(path + suffix) for _, suffix in ENCODINGS])
+
+
+def rebase_css_urls(css, css_dir, bundle_dir):
+    """Rewrites the relative urls in a stylesheet from the directory
+    `css_dir` so that they work from `bundle_dir` instead.
+    """
+    def rebase(match):
+        url = match.group(2).strip()
+        if url.startswith(('/', 'data:')) or ':' in url.split('/')[0]:
+            return match.group(0)
+        path = posixpath.normpath(posixpath.join(css_dir, url))
+        return u'url(%s)' % posixpath.relpath(path, bundle_dir or '.')
+    return _css_url_re.sub(rebase, css)
+
+
+def minify_css(css):
+    """Strips comments (except ``/*! ... */`` license comments) and
+    unneeded whitespace from a stylesheet.
+    """
+    css = _css_comment_re.sub(u'', css)
+    css = u' '.join(css.split())
+    return _css_space_re.sub(r'\1', css).strip()
+
+
+if __name__ == '__main__':
+    for path in build_bundles() + compress_static():
+        print('built %s' % path)
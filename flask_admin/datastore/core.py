@@ -1,11 +1,64 @@
+from contextlib import contextmanager
+
+
 class AdminDatastore(object):
     """A base class for admin datastore objects. All datastores used
     in Flask-Admin should subclass this object and define the
     following methods.
     """
+    #: True if the datastore implements
+    #: :meth:`create_model_keyset_pagination` and
+    #: :meth:`get_page_cursor`; otherwise the admin views always page
+    #: by offset
+    supports_keyset_pagination = False
+
+    def create_model_pagination(self, model_name, page, per_page=25,
+                                sort=None, sort_desc=False, filters=None,
+                                search=None, columns=None, stream=False):
+        """Returns a pagination object for the list view. If `sort` is
+        given, the items should be ordered by that column (one of
+        :meth:`get_sortable_columns`), descending if `sort_desc` is
+        True, with a unique key as a tiebreaker.
+
+        `filters` is a list of (column name, operator, value) tuples
+        that the items should be filtered by, where the value is a
+        string from the url and the operator is one of 'eq', 'in'
+        (comma separated values), 'gte', 'lt' or 'null' (a true value
+        means IS NULL, a false one IS NOT NULL). The same filters
+        should apply to counting the items. A ValueError should be
+        raised for invalid filters.
+
+        If `search` is given, only the items matching that text in the
+        :meth:`get_search_columns` should be listed, with the best
+        matches first unless `sort` is given.
+
+        If `columns` is given (a list of :meth:`get_export_columns`),
+        the items should be :class:`~flask.ext.admin.util.ListRow`
+        objects with the full values of those columns instead of the
+        list columns, for the JSON API. A ValueError should be raised
+        for columns that can't be exported.
 
-    def create_model_pagination(self, model_name, page, per_page=25):
-        """Returns a pagination object for the list view."""
+        If `stream` is True, the items may be a
+        :class:`~flask.ext.admin.util.StreamedItems` that reads the rows
+        from the database while the list view is being streamed,
+        instead of a list. The rest of the pagination object still has
+        to be known up front. Datastores that can't stream rows can
+        ignore this.
+        """
+        raise NotImplementedError()
+
+    def create_model_keyset_pagination(self, model_name, cursor=None,
+                                       per_page=25, sort=None,
+                                       sort_desc=False, filters=None,
+                                       columns=None):
+        """Returns a keyset pagination object for the list view, with
+        the page located by an opaque `cursor` token instead of a page
+        number. A cursor of None means the first page. Raises a
+        ValueError if the cursor is invalid. `columns` works as it
+        does for :meth:`create_model_pagination`. Datastores that
+        can't page this way don't need to implement this, and leave
+        :attr:`supports_keyset_pagination` False.
+        """
         raise NotImplementedError()
 
     def delete_model_instance(self, model_name, model_keys):
@@ -14,10 +67,72 @@ class AdminDatastore(object):
         """
         raise NotImplementedError()
 
-    def find_model_instance(self, model_name, model_keys):
+    def delete_model_instances(self, model_name, model_keys_list,
+                               batch_size=500):
+        """Deletes the model instances with the given keys (a list of
+        model keys), `batch_size` at a time. Returns a list of the
+        number of instances each batch deleted. Raises a ValueError if
+        any of the keys are invalid, and a
+        :class:`~flask.ext.admin.util.BulkDeleteError` if a batch can't
+        be deleted.
+
+        By default, this deletes each instance with
+        :meth:`delete_model_instance`; datastores should override it
+        to delete each batch with a single statement.
+        """
+        counts = []
+        for start in range(0, len(model_keys_list), batch_size):
+            counts.append(len([
+                model_keys for model_keys
+                in model_keys_list[start:start + batch_size]
+                if self.delete_model_instance(model_name, model_keys)]))
+        return counts
+
+    def import_model_rows(self, model_name, rows, batch_size=1000,
+                          pool=None):
+        """Validates and saves model instances from an import file.
+        `rows` is an iterator of (line number, row) tuples, where each
+        row is a dict of column names matched to string values (see
+        :func:`~flask.ext.admin.util.iter_csv_rows`), or None for a
+        line that couldn't be parsed. Rows should be validated with
+        :func:`~flask.ext.admin.util.validate_rows`, passing along the
+        process `pool` if one is given, and saved in batches of
+        `batch_size` rather than one at a time. Returns a
+        :class:`~flask.ext.admin.util.ImportResult`.
+        """
+        raise NotImplementedError()
+
+    def get_model_version(self, model_name):
+        """Returns a string that changes whenever the data shown by the
+        list and edit views of a given model may have changed, for
+        answering conditional GET requests without touching the
+        database; or None (the default) if the datastore can't tell.
+        """
+        return None
+
+    def load_form_choices(self, form):
+        """Called with each add and edit form before it is rendered or
+        validated, so that the datastore can load the choices of its
+        fields ahead of time. By default this does nothing.
+        """
+        pass
+
+    def lookup_related(self, model_name, field_name, prefix, limit=20):
+        """Returns up to `limit` (key, label) tuples for the options of
+        a relationship field that is looked up remotely: the instances
+        of the related model whose label starts with `prefix`, ordered
+        by label. Raises a KeyError if the field isn't looked up
+        remotely.
+        """
+        raise NotImplementedError()
+
+    def find_model_instance(self, model_name, model_keys, load=None):
         """Returns a model instance, if one exists, that matches
         model_name and model_keys. Returns None if no such model
-        instance exists.
+        instance exists. `load` may be a list of attribute names that
+        are about to be read, like the fields of the edit form, so
+        that any related data they need can be loaded along with the
+        instance instead of one attribute at a time.
         """
         raise NotImplementedError()
 
@@ -29,12 +144,81 @@ class AdminDatastore(object):
         """Returns a form, given a model name."""
         raise NotImplementedError()
 
+    def get_filter_columns(self, model_name):
+        """Returns a list of (column name, kind) tuples for the
+        columns the list view of a given model may be filtered by,
+        where kind is one of 'text', 'number', 'date', 'datetime',
+        'time' or 'boolean' and decides the filter input shown. By
+        default, no columns can be filtered.
+        """
+        return []
+
+    def get_search_columns(self, model_name):
+        """Returns the names of the columns the list view of a given
+        model can be searched on. A search box is only shown for
+        models that have search columns; by default there are none.
+        """
+        return []
+
+    def has_search_index(self, model_name):
+        """Returns True if the index that searching a given model
+        needs exists. If it doesn't, the list view isn't searched. By
+        default, no index is needed.
+        """
+        return True
+
+    def get_export_columns(self, model_name):
+        """Returns the names of the columns of a given model that can
+        be exported. By default, there are none.
+        """
+        return []
+
+    def iter_model_rows(self, model_name, columns=None, sort=None,
+                        sort_desc=False, filters=None, search=None,
+                        batch_size=1000):
+        """Returns an iterator over the rows of a given model for
+        exporting, as sequences of the values of `columns` (by default
+        the list columns if there are any, otherwise all of the
+        :meth:`get_export_columns`). `sort`, `filters` and `search`
+        work as they do for :meth:`create_model_pagination`. Rows
+        should be fetched from the database `batch_size` at a time so
+        that memory use doesn't grow with the number of rows. A
+        ValueError should be raised right away, rather than while
+        iterating, for invalid columns or filters.
+        """
+        raise NotImplementedError()
+
+    def get_list_columns(self, model_name):
+        """Returns a list of the column names shown in the list view
+        for a given model. If this returns None (the default), model
+        instances are listed by their ``__repr__`` instead. When list
+        columns are used, the items of the list view pagination should
+        be :class:`~flask.ext.admin.util.ListRow` objects.
+        """
+        return None
+
     def get_model_keys(self, model_instance):
         """Returns the keys for a given a model instance. This should
         be an iterable (e.g. list or tuple) containing the keys.
         """
         raise NotImplementedError()
 
+    def get_page_cursor(self, model_name, page, per_page=25, sort=None,
+                        sort_desc=False, filters=None):
+        """Returns a keyset pagination cursor for the rows of a given
+        offset page, or None if there isn't one. This is used to move
+        deep offset pages over to keyset pagination.
+        """
+        raise NotImplementedError()
+
+    def get_sortable_columns(self, model_name):
+        """Returns a list of the column names that the list view of a
+        given model may be sorted by. Datastores should only include
+        columns that can be sorted efficiently, e.g. indexed columns.
+        By default, no columns are sortable.
+        """
+        return []
+
     def list_model_names(self):
         """Returns a list of model names available in the datastore."""
         raise NotImplementedError()
@@ -50,3 +234,12 @@ class AdminDatastore(object):
         with the values from a given form.
         """
         raise NotImplementedError()
+
+    @contextmanager
+    def warn_lazy_loads(self, model_name):
+        """Context manager that the list view renders within when the
+        app is in debug mode. Datastores can use it to warn about
+        queries that are executed while rendering, e.g. lazy loads of
+        relationships. By default it does nothing.
+        """
+        yield
@@ -9,10 +9,19 @@
 """
 from __future__ import absolute_import
 
+import threading
 import types
 
 import mongoalchemy as ma
+import pymongo
+try:
+    from bson.errors import InvalidId
+    from bson.objectid import ObjectId
+except ImportError:
+    from pymongo.errors import InvalidId
+    from pymongo.objectid import ObjectId
 from mongoalchemy.document import Document
+from mongoalchemy.query_expression import QueryExpression
 from wtforms import fields as f
 from wtforms import form, validators, widgets
 from wtforms.form import Form
@@ -48,13 +57,46 @@ class MongoAlchemyDatastore(AdminDatastore):
     that should be used as forms for creating and editing instances of
     these models.
 
+    Generated forms are built the first time they are needed, and can
+    be cached in `form_cache_dir` so new processes don't have to
+    generate them again. Cached forms are keyed by a fingerprint of
+    the document's fields, so they are regenerated when those change.
+
+    Documents are listed by their ``__repr__`` in the list view by
+    default. To show a table of fields instead, set `list_columns` to
+    a dict with model names as keys matched to a list of field names.
+    Only those fields will be fetched from the database, and text
+    values are truncated to `list_text_length` characters.
+
+    The list view can be sorted by mongo_id and by any field that
+    leads an index defined on the document class. To choose the
+    sortable fields yourself, set `sortable_columns` to a dict with
+    model names as keys matched to a list of field names.
+
+    The list view can also be filtered by field values: equality, $in
+    lists, half-open ranges ($gte and $lt) and null values. Only
+    indexed fields can be filtered by default; set `list_filters` to a
+    dict with model names as keys matched to a list of field names to
+    choose the filterable fields yourself.
+
     .. _MongoAlchemy documentation: http://www.mongoalchemy.org/api/session.html
     .. _WTForms documentation: http://wtforms.simplecodes.com/
     """
-    def __init__(self, models, db_session, model_forms=None):
+    supports_keyset_pagination = True
+
+    def __init__(self, models, db_session, model_forms=None,
+                 list_columns=None, list_text_length=80,
+                 sortable_columns=None, list_filters=None,
+                 form_cache_dir=None):
         self.model_classes = {}
         self.model_forms = model_forms
         self.db_session = db_session
+        self.list_columns = list_columns or {}
+        self.list_text_length = list_text_length
+        self.sortable_columns = sortable_columns or {}
+        self.list_filters = list_filters or {}
+        self.form_cache = form_cache_dir and admin_wtf.FormCache(
+            form_cache_dir)
 
         if not self.model_forms:
             self.model_forms = {}
@@ -69,20 +111,85 @@ class MongoAlchemyDatastore(AdminDatastore):
                  for model in models
                  if issubclass(model, Document)])
 
-        if self.model_classes:
-            self.form_dict = dict(
-                [(k, _form_for_model(v, db_session,))
-                 for k, v in self.model_classes.items()])
-            for model_name, form in self.model_forms.items():
-                if model_name in self.form_dict:
-                    self.form_dict[model_name] = form
-
-    def create_model_pagination(self, model_name, page, per_page=25):
-        """Returns a pagination object for the list view."""
-        model_class = self.get_model_class(model_name)
-        query = self.db_session.query(model_class).skip(
-            (page - 1) * per_page).limit(per_page)
-        return MongoAlchemyPagination(page, per_page, query)
+        # forms are generated the first time they are needed
+        self.form_dict = {}
+        self._form_lock = threading.Lock()
+
+    def create_model_pagination(self, model_name, page, per_page=25,
+                                sort=None, sort_desc=False, filters=None,
+                                search=None, columns=None, stream=False):
+        """Returns a pagination object for the list view. The
+        documents are ordered by the `sort` field, if given, and then
+        by mongo_id. `filters` is a list of (field name, operator,
+        value) tuples. Searching isn't supported. If `columns` is
+        given, only those fields are fetched. Documents are not
+        streamed, so `stream` is ignored.
+        """
+        if search:
+            raise NotImplementedError('MongoAlchemy models cannot be '
+                                      'searched')
+        query, make_item = self._list_query(model_name, columns=columns)
+        query = self._filter_query(model_name, query, filters)
+        query = self._order_query(model_name, query, sort, sort_desc)
+        query = query.skip((page - 1) * per_page).limit(per_page)
+        return MongoAlchemyPagination(page, per_page, query, make_item)
+
+    def create_model_keyset_pagination(self, model_name, cursor=None,
+                                       per_page=25, sort=None,
+                                       sort_desc=False, filters=None,
+                                       columns=None):
+        """Returns a keyset pagination object for the list view. Pages
+        are located by seeking on the `sort` field, if given, and the
+        mongo_id, which is always indexed. If `columns` is given, only
+        those fields are fetched.
+        """
+        sort_field = self._get_sort_field(model_name, sort)
+        query, make_item = self._list_query(model_name, sort, columns)
+        query = self._filter_query(model_name, query, filters)
+
+        direction = 'next'
+        if cursor:
+            direction, values = util.decode_cursor(cursor)
+            if len(values) != (sort_field and 2 or 1):
+                raise ValueError('invalid pagination cursor: %r' % cursor)
+            try:
+                mongo_id = ObjectId(values[-1])
+                if sort_field and values[0] is not None:
+                    sort_value = sort_field.wrap(
+                        _coerce_value(sort_field, values[0]))
+                else:
+                    sort_value = None
+            except Exception:
+                raise ValueError('invalid pagination cursor: %r' % cursor)
+
+        # when paging backwards, seek and sort in the opposite order
+        # and then reverse the documents
+        reverse = (direction == 'prev') != bool(sort_desc)
+        if cursor:
+            criterion = _seek_criterion(sort_field, sort_value, mongo_id,
+                                        reverse)
+            query = query.filter(QueryExpression(criterion))
+        query = self._order_query(model_name, query, sort, reverse)
+
+        # fetch one extra document to find out if there's another page
+        items = query.limit(per_page + 1).all()
+        has_more = len(items) > per_page
+        items = items[:per_page]
+        if direction == 'prev':
+            items.reverse()
+
+        next_cursor = prev_cursor = None
+        if items:
+            if has_more or direction == 'prev':
+                next_cursor = util.encode_cursor(
+                    self._get_cursor_values(items[-1], sort_field), 'next')
+            if cursor and (has_more or direction == 'next'):
+                prev_cursor = util.encode_cursor(
+                    self._get_cursor_values(items[0], sort_field), 'prev')
+
+        return util.KeysetPagination(per_page,
+                                     [make_item(item) for item in items],
+                                     next_cursor, prev_cursor)
 
     def delete_model_instance(self, model_name, model_keys):
         """Deletes a model instance. Returns True if model instance
@@ -96,10 +203,73 @@ class MongoAlchemyDatastore(AdminDatastore):
         except ma.query.BadResultException:
             return False
 
-    def find_model_instance(self, model_name, model_keys):
+    def delete_model_instances(self, model_name, model_keys_list,
+                               batch_size=500):
+        """Deletes the documents with the given keys, `batch_size` at
+        a time, with one ``$in`` remove per batch. Returns a list of
+        the number of documents each batch removed (None for batches
+        whose result wasn't acknowledged).
+        """
+        model_class = self.get_model_class(model_name)
+        collection = self.db_session.db[model_class.get_collection_name()]
+        try:
+            ids = [ObjectId(model_keys[0]) for model_keys in model_keys_list]
+        except (InvalidId, TypeError):
+            raise ValueError('invalid %s keys' % model_name)
+
+        counts = []
+        for start in range(0, len(ids), batch_size):
+            result = collection.remove(
+                {'_id': {'$in': ids[start:start + batch_size]}})
+            if isinstance(result, dict):
+                counts.append(result.get('n'))
+            else:
+                counts.append(None)
+        return counts
+
+    def import_model_rows(self, model_name, rows, batch_size=1000,
+                          pool=None):
+        """Validates and inserts documents of a given model from an
+        import file, given as (line number, row) tuples where each row
+        is a dict of field names matched to string values. Returns a
+        :class:`~flask.ext.admin.util.ImportResult`.
+
+        Rows are validated against the model's generated form, by the
+        worker processes of `pool` if one is given, and inserted
+        `batch_size` at a time with unordered bulk inserts, so one bad
+        document doesn't stop the rest of its batch.
+        """
+        model_class = self.get_model_class(model_name)
+        collection = self.db_session.db[model_class.get_collection_name()]
+        result = util.ImportResult()
+        batch = []
+        for line_number, data, errors in util.validate_rows(
+                _import_form_for_model, model_class, rows, pool):
+            if errors:
+                result.reject(line_number, errors)
+                continue
+            try:
+                document = model_class(**dict(
+                    [(str(name), value) for name, value in data.items()
+                     if value is not None and name != 'mongo_id']))
+                batch.append((line_number, document.wrap()))
+            except (ma.exceptions.BadValueException,
+                    ma.exceptions.MissingValueException,
+                    ma.exceptions.ExtraValueException) as e:
+                result.reject(line_number, {u'': [unicode(e)]})
+                continue
+            if len(batch) >= batch_size:
+                _insert_import_batch(collection, batch, result)
+                batch = []
+        if batch:
+            _insert_import_batch(collection, batch, result)
+        return result
+
+    def find_model_instance(self, model_name, model_keys, load=None):
         """Returns a model instance, if one exists, that matches
         model_name and model_keys. Returns None if no such model
-        instance exists.
+        instance exists. `load` is ignored, since documents are
+        always loaded whole.
         """
         model_key = model_keys[0]
         model_class = self.get_model_class(model_name)
@@ -111,13 +281,177 @@ class MongoAlchemyDatastore(AdminDatastore):
         return self.model_classes.get(model_name, None)
 
     def get_model_form(self, model_name):
-        """Returns a form, given a model name."""
-        return self.form_dict.get(model_name, None)
+        """Returns a form, given a model name, or None if there is no
+        such model. Forms are generated (or taken from `model_forms`)
+        the first time they are asked for and then cached.
+        """
+        try:
+            return self.form_dict[model_name]
+        except KeyError:
+            pass
+
+        model_class = self.get_model_class(model_name)
+        if model_class is None:
+            return None
+        self._form_lock.acquire()
+        try:
+            if model_name not in self.form_dict:
+                form = self.model_forms.get(model_name)
+                if form is None:
+                    form = self._generate_form(model_name)
+                self.form_dict[model_name] = form
+            return self.form_dict[model_name]
+        finally:
+            self._form_lock.release()
+
+    def _generate_form(self, model_name):
+        """Returns a generated form for a given model, rebuilt from the
+        form cache if there is one and it has the form for the
+        document's current fields.
+        """
+        model_class = self.get_model_class(model_name)
+        if not self.form_cache:
+            return _form_for_model(model_class, self.db_session)
+
+        fingerprint = admin_wtf.schema_fingerprint(
+            _describe_schema(model_class))
+        description = self.form_cache.get(model_name, fingerprint)
+        if description is not None:
+            try:
+                return admin_wtf.load_form(description,
+                                           _resolve_form_callable)
+            except (ImportError, AttributeError, KeyError, TypeError,
+                    ValueError):
+                pass
+
+        form = _form_for_model(model_class, self.db_session)
+        try:
+            description = admin_wtf.dump_form(form)
+        except TypeError:
+            # forms with arguments that can't be described (like the
+            # nested forms of tuple fields) aren't cached
+            return form
+        self.form_cache.set(model_name, fingerprint, description)
+        return form
+
+    def get_filter_columns(self, model_name):
+        """Returns a list of (field name, kind) tuples for the fields
+        the list view of a given model can be filtered by. The kind is
+        one of 'text', 'number', 'datetime' or 'boolean'.
+        """
+        if model_name in self.list_filters:
+            names = self.list_filters[model_name]
+        else:
+            names = self.get_sortable_columns(model_name)
+        fields = self.get_model_class(model_name).get_fields()
+        return [(name, _filter_kind(fields[name])) for name in names]
+
+    def get_export_columns(self, model_name):
+        """Returns the names of the fields of a given model that can
+        be exported: mongo_id followed by the other fields.
+        """
+        names = sorted(self.get_model_class(model_name).get_fields())
+        return ['mongo_id'] + [name for name in names if name != 'mongo_id']
+
+    def iter_model_rows(self, model_name, columns=None, sort=None,
+                        sort_desc=False, filters=None, search=None,
+                        batch_size=1000):
+        """Returns an iterator over the values of `columns` for the
+        documents of a given model, for exporting. Only those fields
+        are fetched, and the cursor fetches `batch_size` documents
+        at a time. Searching isn't supported.
+        """
+        if search:
+            raise NotImplementedError('MongoAlchemy models cannot be '
+                                      'searched')
+        model_class = self.get_model_class(model_name)
+        columns = self._get_export_column_names(model_name, columns)
+
+        query = self.db_session.query(model_class)
+        query = self._filter_query(model_name, query, filters)
+        query = self._order_query(model_name, query, sort, sort_desc)
+        fields = [getattr(model_class, name) for name in columns
+                  if name != 'mongo_id']
+        if fields:
+            query = query.fields(*fields)
+
+        def iter_rows():
+            documents = iter(query)
+            cursor = getattr(documents, 'cursor', None)
+            if cursor is not None:
+                cursor.batch_size(batch_size)
+            for document in documents:
+                yield tuple([getattr(document, name, None)
+                             for name in columns])
+        return iter_rows()
+
+    def _get_export_column_names(self, model_name, columns=None):
+        """Returns the names of the fields to export for a given
+        model: `columns` if given, otherwise the list columns or all
+        export columns. Raises a ValueError for fields that can't be
+        exported.
+        """
+        export_columns = self.get_export_columns(model_name)
+        if not columns:
+            columns = self.get_list_columns(model_name) or export_columns
+        for name in columns:
+            if name not in export_columns:
+                raise ValueError('%s.%s cannot be exported' % (
+                    model_name, name))
+        return list(columns)
+
+    def get_list_columns(self, model_name):
+        """Returns the list of field names shown in the list view for
+        a given model, or None if documents are listed by their
+        ``__repr__``.
+        """
+        return self.list_columns.get(model_name)
 
     def get_model_keys(self, model_instance):
         """Returns the keys for a given a model instance."""
         return [model_instance.mongo_id]
 
+    def get_page_cursor(self, model_name, page, per_page=25, sort=None,
+                        sort_desc=False, filters=None):
+        """Returns a keyset pagination cursor that points to the same
+        documents as a given offset page, or None if the page is the
+        first page or past the end of the list.
+        """
+        if page <= 1:
+            return None
+        model_class = self.get_model_class(model_name)
+        sort_field = self._get_sort_field(model_name, sort)
+        query = self._filter_query(
+            model_name, self.db_session.query(model_class), filters)
+        documents = self._order_query(model_name, query, sort, sort_desc).\
+            skip((page - 1) * per_page - 1).limit(1).all()
+        if not documents:
+            return None
+        return util.encode_cursor(
+            self._get_cursor_values(documents[0], sort_field), 'next')
+
+    def get_sortable_columns(self, model_name):
+        """Returns the names of the fields the list view of a given
+        model can be sorted by: the configured sortable columns if
+        there are any, otherwise mongo_id and every field that leads
+        an index of the document class.
+        """
+        if model_name in self.sortable_columns:
+            return list(self.sortable_columns[model_name])
+
+        model_class = self.get_model_class(model_name)
+        names_by_db_field = dict(
+            [(field.db_field, name)
+             for name, field in model_class.get_fields().items()])
+        names = ['mongo_id']
+        for index in model_class.get_indexes():
+            if not index.components:
+                continue
+            name = names_by_db_field.get(index.components[0][0])
+            if name and name not in names:
+                names.append(name)
+        return names
+
     def list_model_names(self):
         """Returns a list of model names available in the datastore."""
         return self.model_classes.keys()
@@ -147,14 +481,281 @@ class MongoAlchemyDatastore(AdminDatastore):
                 setattr(model_instance, field.name, field.data)
         return model_instance
 
+    def _filter_query(self, model_name, query, filters=None):
+        """Returns a query with `filters` applied. Raises a ValueError
+        if a filter is on a field that can't be filtered, uses an
+        unknown operator or has a value that can't be coerced to the
+        type of its field.
+        """
+        if not filters:
+            return query
+
+        fields = self.get_model_class(model_name).get_fields()
+        filter_names = [name for name, kind in
+                        self.get_filter_columns(model_name)]
+        # conditions are grouped by field, since several filters on
+        # the same field (e.g. both ends of a range) have to be merged
+        # into a single document
+        criteria = {}
+        for name, operator, value in filters:
+            if name not in filter_names:
+                raise ValueError('%s cannot be filtered by %r' % (
+                    model_name, name))
+            ma_field = fields[name]
+
+            def wrap(value):
+                try:
+                    return ma_field.wrap(_coerce_value(ma_field, value))
+                except (TypeError, ma.exceptions.BadValueException):
+                    raise ValueError('invalid value for %s: %r' % (
+                        name, value))
+
+            if operator == 'eq':
+                condition = {'$in': [wrap(value)]}
+            elif operator == 'in':
+                condition = {'$in': [wrap(item)
+                                     for item in value.split(',')]}
+            elif operator == 'gte':
+                condition = {'$gte': wrap(value)}
+            elif operator == 'lt':
+                condition = {'$lt': wrap(value)}
+            elif operator == 'null':
+                if _coerce_value(ma.fields.BoolField(), value):
+                    condition = {'$in': [None]}
+                else:
+                    condition = {'$ne': None}
+            else:
+                raise ValueError('unknown filter operator: %r' % operator)
+            criteria.setdefault(ma_field.db_field, {}).update(condition)
+        return query.filter(QueryExpression(criteria))
+
+    def _get_cursor_values(self, document, sort_field=None):
+        """Returns the keyset pagination cursor values for a document.
+        """
+        if sort_field:
+            # documents without the field have no attribute for it
+            return [getattr(document, sort_field._name, None),
+                    document.mongo_id]
+        return [document.mongo_id]
+
+    def _get_sort_field(self, model_name, sort=None):
+        """Returns the document field for a `sort` field name, or None
+        if the documents are sorted by mongo_id alone. Raises a
+        ValueError if the model can't be sorted by that field.
+        """
+        if not sort or sort == 'mongo_id':
+            return None
+        if sort not in self.get_sortable_columns(model_name):
+            raise ValueError('%s cannot be sorted by %r' % (model_name, sort))
+        return self.get_model_class(model_name).get_fields()[sort]
+
+    def _order_query(self, model_name, query, sort=None, descending=False):
+        """Orders a query by the `sort` field, if given, and then by
+        mongo_id.
+        """
+        model_class = self.get_model_class(model_name)
+        fields = [model_class.mongo_id]
+        if self._get_sort_field(model_name, sort):
+            fields.insert(0, getattr(model_class, sort))
+        for field in fields:
+            if descending:
+                query = query.descending(field)
+            else:
+                query = query.ascending(field)
+        return query
+
+    def _list_query(self, model_name, extra_field=None, columns=None):
+        """Returns a (query, make_item) tuple for listing a given
+        model. If list columns have been configured for the model,
+        only those fields (plus `extra_field`, if given) are fetched
+        and `make_item` turns each document into a
+        :class:`~flask.ext.admin.util.ListRow`. If `columns` is given,
+        they are fetched in full instead of the list columns.
+        """
+        model_class = self.get_model_class(model_name)
+        query = self.db_session.query(model_class)
+        if columns:
+            names = self._get_export_column_names(model_name, columns)
+        else:
+            names = self.get_list_columns(model_name)
+        if not names:
+            return query, lambda document: document
+
+        length = not columns and self.list_text_length
+
+        def make_item(document):
+            values = [getattr(document, name, None) for name in names]
+            if length:
+                values = [util.truncate(value, length) for value in values]
+            return util.ListRow([document.mongo_id], values)
+
+        # mongo_id is always fetched
+        fields = [name for name in names if name != 'mongo_id']
+        if extra_field and extra_field not in fields:
+            fields.append(extra_field)
+        if fields:
+            query = query.fields(*[getattr(model_class, name)
+                                   for name in fields])
+        return query, make_item
+
 
 class MongoAlchemyPagination(util.Pagination):
-    def __init__(self, page, per_page, query, *args, **kwargs):
+    def __init__(self, page, per_page, query, make_item=None,
+                 *args, **kwargs):
+        items = query.all()
+        if make_item:
+            items = [make_item(item) for item in items]
         super(MongoAlchemyPagination, self).__init__(
-            page, per_page, total=query.count(), items=query.all(),
+            page, per_page, total=query.count(), items=items,
             *args, **kwargs)
 
 
+def _insert_import_batch(collection, batch, result):
+    """Inserts a batch of (line number, raw document) tuples into a
+    collection with an unordered insert and adds them to the import
+    `result`.
+    """
+    documents = [document for line_number, document in batch]
+    try:
+        if hasattr(collection, 'insert_many'):
+            collection.insert_many(documents, ordered=False)
+        else:
+            collection.insert(documents, continue_on_error=True)
+        result.accepted += len(batch)
+        return
+    except pymongo.errors.OperationFailure as e:
+        error = e
+
+    write_errors = (getattr(error, 'details', None) or {}).get('writeErrors')
+    if write_errors is not None:
+        failed = dict([(write_error['index'], write_error.get('errmsg'))
+                       for write_error in write_errors])
+    else:
+        # older servers only report the last error of an unordered
+        # insert, so look up which documents made it in
+        inserted = set([document['_id'] for document in collection.find(
+            {'_id': {'$in': [document.get('_id') for document in documents]}},
+            ['_id'])])
+        failed = dict([(i, unicode(error))
+                       for i, document in enumerate(documents)
+                       if document.get('_id') not in inserted])
+    for i, (line_number, document) in enumerate(batch):
+        if i in failed:
+            result.reject(line_number, {u'': [failed[i]]})
+        else:
+            result.accepted += 1
+
+
+_import_forms = {}
+
+
+def _import_form_for_model(document_class):
+    """Returns the form that rows of a given document class are
+    validated against when importing, cached per class so each
+    process only generates it once.
+    """
+    form = _import_forms.get(document_class)
+    if form is None:
+        form = _import_forms[document_class] = model_form(document_class)
+    return form
+
+
+def _seek_criterion(sort_field, sort_value, mongo_id, reverse=False):
+    """Returns a query document matching the documents that come
+    after the one with `sort_value` and `mongo_id` when sorted by
+    `sort_field` (if given) and then by mongo_id, or before it if
+    `reverse` is True. Mongo sorts null and missing values before
+    everything else, so they are matched with ``$in: [None]`` (which
+    also matches documents without the field) and the rest with
+    ``$ne: None``, since ``$gt``/``$lt`` never match across types.
+    """
+    operator = reverse and '$lt' or '$gt'
+    if not sort_field:
+        return {'_id': {operator: mongo_id}}
+
+    name = sort_field.db_field
+    if sort_value is None:
+        tie = {name: {'$in': [None]}, '_id': {operator: mongo_id}}
+        if reverse:
+            return tie
+        return {'$or': [{name: {'$ne': None}}, tie]}
+
+    criteria = [{name: {operator: sort_value}},
+                {name: sort_value, '_id': {operator: mongo_id}}]
+    if reverse:
+        criteria.append({name: {'$in': [None]}})
+    return {'$or': criteria}
+
+
+def _coerce_value(ma_field, value):
+    """Coerce a raw value that came from a url parameter or a
+    pagination cursor to the python type of a given document field.
+    """
+    if value is None:
+        return None
+    if isinstance(ma_field, ma.fields.DateTimeField):
+        return util.parse_datetime(value)
+    if isinstance(ma_field, ma.fields.BoolField):
+        if isinstance(value, basestring):
+            return value.lower() in ('1', 'true', 'yes', 'on')
+        return bool(value)
+    if isinstance(ma_field, ma.fields.IntField):
+        return int(value)
+    if isinstance(ma_field, ma.fields.FloatField):
+        return float(value)
+    if isinstance(ma_field, ma.fields.ObjectIdField):
+        return ObjectId(value)
+    if isinstance(ma_field, ma.fields.StringField):
+        return unicode(value)
+    return value
+
+
+def _filter_kind(ma_field):
+    """Returns the kind of filter input a field needs in the list
+    view.
+    """
+    if isinstance(ma_field, ma.fields.DateTimeField):
+        return 'datetime'
+    if isinstance(ma_field, ma.fields.BoolField):
+        return 'boolean'
+    if isinstance(ma_field, (ma.fields.IntField, ma.fields.FloatField)):
+        return 'number'
+    return 'text'
+
+
+def _describe_schema(document_class):
+    """Returns a JSON serializable description of the fields of a
+    document class, for fingerprinting.
+    """
+    return [[name, '%s.%s' % (type(field).__module__, type(field).__name__),
+             _describe_attributes(field)]
+            for name, field in sorted(document_class.get_fields().items())]
+
+
+def _describe_attributes(obj):
+    """Returns the attributes of an object that have simple values,
+    along with descriptions of the types of any nested fields.
+    """
+    attributes = []
+    for name, value in sorted(vars(obj).items()):
+        if value is None or isinstance(value, (bool, int, long, float,
+                                               basestring)):
+            attributes.append([name, value])
+        elif isinstance(value, ma.fields.Field):
+            attributes.append([name, type(value).__name__,
+                               _describe_attributes(value)])
+        elif isinstance(value, (list, tuple)):
+            attributes.append([name, [
+                isinstance(item, ma.fields.Field) and
+                [type(item).__name__, _describe_attributes(item)] or
+                repr(item) for item in value]])
+    return attributes
+
+
+def _resolve_form_callable(spec):
+    raise ValueError('unknown form callable: %r' % (spec,))
+
+
 def _form_for_model(document_class, db_session):
     """returns a wtform Form object for a given document model class.
     """
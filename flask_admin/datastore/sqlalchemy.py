@@ -10,16 +10,24 @@
 """
 from __future__ import absolute_import
 
+from contextlib import contextmanager
 import datetime
-from functools import wraps
+import decimal
+from functools import partial, wraps
 import inspect
+from multiprocessing.pool import ThreadPool
 import os
+import re
+import sys
+import threading
 import time
 import types
+import uuid
+import warnings
+import weakref
 
 import flask
 from flask import flash, render_template, redirect, request, url_for
-from flask.ext.sqlalchemy import Pagination
 import sqlalchemy as sa
 from sqlalchemy.orm.exc import NoResultFound
 from wtforms import validators, widgets
@@ -28,6 +36,7 @@ from wtforms.ext.sqlalchemy import fields as sa_fields
 
 from flask.ext.admin.wtforms import *
 from flask.ext.admin.datastore import AdminDatastore
+from flask.ext.admin import util
 
 
 class SQLAlchemyDatastore(AdminDatastore):
@@ -61,13 +70,149 @@ class SQLAlchemyDatastore(AdminDatastore):
     the nature of foreign key relationships. If you want to expose the
     primary key, set this to False.
 
+    Generated forms are built the first time they are needed. To save
+    new processes from generating them again, set `form_cache_dir` to
+    a directory where descriptions of the generated forms will be
+    cached. Cached forms are keyed by a fingerprint of the model's
+    mapper and columns, so they are regenerated when the schema
+    changes.
+
+    The `keyset_columns` parameter can be set to a dict with model
+    names as keys matched to a list of column names that keyset (seek)
+    pagination should page on, for example ``{'Student': ['name']}``.
+    The primary key columns are always appended as a tiebreaker so the
+    key is unique. The columns should be indexed. Rows with NULL in a
+    nullable keyset column are paged wherever the database sorts
+    NULLs (first on SQLite and MySQL, last on PostgreSQL), so that the
+    index can serve the ordering. By default, keyset pagination pages
+    on the primary key.
+
+    The `count_strategies` parameter controls how the list view counts
+    the rows of a model. It should be a dict with model names as keys
+    matched to a count strategy: :class:`ExactCount` (the default),
+    :class:`CachedCount`, :class:`EstimatedCount` or :class:`NoCount`.
+    Counting every row of a very large table on each page load can be
+    expensive, so the cached, estimated or skipped counts can be used
+    for those tables instead.
+
+    The list view shows each model instance using its ``__repr__`` by
+    default, which means loading every column of every listed row. To
+    show a table of columns instead, set `list_columns` to a dict with
+    model names as keys matched to a list of column names, for example
+    ``{'Student': ['name', 'enrolled']}``. Only those columns (and the
+    primary key) will be selected from the database, and text columns
+    are truncated in the query to `list_text_length` characters.
+
+    If the ``__repr__`` of a model touches a relationship, listing
+    model instances will lazily load that relationship once for every
+    row. Use the `eager_loads` parameter to load relationships along
+    with the model instances instead. It should be a dict with model
+    names as keys matched to either a list of relationship names, or a
+    dict of relationship names matched to a loading strategy:
+    ``'joined'`` or ``'selectin'`` (``'subquery'`` on SQLAlchemy
+    versions without selectin loading). By default, many-to-one
+    relationships are joined and collections are loaded with selectin
+    loading. Eager loads apply to the list view and to
+    :meth:`find_model_instance`, which also loads the relationships
+    shown by the edit form this way. When the app is in debug mode, a
+    :class:`LazyLoadWarning` is issued if rendering the list view
+    still triggers lazy loads.
+
+    The list view can be sorted by any column that is indexed according
+    to the table metadata (including primary keys and unique columns),
+    with the primary key as a tiebreaker. Sorting on other columns is
+    not allowed by default because it could mean sorting the whole
+    table. To choose the sortable columns yourself, set
+    `sortable_columns` to a dict with model names as keys matched to a
+    list of column names.
+
+    The list view can also be filtered by column values: equality,
+    IN lists, half-open ranges (``>=`` and ``<``) and IS NULL. The
+    filters are compiled into the query, with the values coerced to
+    the column types so that indexes can be used. Like sorting,
+    filtering is only offered on indexed columns by default; to choose
+    the filterable columns yourself, set `list_filters` to a dict with
+    model names as keys matched to a list of column names.
+
+    To add a search box to the list view of a model, set
+    `search_columns` to a dict with model names as keys matched to a
+    list of the text columns to search, for example
+    ``{'Student': ['name', 'bio']}``. Searches use a full-text index
+    and results are ranked by relevance. Call :meth:`create_search_index`
+    once to create the index; until then the list view isn't
+    searched. On SQLite, the index is an FTS5 table named
+    ``<table>_fts`` that is kept in sync by session events (changes
+    made with bulk ``Query.update()`` or ``Query.delete()`` bypass
+    these). This needs a model with a single integer primary key. On
+    PostgreSQL and MySQL the database's own full-text search is used.
+    Other databases can't be searched.
+
+    Relationship fields in generated forms are select boxes with every
+    instance of the related model as an option, which is only
+    practical for small tables. For larger related models, set
+    `lookup_columns` to a dict with model names as keys matched to the
+    name of a column to label their instances by, for example
+    ``{'Student': 'name'}``. Relationships to those models are then
+    shown as select boxes that only render the selected instances and
+    look up the others from the admin blueprint as the user types,
+    with a prefix search on the label column. The label column should
+    be indexed; the search is case sensitive unless the column's
+    collation isn't.
+
+    The choices of the other relationship select boxes are queried
+    and sorted every time a form is rendered or validated. For small
+    lookup tables that rarely change, set `cached_choices` to a dict
+    with model names as keys matched to the most rows to cache, for
+    example ``{'Country': 500}``, and the choices will be cached in
+    memory (see :class:`ChoiceCache`). A model's cached choices are
+    dropped whenever this datastore's session changes its table, and
+    otherwise after `choice_cache_ttl` seconds so that changes made by
+    other processes are seen eventually. Models with more rows than
+    the limit aren't cached.
+
+    When a form has several relationship select boxes, the choice
+    lists that aren't cached are queried concurrently before the form
+    is rendered or validated (see :meth:`load_form_choices`), by a
+    pool of `choice_load_threads` threads. Set it to 0 to query them
+    one after another instead.
+
     .. _SQLAlchemy in Flask: http://flask.pocoo.org/docs/patterns/sqlalchemy/
     .. _WTForms documentation: http://wtforms.simplecodes.com/
     """
-    def __init__(self, models, db_session, model_forms=None, exclude_pks=True):
+    supports_keyset_pagination = True
+
+    def __init__(self, models, db_session, model_forms=None, exclude_pks=True,
+                 keyset_columns=None, count_strategies=None,
+                 list_columns=None, list_text_length=80, eager_loads=None,
+                 sortable_columns=None, list_filters=None,
+                 search_columns=None, form_cache_dir=None,
+                 lookup_columns=None, cached_choices=None,
+                 choice_cache_ttl=300, choice_load_threads=4):
         self.model_classes = {}
         self.model_forms = model_forms
         self.db_session = db_session
+        self.keyset_columns = keyset_columns or {}
+        self.count_strategies = count_strategies or {}
+        self.list_columns = list_columns or {}
+        self.list_text_length = list_text_length
+        self.eager_loads = eager_loads or {}
+        self.sortable_columns = sortable_columns or {}
+        self.list_filters = list_filters or {}
+        self.search_columns = search_columns or {}
+        self.lookup_columns = lookup_columns or {}
+        self.choice_cache = ChoiceCache(db_session, cached_choices or {},
+                                        choice_cache_ttl)
+        self.choice_load_threads = choice_load_threads
+        self._choice_pool = None
+        self._table_versions = {}
+        self._version_token = uuid.uuid4().hex[:8]
+        self._flushed_tables = weakref.WeakKeyDictionary()
+        self._changes_lock = threading.Lock()
+        self._listening_for_changes = False
+        self.exclude_pks = exclude_pks
+        self.form_cache = form_cache_dir and FormCache(form_cache_dir)
+        self._query_counter = threading.local()
+        self._counted_engines = set()
 
         if not self.model_forms:
             self.model_forms = {}
@@ -85,23 +230,197 @@ class SQLAlchemyDatastore(AdminDatastore):
                  if isinstance(model, sa.ext.declarative.DeclarativeMeta)
                  and model.__name__ != 'Base'])
 
-        if self.model_classes:
-            self.form_dict = dict(
-                [(k, _form_for_model(v, db_session,
-                                     exclude_pk=exclude_pks))
-                 for k, v in self.model_classes.items()])
-            for model_name, form in self.model_forms.items():
-                if model_name in self.form_dict:
-                    self.form_dict[model_name] = form
-
-    def create_model_pagination(self, model_name, page, per_page=25):
-        """Returns a pagination object for the list view."""
-        model_class = self.model_classes[model_name]
-        model_instances = self.db_session.query(model_class)
+        # forms are generated the first time they are needed
+        self.form_dict = {}
+        self._form_lock = threading.Lock()
+
+        # queries are counted by an engine listener for
+        # warn_lazy_loads; connections only see the listeners that were
+        # there when they were checked out, so it is added up front
+        for model_class in self.model_classes.values():
+            try:
+                engine = db_session.get_bind(sa.orm.class_mapper(model_class))
+            except (sa.exc.UnboundExecutionError, RuntimeError):
+                # e.g. Flask-SQLAlchemy outside of an app context; the
+                # engine is found by warn_lazy_loads instead
+                continue
+            self._count_queries_on(engine)
+
+        if self.search_columns:
+            sa.event.listen(_session_event_target(db_session), 'after_flush',
+                            self._sync_search_indexes)
+        if cached_choices:
+            self._listen_for_changes()
+
+    def create_model_pagination(self, model_name, page, per_page=25,
+                                sort=None, sort_desc=False, filters=None,
+                                search=None, columns=None, stream=False):
+        """Returns a pagination object for the list view. The rows are
+        ordered by the `sort` column, if given, and then by primary
+        key. `filters` is a list of (column name, operator, value)
+        tuples; see :meth:`get_filter_columns`. If `search` is given,
+        only rows matching the search are listed, ordered by relevance
+        unless a `sort` column is given. If `columns` is given, only
+        those columns are selected.
+
+        If `stream` is True, the rows are read from the database
+        `stream_batch_size` at a time while the items are iterated
+        over. Without an exact count, whether there is a next page is
+        then found with a separate query for the first row after the
+        page.
+        """
+        model_class = self.get_model_class(model_name)
+        model_instances, make_item = self._list_query(model_name,
+                                                      columns=columns)
+        model_instances = self._filter_query(model_name, model_instances,
+                                             filters)
+        rank_order = []
+        if search:
+            model_instances, rank_order = self._search_query(
+                model_name, model_instances, search)
         offset = (page - 1) * per_page
-        items = model_instances.limit(per_page).offset(offset).all()
-        return Pagination(model_instances, page, per_page,
-                          model_instances.count(), items)
+
+        strategy = self.count_strategies.get(model_name, _exact_count)
+        count = strategy.count(self.db_session, model_class, model_instances,
+                               filtered=bool(filters or search))
+        order_by = _order_by(self._get_order_columns(model_name, sort),
+                             sort_desc)
+        if not sort:
+            order_by = rank_order + order_by
+        model_instances = model_instances.order_by(*order_by)
+        if stream:
+            return self._stream_pagination(model_name, model_instances,
+                                           make_item, page, per_page, count)
+        if count is not None and count[1]:
+            rows = model_instances.limit(per_page).offset(offset).all()
+            return util.Pagination(page, per_page, count[0],
+                                   [make_item(row) for row in rows])
+
+        # without an exact total, fetch one extra row to find out if
+        # there's a next page
+        rows = model_instances.limit(per_page + 1).offset(offset).all()
+        total = count and count[0]
+        return util.Pagination(page, per_page, total,
+                               [make_item(row) for row in rows[:per_page]],
+                               exact=False, has_more=len(rows) > per_page)
+
+    #: how many rows are read from the database at a time when the
+    #: list view is streamed
+    stream_batch_size = 100
+
+    def _stream_pagination(self, model_name, query, make_item, page,
+                           per_page, count):
+        offset = (page - 1) * per_page
+        exact = count is not None and count[1]
+        has_more = None
+        if not exact:
+            has_more = query.offset(offset + per_page).first() is not None
+
+        query = query.limit(per_page).offset(offset)
+        # yield_per can't be combined with eager loads of collections
+        if self.get_list_columns(model_name) or \
+               not self._get_eager_load_options(model_name):
+            query = query.execution_options(stream_results=True).\
+                yield_per(self.stream_batch_size)
+        return util.Pagination(page, per_page, count and count[0],
+                               util.StreamedItems(self._uncounted(query),
+                                                  make_item),
+                               exact=exact, has_more=has_more)
+
+    def _uncounted(self, rows):
+        """Yields the rows of a query, which is executed when the first
+        row is needed. The queries that select them aren't counted by
+        :meth:`warn_lazy_loads`, since streamed rows are read while the
+        list view is being rendered.
+        """
+        counter = self._query_counter
+        iterator = None
+        while True:
+            active = getattr(counter, 'active', False)
+            counter.active = False
+            try:
+                if iterator is None:
+                    iterator = iter(rows)
+                row = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                counter.active = active
+            yield row
+
+    def create_model_keyset_pagination(self, model_name, cursor=None,
+                                       per_page=25, sort=None,
+                                       sort_desc=False, filters=None,
+                                       columns=None):
+        """Returns a keyset pagination object for the list view. The
+        rows are located by seeking past the key encoded in `cursor`
+        rather than by an offset, so page depth doesn't affect the
+        cost of the query. If `sort` is given, the rows are paged in
+        the order of that column instead of the keyset columns. If
+        `columns` is given, only those columns are selected.
+        """
+        list_columns = columns
+        columns = self._get_keyset_columns(model_name, sort)
+        query, make_item = self._list_query(model_name, columns,
+                                            list_columns)
+        query = self._filter_query(model_name, query, filters)
+
+        direction = 'next'
+        if cursor:
+            direction, values = util.decode_cursor(cursor)
+            if len(values) != len(columns):
+                raise ValueError('invalid pagination cursor: %r' % cursor)
+            values = [_coerce_value(column, value)
+                      for column, value in zip(columns, values)]
+
+        # when paging backwards, seek and sort in the opposite order
+        # and then reverse the rows
+        reverse = (direction == 'prev') != bool(sort_desc)
+        if cursor:
+            model_mapper = sa.orm.class_mapper(
+                self.get_model_class(model_name))
+            dialect = self.db_session.get_bind(model_mapper).dialect
+            query = query.filter(_seek_criterion(
+                columns, values, reverse, _nulls_sort_first(dialect)))
+
+        # fetch one extra row to find out if there's another page
+        rows = query.order_by(*_order_by(columns, reverse)).\
+            limit(per_page + 1).all()
+        has_more = len(rows) > per_page
+        rows = rows[:per_page]
+        if direction == 'prev':
+            rows.reverse()
+
+        next_cursor = prev_cursor = None
+        if rows:
+            first_key = [getattr(rows[0], column.key) for column in columns]
+            last_key = [getattr(rows[-1], column.key) for column in columns]
+            if has_more or direction == 'prev':
+                next_cursor = util.encode_cursor(last_key, 'next')
+            if cursor and (has_more or direction == 'next'):
+                prev_cursor = util.encode_cursor(first_key, 'prev')
+
+        return util.KeysetPagination(per_page,
+                                     [make_item(row) for row in rows],
+                                     next_cursor, prev_cursor)
+
+    def get_page_cursor(self, model_name, page, per_page=25, sort=None,
+                        sort_desc=False, filters=None):
+        """Returns a keyset pagination cursor that points to the same
+        rows as a given offset page, or None if the page is the first
+        page or past the end of the list. Only the keyset columns are
+        read, so this can usually be answered from an index.
+        """
+        if page <= 1:
+            return None
+        columns = self._get_keyset_columns(model_name, sort)
+        query = self._filter_query(model_name,
+                                   self.db_session.query(*columns), filters)
+        row = query.order_by(*_order_by(columns, sort_desc)).\
+            offset((page - 1) * per_page - 1).limit(1).first()
+        if row is None:
+            return None
+        return util.encode_cursor(list(row), 'next')
 
     def delete_model_instance(self, model_name, model_keys):
         """Deletes a model instance. Returns True if model instance
@@ -112,12 +431,209 @@ class SQLAlchemyDatastore(AdminDatastore):
             return False
         self.db_session.delete(model_instance)
         self.db_session.commit()
+        self._model_changed(type(model_instance))
         return True
 
-    def find_model_instance(self, model_name, model_keys):
+    def delete_model_instances(self, model_name, model_keys_list,
+                               batch_size=500):
+        """Deletes the model instances with the given keys,
+        `batch_size` at a time, committing after each batch so that no
+        single transaction holds its locks for long. Returns a list of
+        the number of rows each batch deleted.
+
+        When the ORM would do nothing more than delete the rows (and
+        the rows of any many-to-many association tables), each batch
+        is a single ``DELETE ... WHERE pk IN (...)`` statement.
+        Models with one-to-many relationships or delete cascades need
+        the ORM to update or delete the related rows, so each batch of
+        those is loaded with one query and deleted through the
+        session instead.
+        """
+        model_class = self.get_model_class(model_name)
+        model_mapper = sa.orm.class_mapper(model_class)
+        pk_columns = [getattr(model_class, name)
+                      for name in _get_pk_names(model_class)]
+        keys = [tuple([_coerce_value(column, value)
+                       for column, value in zip(pk_columns, model_keys)])
+                for model_keys in model_keys_list]
+        secondaries = _get_secondary_key_columns(model_mapper)
+
+        counts = []
+        try:
+            for start in range(0, len(keys), batch_size):
+                batch = keys[start:start + batch_size]
+                criterion = _keys_criterion(pk_columns, batch)
+                if secondaries is None:
+                    model_instances = self.db_session.query(model_class).\
+                        filter(criterion).all()
+                    for model_instance in model_instances:
+                        self.db_session.delete(model_instance)
+                    count = len(model_instances)
+                else:
+                    for secondary, columns in secondaries:
+                        self.db_session.execute(secondary.delete().where(
+                            _keys_criterion(columns, batch)))
+                    count = self.db_session.query(model_class).\
+                        filter(criterion).delete(synchronize_session=False)
+                    if model_name in self.search_columns:
+                        self._delete_search_rows(model_class,
+                                                 [key[0] for key in batch])
+                self.db_session.commit()
+                counts.append(count)
+        except sa.exc.DBAPIError as e:
+            self.db_session.rollback()
+            raise util.BulkDeleteError(unicode(e.orig), counts)
+        finally:
+            # the set-based deletes don't go through the session's flush
+            self._model_changed(model_class, [
+                secondary for secondary, columns in secondaries or []])
+        return counts
+
+    def import_model_rows(self, model_name, rows, batch_size=1000,
+                          pool=None):
+        """Validates and inserts rows of a given model from an import
+        file, given as (line number, row) tuples where each row is a
+        dict of column names matched to string values. Returns a
+        :class:`~flask.ext.admin.util.ImportResult`.
+
+        Rows are validated against a form generated for the model's
+        columns (foreign keys are given as column values rather than
+        chosen from a select field, and the primary key may be left
+        out), by the worker processes of `pool` if one is given. Valid
+        rows are inserted `batch_size` at a time with one
+        ``executemany`` INSERT per batch, committing after each batch.
+        If a batch fails, its rows are retried one at a time so that
+        only the bad rows are rejected. Rows are inserted with the
+        table rather than the ORM, so many-to-many relationships
+        can't be imported.
+        """
+        model_class = self.get_model_class(model_name)
+        model_mapper = sa.orm.class_mapper(model_class)
+        columns = dict([(prop.key, prop.columns[0])
+                        for prop in model_mapper.iterate_properties
+                        if isinstance(prop, sa.orm.properties.ColumnProperty)])
+
+        result = util.ImportResult()
+        batch = []
+        for line_number, data, errors in util.validate_rows(
+                _import_form_for_model, model_class, rows, pool):
+            if errors:
+                result.reject(line_number, errors)
+                continue
+            values = {}
+            for key, value in data.items():
+                column = columns.get(key)
+                if column is None:
+                    continue
+                # leave out empty values that the database or a column
+                # default would fill in
+                if value is None and (column.primary_key or
+                                      column.default is not None or
+                                      column.server_default is not None):
+                    continue
+                values[column.key] = value
+            batch.append((line_number, values))
+            if len(batch) >= batch_size:
+                self._insert_import_batch(model_name, batch, result)
+                batch = []
+        if batch:
+            self._insert_import_batch(model_name, batch, result)
+        # the inserts don't go through the session's flush
+        self._model_changed(model_class)
+        return result
+
+    def _insert_import_batch(self, model_name, batch, result):
+        """Inserts a batch of (line number, values) tuples with
+        ``executemany``, one statement for each set of columns in the
+        batch, and adds them to the import `result`.
+        """
+        model_class = self.get_model_class(model_name)
+        model_mapper = sa.orm.class_mapper(model_class)
+        table = model_mapper.local_table
+        groups = {}
+        for line_number, values in batch:
+            groups.setdefault(tuple(sorted(values)), []).append(values)
+
+        try:
+            # only SQLite's FTS5 index needs to be told about the rows
+            search_rowid = None
+            if model_name in self.search_columns and \
+                   self._has_sqlite_search_table(model_class):
+                search_rowid = self.db_session.execute(
+                    sa.select([sa.func.max(
+                        _get_search_rowid_column(model_class))]),
+                    mapper=model_mapper).scalar() or 0
+            for group in groups.values():
+                self.db_session.execute(table.insert(), group,
+                                        mapper=model_mapper)
+            if search_rowid is not None:
+                rowid_key = _get_search_rowid_column(model_class).key
+                self._index_inserted_rows(
+                    model_name, search_rowid,
+                    [values[rowid_key] for line_number, values in batch
+                     if rowid_key in values])
+            self.db_session.commit()
+            result.accepted += len(batch)
+        except sa.exc.DBAPIError as e:
+            self.db_session.rollback()
+            if len(batch) > 1:
+                for row in batch:
+                    self._insert_import_batch(model_name, [row], result)
+            else:
+                result.reject(batch[0][0], {u'': [unicode(e.orig)]})
+
+    def _has_sqlite_search_table(self, model_class):
+        """Returns True if a model is stored in SQLite and has an FTS5
+        table.
+        """
+        model_mapper = sa.orm.class_mapper(model_class)
+        connection = self.db_session.connection(mapper=model_mapper)
+        return connection.dialect.name == 'sqlite' and _sqlite_table_exists(
+            connection, _fts_table_name(model_mapper.local_table))
+
+    def _index_inserted_rows(self, model_name, max_rowid, rowids):
+        """Adds rows that were inserted without going through the
+        session to the SQLite FTS5 table of a model, which must have
+        one: the rows with a rowid above `max_rowid`, the highest rowid
+        before the insert, and those with one of the given `rowids`.
+        """
+        model_class = self.get_model_class(model_name)
+        model_mapper = sa.orm.class_mapper(model_class)
+        connection = self.db_session.connection(mapper=model_mapper)
+        table = model_mapper.local_table
+        preparer = connection.dialect.identifier_preparer
+        pk_name = preparer.quote_identifier(
+            _get_search_rowid_column(model_class).name)
+        column_names = ', '.join([
+            preparer.quote_identifier(column.name)
+            for column in self._get_search_table_columns(model_name)])
+        criterion = '%s > %d' % (pk_name, max_rowid)
+        if rowids:
+            criterion += ' OR %s IN (%s)' % (
+                pk_name, ', '.join(['%d' % rowid for rowid in rowids]))
+        connection.execute(
+            'INSERT INTO %s (rowid, %s) SELECT %s, %s FROM %s WHERE %s' % (
+                preparer.quote_identifier(_fts_table_name(table)),
+                column_names, pk_name, column_names,
+                preparer.format_table(table), criterion))
+
+    def _delete_search_rows(self, model_class, rowids):
+        """Removes rows that were deleted without going through the
+        session from the SQLite FTS5 table of a model, if it has one.
+        """
+        if self._has_sqlite_search_table(model_class):
+            model_mapper = sa.orm.class_mapper(model_class)
+            _delete_from_fts_table(
+                self.db_session.connection(mapper=model_mapper),
+                model_mapper.local_table, rowids)
+
+    def find_model_instance(self, model_name, model_keys, load=None):
         """Returns a model instance, if one exists, that matches
         model_name and model_keys. Returns None if no such model
-        instance exists.
+        instance exists. The relationships among the attribute names
+        in `load` (such as the fields of the edit form) are loaded
+        along with the instance, as they would be by `eager_loads`,
+        so reading them doesn't need a lazy load each.
         """
         model_class = self.get_model_class(model_name)
         pk_query_dict = {}
@@ -126,8 +642,9 @@ class SQLAlchemyDatastore(AdminDatastore):
             pk_query_dict[key] = value
 
         try:
-            return self.db_session.query(model_class).filter_by(
-                **pk_query_dict).one()
+            return self.db_session.query(model_class).\
+                options(*self._get_eager_load_options(model_name, load)).\
+                filter_by(**pk_query_dict).one()
         except NoResultFound:
             return None
 
@@ -136,8 +653,389 @@ class SQLAlchemyDatastore(AdminDatastore):
         return self.model_classes[model_name]
 
     def get_model_form(self, model_name):
-        """Returns a form, given a model name."""
-        return self.form_dict[model_name]
+        """Returns a form, given a model name. Forms are generated
+        (or taken from `model_forms`) the first time they are asked
+        for and then cached.
+        """
+        try:
+            return self.form_dict[model_name]
+        except KeyError:
+            pass
+
+        model_class = self.get_model_class(model_name)
+        self._form_lock.acquire()
+        try:
+            if model_name not in self.form_dict:
+                form = self.model_forms.get(model_name)
+                if form is None:
+                    form = self._generate_form(model_name)
+                self.form_dict[model_name] = form
+            return self.form_dict[model_name]
+        finally:
+            self._form_lock.release()
+
+    def _generate_form(self, model_name):
+        """Returns a generated form for a given model, rebuilt from the
+        form cache if there is one and it has the form for the model's
+        current schema.
+        """
+        model_class = self.get_model_class(model_name)
+        if not self.form_cache:
+            return _form_for_model(model_class, self.db_session,
+                                   exclude_pk=self.exclude_pks,
+                                   lookup_columns=self.lookup_columns,
+                                   choice_cache=self.choice_cache)
+
+        fingerprint = schema_fingerprint(
+            [_describe_schema(model_class), self.exclude_pks,
+             sorted(self.lookup_columns.items())])
+        description = self.form_cache.get(model_name, fingerprint)
+        if description is not None:
+            try:
+                return load_form(description, self._resolve_form_callable,
+                                 self._resolve_form_class)
+            except (ImportError, AttributeError, KeyError, TypeError,
+                    ValueError):
+                pass
+
+        form = _form_for_model(model_class, self.db_session,
+                               exclude_pk=self.exclude_pks,
+                               lookup_columns=self.lookup_columns,
+                               choice_cache=self.choice_cache)
+        try:
+            description = dump_form(form)
+        except TypeError:
+            # forms with arguments that can't be described aren't
+            # cached
+            return form
+        self.form_cache.set(model_name, fingerprint, description)
+        return form
+
+    def _resolve_form_callable(self, spec):
+        """Returns the callable for the `_form_cache_spec` of a
+        callable in a cached form description.
+        """
+        kind, class_path = spec
+        if kind == 'choice_label':
+            return _choice_label
+        model_class = self._resolve_form_class(class_path)
+        if kind == 'query_factory':
+            return _query_factory_for(model_class, self.db_session,
+                                      self.choice_cache)
+        if kind == 'lookup_query':
+            return _lookup_query_for(model_class, self.db_session)
+        raise ValueError('unknown form callable: %r' % (spec,))
+
+    def _resolve_form_class(self, class_path):
+        """Returns the model class for the import path of a class in a
+        cached form description. Cache files aren't trusted to import
+        anything, so only mapped classes of modules that have already
+        been imported are returned; raises a ValueError otherwise.
+        """
+        module_name, name = class_path.split(':')
+        module = sys.modules.get(module_name)
+        model_class = getattr(module, name, None)
+        if module is None or not isinstance(model_class, type):
+            raise ValueError('unknown model class: %r' % class_path)
+        try:
+            sa.orm.class_mapper(model_class)
+        except (sa.orm.exc.UnmappedClassError, sa.exc.ArgumentError):
+            raise ValueError('unknown model class: %r' % class_path)
+        return model_class
+
+    def get_model_version(self, model_name):
+        """Returns a version string for a given model that changes
+        whenever this datastore's session changes the tables of the
+        model or of the models it has relationships with. Versions are
+        kept in memory and include a token unique to the datastore, so
+        versions from another process never match. Changes made by
+        other processes, or with statements that bypass the session,
+        aren't noticed.
+        """
+        self._listen_for_changes()
+        tables = _get_version_tables(self.get_model_class(model_name))
+        return '%s.%s' % (self._version_token, '.'.join([
+            str(self._table_versions.get(table, 0)) for table in tables]))
+
+    def _listen_for_changes(self):
+        """Starts listening for the flushes, commits and rollbacks of
+        the session to notice the tables they change. Changes are
+        noticed when they are flushed, and again when they are
+        committed or rolled back in case another request read the
+        tables in between.
+        """
+        self._changes_lock.acquire()
+        try:
+            if self._listening_for_changes:
+                return
+            target = _session_event_target(self.db_session)
+            sa.event.listen(target, 'after_flush', self._after_flush)
+            sa.event.listen(target, 'after_commit', self._after_commit)
+            sa.event.listen(target, 'after_rollback', self._after_commit)
+            self._listening_for_changes = True
+        finally:
+            self._changes_lock.release()
+
+    def _after_flush(self, session, flush_context):
+        tables = set()
+        for instance in list(session.new) + list(session.dirty) + \
+                list(session.deleted):
+            tables.update(_get_changed_tables(sa.orm.object_mapper(instance)))
+        if tables:
+            self._tables_changed(tables)
+            self._flushed_tables.setdefault(session, set()).update(tables)
+
+    def _after_commit(self, session):
+        tables = self._flushed_tables.pop(session, None)
+        if tables:
+            self._tables_changed(tables)
+
+    def _model_changed(self, model_class, tables=()):
+        """Notes that the rows of a model class (and of any other
+        `tables`) have been changed without the session noticing.
+        """
+        self._tables_changed(
+            set(sa.orm.class_mapper(model_class).tables) | set(tables))
+
+    def _tables_changed(self, tables):
+        """Drops the cached choices of a set of tables and bumps their
+        versions.
+        """
+        self.choice_cache.invalidate(tables)
+        self._changes_lock.acquire()
+        try:
+            for table in tables:
+                self._table_versions[table] = \
+                    self._table_versions.get(table, 0) + 1
+        finally:
+            self._changes_lock.release()
+
+    def load_form_choices(self, form):
+        """Loads the choices of a form's relationship select fields
+        ahead of rendering or validating the form. The choice lists
+        that aren't cached are queried concurrently on the thread pool,
+        each with its own connection, so that loading them takes about
+        as long as the slowest query rather than all of them together.
+        Choices are left to load as they are needed if there is only
+        one list to query, or if the engine can't give each thread its
+        own connection (like the pool of an in-memory SQLite database).
+        """
+        fields = {}
+        for field in form:
+            query_factory = getattr(field, 'query_factory', None)
+            model_class = getattr(query_factory, 'model_class', None)
+            if model_class is not None and field.query is None:
+                fields.setdefault(model_class, []).append(field)
+        model_classes = [model_class for model_class in fields
+                         if not self.choice_cache.has_choices(model_class)]
+        if len(model_classes) < 2 or not self.choice_load_threads:
+            return
+
+        binds = [self.db_session.get_bind(sa.orm.class_mapper(model_class))
+                 for model_class in model_classes]
+        if not all([_has_thread_connections(bind) for bind in binds]):
+            return
+        loaded = self._get_choice_pool().map(
+            _load_detached_choices, zip(binds, model_classes))
+        for model_class, instances in zip(model_classes, loaded):
+            choices = _merge_choices(self.db_session, model_class, instances)
+            for field in fields[model_class]:
+                field.query = choices
+
+    def _get_choice_pool(self):
+        """Returns the thread pool that choice lists are loaded by,
+        starting it the first time it is needed. It is shut down when
+        the interpreter exits.
+        """
+        if self._choice_pool is None:
+            self._form_lock.acquire()
+            try:
+                if self._choice_pool is None:
+                    self._choice_pool = util.close_pool_at_exit(
+                        ThreadPool(self.choice_load_threads))
+            finally:
+                self._form_lock.release()
+        return self._choice_pool
+
+    def lookup_related(self, model_name, field_name, prefix, limit=20):
+        """Returns up to `limit` (key, label) tuples for the instances
+        of the model related to a given model by the relationship
+        `field_name` whose label column (see `lookup_columns`) starts
+        with `prefix`, ordered by label. Only the label and primary
+        key columns are selected. Raises a KeyError if the relationship
+        doesn't exist or the related model has no lookup column.
+        """
+        model_mapper = sa.orm.class_mapper(self.get_model_class(model_name))
+        props = dict([(prop.key, prop)
+                      for prop in model_mapper.iterate_properties])
+        prop = props.get(field_name)
+        if not isinstance(prop, sa.orm.properties.RelationshipProperty):
+            raise KeyError(field_name)
+        foreign_model = prop.mapper.class_
+        label_column = getattr(foreign_model,
+                               self.lookup_columns[foreign_model.__name__])
+        pk_columns = list(prop.mapper.primary_key)
+
+        query = self.db_session.query(label_column, *pk_columns)
+        if prefix:
+            query = query.filter(_prefix_criterion(label_column, prefix))
+        query = query.order_by(label_column, *pk_columns).limit(limit)
+        return [(_format_key(row[1:]), row[0]) for row in query]
+
+    def get_filter_columns(self, model_name):
+        """Returns a list of (column name, kind) tuples for the
+        columns the list view of a given model can be filtered by:
+        the configured list filters if there are any, otherwise the
+        indexed columns. The kind is one of 'text', 'number', 'date',
+        'datetime', 'time' or 'boolean'.
+        """
+        model_class = self.get_model_class(model_name)
+        if model_name in self.list_filters:
+            names = self.list_filters[model_name]
+        else:
+            names = _get_indexed_column_names(model_class)
+        return [(name, _filter_kind(getattr(model_class, name)))
+                for name in names]
+
+    def get_list_columns(self, model_name):
+        """Returns the list of column names shown in the list view for
+        a given model, or None if model instances are listed by their
+        ``__repr__``.
+        """
+        return self.list_columns.get(model_name)
+
+    def get_export_columns(self, model_name):
+        """Returns the names of the columns of a given model that can
+        be exported: every mapped column except binary ones.
+        """
+        model_mapper = sa.orm.class_mapper(self.get_model_class(model_name))
+        return [prop.key for prop in model_mapper.iterate_properties
+                if isinstance(prop, sa.orm.properties.ColumnProperty)
+                and not isinstance(prop.columns[0].type,
+                                   sa.types.LargeBinary)]
+
+    def iter_model_rows(self, model_name, columns=None, sort=None,
+                        sort_desc=False, filters=None, search=None,
+                        batch_size=1000):
+        """Returns an iterator over the values of `columns` for the
+        rows of a given model, for exporting. The rows are streamed
+        from the database `batch_size` at a time with ``yield_per``,
+        on a session of their own so the iterator can outlive the
+        request's session.
+        """
+        model_class = self.get_model_class(model_name)
+        columns = self._get_export_column_names(model_name, columns)
+        query = self.db_session.query(*[getattr(model_class, name)
+                                        for name in columns])
+        query = self._filter_query(model_name, query, filters)
+        rank_order = []
+        if search:
+            query, rank_order = self._search_query(model_name, query, search)
+        order_by = _order_by(self._get_order_columns(model_name, sort),
+                             sort_desc)
+        if not sort:
+            order_by = rank_order + order_by
+        query = query.order_by(*order_by).\
+            execution_options(stream_results=True).yield_per(batch_size)
+        bind = self.db_session.get_bind(sa.orm.class_mapper(model_class))
+
+        def iter_rows():
+            session = sa.orm.Session(bind=bind)
+            try:
+                for row in query.with_session(session):
+                    yield tuple(row)
+            finally:
+                session.close()
+        return iter_rows()
+
+    def _get_export_column_names(self, model_name, columns=None):
+        """Returns the names of the columns to export for a given
+        model: `columns` if given, otherwise the list columns or all
+        export columns. Raises a ValueError for columns that can't be
+        exported.
+        """
+        export_columns = self.get_export_columns(model_name)
+        if not columns:
+            columns = self.get_list_columns(model_name) or export_columns
+        for name in columns:
+            if name not in export_columns:
+                raise ValueError('%s.%s cannot be exported' % (
+                    model_name, name))
+        return list(columns)
+
+    def get_search_columns(self, model_name):
+        """Returns the names of the columns the list view of a given
+        model can be searched on.
+        """
+        return list(self.search_columns.get(model_name, []))
+
+    def create_search_index(self, model_name):
+        """Creates the full-text index that searching a given model
+        needs, if it doesn't exist yet, and commits the session. On
+        SQLite this is the FTS5 table holding the search columns,
+        filled from the model's table; on PostgreSQL it is a GIN
+        index on the ``to_tsvector()`` of the search columns; and on
+        MySQL it is a ``FULLTEXT`` index on them.
+        """
+        model_class = self.get_model_class(model_name)
+        table = sa.orm.class_mapper(model_class).local_table
+        columns = self._get_search_table_columns(model_name)
+        connection = self.db_session.connection(
+            mapper=sa.orm.class_mapper(model_class))
+        dialect = connection.dialect
+        preparer = dialect.identifier_preparer
+        index_name = _search_index_name(table)
+        if _search_index_exists(connection, table):
+            return
+
+        if dialect.name == 'sqlite':
+            pk_name = _get_search_rowid_column(model_class).name
+            fts_table = preparer.quote_identifier(_fts_table_name(table))
+            column_names = ', '.join([preparer.quote_identifier(column.name)
+                                      for column in columns])
+            connection.execute('CREATE VIRTUAL TABLE %s USING fts5(%s)' % (
+                fts_table, column_names))
+            connection.execute(
+                'INSERT INTO %s (rowid, %s) SELECT %s, %s FROM %s' % (
+                    fts_table, column_names, preparer.quote_identifier(pk_name),
+                    column_names, preparer.format_table(table)))
+        elif dialect.name == 'postgresql':
+            document = _search_document([sa.sql.column(column.name)
+                                         for column in columns])
+            connection.execute(
+                'CREATE INDEX %s ON %s USING gin (%s)' % (
+                    preparer.quote_identifier(index_name),
+                    preparer.format_table(table),
+                    _tsvector(self.search_config, document).compile(
+                        dialect=dialect)))
+        elif dialect.name == 'mysql':
+            connection.execute('CREATE FULLTEXT INDEX %s ON %s (%s)' % (
+                preparer.quote_identifier(index_name),
+                preparer.format_table(table),
+                ', '.join([preparer.quote_identifier(column.name)
+                           for column in columns])))
+        else:
+            raise NotImplementedError(
+                'full-text search is not supported on %s' % dialect.name)
+        self.db_session.commit()
+
+    def has_search_index(self, model_name):
+        """Returns True if the full-text index that searching a given
+        model needs has been created by :meth:`create_search_index`.
+        """
+        model_mapper = sa.orm.class_mapper(self.get_model_class(model_name))
+        return _search_index_exists(
+            self.db_session.connection(mapper=model_mapper),
+            model_mapper.local_table)
+
+    def get_sortable_columns(self, model_name):
+        """Returns the names of the columns the list view of a given
+        model can be sorted by: the configured sortable columns if
+        there are any, otherwise every column that leads an index.
+        """
+        if model_name in self.sortable_columns:
+            return list(self.sortable_columns[model_name])
+        return _get_indexed_column_names(self.get_model_class(model_name))
 
     def get_model_keys(self, model_instance):
         """Returns the keys for a given a model instance."""
@@ -154,6 +1052,7 @@ class SQLAlchemyDatastore(AdminDatastore):
         """
         self.db_session.add(model_instance)
         self.db_session.commit()
+        self._model_changed(type(model_instance))
 
     def update_from_form(self, model_instance, form):
         """Returns a model instance whose values have been updated
@@ -164,8 +1063,624 @@ class SQLAlchemyDatastore(AdminDatastore):
 
         return model_instance
 
+    @contextmanager
+    def warn_lazy_loads(self, model_name):
+        """Context manager that issues a :class:`LazyLoadWarning` if
+        any queries are executed while it is active. The list view
+        uses this while rendering so that lazy loads of relationships,
+        which could have been eager loads, are brought to attention.
+        """
+        model_class = self.get_model_class(model_name)
+        self._count_queries_on(
+            self.db_session.get_bind(sa.orm.class_mapper(model_class)))
+
+        counter = self._query_counter
+        counter.active = True
+        counter.count = 0
+        try:
+            yield
+        finally:
+            counter.active = False
+
+        if counter.count:
+            warnings.warn(LazyLoadWarning(
+                '%d queries were executed while rendering the list of %s. '
+                'This usually means its __repr__ lazily loads a '
+                'relationship; consider setting eager_loads for it.' % (
+                    counter.count, model_name)), stacklevel=3)
+
+    def _count_queries_on(self, engine):
+        """Adds a listener to an engine that counts the queries executed
+        on it while :meth:`warn_lazy_loads` is active in the current
+        thread. This is done once per engine, when the datastore is
+        created if the engine can be found then.
+        """
+        if engine in self._counted_engines:
+            return
+        self._counted_engines.add(engine)
+        counter = self._query_counter
+
+        def before_cursor_execute(*args, **kwargs):
+            if getattr(counter, 'active', False):
+                counter.count += 1
+
+        sa.event.listen(engine, 'before_cursor_execute',
+                        before_cursor_execute)
+
+    def _get_eager_load_options(self, model_name, load=None):
+        """Returns a list of query options that eagerly load the
+        relationships configured in `eager_loads` for a given model,
+        and the relationships among the attribute names in `load`.
+        """
+        eager_loads = self.eager_loads.get(model_name) or {}
+        if isinstance(eager_loads, dict):
+            eager_loads = dict(eager_loads)
+        else:
+            eager_loads = dict([(name, None) for name in eager_loads])
+
+        model_class = self.get_model_class(model_name)
+        model_mapper = sa.orm.class_mapper(model_class)
+        if load:
+            relationship_names = set([
+                prop.key for prop in model_mapper.iterate_properties
+                if isinstance(prop, sa.orm.properties.RelationshipProperty)])
+            for name in load:
+                if name in relationship_names:
+                    eager_loads.setdefault(name, None)
+
+        options = []
+        for name, strategy in eager_loads.items():
+            if strategy is None:
+                if model_mapper.get_property(name).uselist:
+                    strategy = 'selectin'
+                else:
+                    strategy = 'joined'
+            options.append(_eager_loaders[strategy](name))
+        return options
+
+    def _list_query(self, model_name, extra_columns=(), columns=None):
+        """Returns a (query, make_item) tuple for listing a given
+        model. If list columns have been configured for the model, the
+        query selects only those columns, the primary key and any
+        `extra_columns` (labeled by their attribute names), and
+        `make_item` turns each result row into a
+        :class:`~flask.ext.admin.util.ListRow`. Otherwise the query
+        loads whole model instances and `make_item` returns them as
+        they are. If `columns` is given, they are selected in full
+        instead of the list columns.
+        """
+        model_class = self.get_model_class(model_name)
+        if columns:
+            names = self._get_export_column_names(model_name, columns)
+        else:
+            names = self.get_list_columns(model_name)
+        if not names:
+            query = self.db_session.query(model_class).options(
+                *self._get_eager_load_options(model_name))
+            return query, lambda row: row
+
+        pk_names = _get_pk_names(model_class)
+        selected = [getattr(model_class, name).label(name)
+                    for name in pk_names]
+        selected.extend([column.label(column.key) for column in extra_columns
+                         if column.key not in pk_names])
+        formatters = []
+        for i, name in enumerate(names):
+            if columns:
+                expression, formatter = getattr(model_class, name), \
+                    _identity
+            else:
+                expression, formatter = self._list_column_expression(
+                    model_class, name)
+            selected.append(expression.label('list_column_%d' % i))
+            formatters.append(formatter)
+
+        def make_item(row):
+            values = row[len(row) - len(names):]
+            return util.ListRow(
+                list(row[:len(pk_names)]),
+                [formatter(value)
+                 for formatter, value in zip(formatters, values)])
+
+        return self.db_session.query(*selected), make_item
+
+    def _list_column_expression(self, model_class, name):
+        """Returns an (expression, formatter) tuple for selecting a
+        list column: long text is truncated by the database and binary
+        columns are replaced by their length, so neither has to be
+        sent over the wire in full.
+        """
+        attribute = getattr(model_class, name, None)
+        prop = getattr(attribute, 'property', None)
+        if not isinstance(prop, sa.orm.properties.ColumnProperty):
+            raise TypeError('%s.%s is not a column, so it cannot be used '
+                            'as a list column' % (model_class.__name__, name))
+        column_type = prop.columns[0].type
+        length = self.list_text_length
+
+        if isinstance(column_type, sa.types.LargeBinary):
+            return sa.func.length(attribute), _format_byte_length
+        if isinstance(column_type, sa.types.String) and length and \
+               (not column_type.length or column_type.length > length):
+            # select one extra character so we know if it was truncated
+            return (sa.func.substr(attribute, 1, length + 1),
+                    lambda value: util.truncate(value, length))
+        return attribute, _identity
+
+    def _get_keyset_columns(self, model_name, sort=None):
+        """Returns the list of mapped column attributes that keyset
+        pagination pages on for a given model: the `sort` column or
+        the configured keyset columns, followed by any primary key
+        columns not already included.
+        """
+        if sort:
+            return self._get_order_columns(model_name, sort)
+        model_class = self.get_model_class(model_name)
+        names = list(self.keyset_columns.get(model_name, []))
+        names.extend([name for name in _get_pk_names(model_class)
+                      if name not in names])
+        return [getattr(model_class, name) for name in names]
+
+    #: the PostgreSQL text search configuration used for searches
+    search_config = 'english'
+
+    def _search_query(self, model_name, query, search):
+        """Returns a (query, rank_order) tuple, where the query only
+        matches rows that match the `search` text according to the
+        full-text index of a given model and rank_order is a list of
+        order by clauses that put the best matches first.
+        """
+        model_class = self.get_model_class(model_name)
+        model_mapper = sa.orm.class_mapper(model_class)
+        table = model_mapper.local_table
+        columns = self._get_search_table_columns(model_name)
+        dialect = self.db_session.get_bind(model_mapper).dialect
+        no_match = sa.literal_column('0') == 1
+
+        if dialect.name == 'sqlite':
+            words = _search_words(search)
+            if not words:
+                return query.filter(no_match), []
+            # quote each word so it can't be taken for query syntax,
+            # and match the last one as a prefix
+            match = u' '.join([u'"%s"' % word for word in words]) + u'*'
+            fts_name = _fts_table_name(table)
+            # the index isn't built here, since that would make a
+            # search request copy the whole table
+            if not _sqlite_table_exists(self.db_session, fts_name):
+                raise ValueError('%s has no search index, see '
+                                 'create_search_index()' % model_name)
+            fts_table = sa.sql.table(fts_name, sa.sql.column('rowid'),
+                                     sa.sql.column('rank'))
+            matches = sa.select(
+                [fts_table.c.rowid, fts_table.c.rank],
+                sa.literal_column(fts_name).op('MATCH')(match)).\
+                alias('search_matches')
+            rowid_column = getattr(
+                model_class, model_mapper.get_property_by_column(
+                    _get_search_rowid_column(model_class)).key)
+            query = query.join(matches, matches.c.rowid == rowid_column)
+            return query, [matches.c.rank.asc()]
+
+        if dialect.name == 'postgresql':
+            document = _tsvector(self.search_config, _search_document(
+                [getattr(model_class, model_mapper.get_property_by_column(
+                    column).key) for column in columns]))
+            tsquery = sa.func.plainto_tsquery(
+                sa.literal_column("'%s'" % self.search_config), search)
+            return (query.filter(document.op('@@')(tsquery)),
+                    [sa.func.ts_rank(document, tsquery).desc()])
+
+        if dialect.name == 'mysql':
+            preparer = dialect.identifier_preparer
+            relevance = sa.text(
+                'MATCH (%s) AGAINST (:search IN NATURAL LANGUAGE MODE)' %
+                ', '.join(['%s.%s' % (preparer.format_table(table),
+                                      preparer.quote_identifier(column.name))
+                           for column in columns]),
+                bindparams=[sa.bindparam('search', search)])
+            return query.filter(relevance), [sa.desc(relevance)]
+
+        raise NotImplementedError(
+            'full-text search is not supported on %s' % dialect.name)
+
+    def _get_search_table_columns(self, model_name):
+        """Returns the table columns of the search columns of a given
+        model. Raises a ValueError if the model can't be searched.
+        """
+        model_class = self.get_model_class(model_name)
+        names = self.get_search_columns(model_name)
+        if not names:
+            raise ValueError('%s cannot be searched' % model_name)
+        return [getattr(model_class, name).property.columns[0]
+                for name in names]
+
+    def _sync_search_indexes(self, session, flush_context):
+        """Session ``after_flush`` listener that brings the SQLite FTS5
+        tables of the searchable models up to date with the rows that
+        were just inserted, updated or deleted.
+        """
+        searched = dict([(self.get_model_class(model_name), model_name)
+                         for model_name in self.search_columns])
+        changes = {}
+        for instances, change in ((session.new, 'new'),
+                                  (session.dirty, 'dirty'),
+                                  (session.deleted, 'deleted')):
+            for instance in instances:
+                model_name = searched.get(type(instance))
+                if model_name is None:
+                    continue
+                if change == 'dirty' and not [
+                        name for name in self.search_columns[model_name]
+                        if sa.orm.attributes.get_history(
+                            instance, name).has_changes()]:
+                    continue
+                removed, added = changes.setdefault(model_name, ([], []))
+                if change != 'new':
+                    removed.append(instance)
+                if change != 'deleted':
+                    added.append(instance)
+
+        for model_name, (removed, added) in changes.items():
+            model_class = self.get_model_class(model_name)
+            connection = session.connection(
+                mapper=sa.orm.class_mapper(model_class))
+            table = sa.orm.class_mapper(model_class).local_table
+            if connection.dialect.name != 'sqlite' or \
+                   not _sqlite_table_exists(connection,
+                                            _fts_table_name(table)):
+                # the index will be filled from the table once it is
+                # created, and other databases index the table itself
+                continue
+
+            preparer = connection.dialect.identifier_preparer
+            fts_table = preparer.quote_identifier(_fts_table_name(table))
+            rowid_key = sa.orm.class_mapper(model_class).\
+                get_property_by_column(_get_search_rowid_column(model_class)).key
+            names = self.search_columns[model_name]
+            if removed:
+                _delete_from_fts_table(connection, table,
+                                       [getattr(instance, rowid_key)
+                                        for instance in removed])
+            if added:
+                columns = self._get_search_table_columns(model_name)
+                connection.execute(
+                    sa.text('INSERT INTO %s (rowid, %s) VALUES (:rowid, %s)' % (
+                        fts_table,
+                        ', '.join([preparer.quote_identifier(column.name)
+                                   for column in columns]),
+                        ', '.join([':c%d' % i for i in range(len(names))]))),
+                    [dict([('rowid', getattr(instance, rowid_key))] +
+                          [('c%d' % i, getattr(instance, name))
+                           for i, name in enumerate(names)])
+                     for instance in added])
+
+    def _filter_query(self, model_name, query, filters=None):
+        """Returns a query with `filters` applied. Raises a ValueError
+        if a filter is on a column that can't be filtered, uses an
+        unknown operator or has a value that can't be coerced to the
+        type of its column.
+        """
+        if not filters:
+            return query
+
+        model_class = self.get_model_class(model_name)
+        filter_names = [name for name, kind in
+                        self.get_filter_columns(model_name)]
+        for name, operator, value in filters:
+            if name not in filter_names:
+                raise ValueError('%s cannot be filtered by %r' % (
+                    model_name, name))
+            column = getattr(model_class, name)
+            if operator == 'eq':
+                criterion = column == _coerce_value(column, value)
+            elif operator == 'in':
+                criterion = column.in_([_coerce_value(column, item)
+                                        for item in value.split(',')])
+            elif operator == 'gte':
+                criterion = column >= _coerce_value(column, value)
+            elif operator == 'lt':
+                criterion = column < _coerce_value(column, value)
+            elif operator == 'null':
+                if _coerce_bool(value):
+                    criterion = column == None
+                else:
+                    criterion = column != None
+            else:
+                raise ValueError('unknown filter operator: %r' % operator)
+            query = query.filter(criterion)
+        return query
+
+    def _get_order_columns(self, model_name, sort=None):
+        """Returns the list of mapped column attributes to order the
+        list of a model by: the `sort` column, if given, followed by
+        the primary key columns. Raises a ValueError if the model
+        can't be sorted by the `sort` column.
+        """
+        model_class = self.get_model_class(model_name)
+        names = []
+        if sort:
+            if sort not in self.get_sortable_columns(model_name):
+                raise ValueError('%s cannot be sorted by %r' % (
+                    model_name, sort))
+            names.append(sort)
+        names.extend([name for name in _get_pk_names(model_class)
+                      if name not in names])
+        return [getattr(model_class, name) for name in names]
+
+
+class LazyLoadWarning(UserWarning):
+    """Warning issued in debug mode when rendering the list view
+    lazily loads relationships.
+    """
+
+
+_eager_loaders = {
+    'joined': sa.orm.joinedload,
+    'subquery': sa.orm.subqueryload,
+    'selectin': getattr(sa.orm, 'selectinload', sa.orm.subqueryload),
+}
+
+
+def _session_event_target(db_session):
+    """Returns what session event listeners should be attached to for
+    a given session: the session factory of a scoped session (unwrapped
+    if it is a partial, as with Flask-SQLAlchemy), otherwise the
+    session itself.
+    """
+    target = getattr(db_session, 'session_factory', db_session)
+    if isinstance(target, partial):
+        target = target.func
+    return target
+
+
+def _fts_table_name(table):
+    return '%s_fts' % table.name
+
+
+def _search_index_name(table):
+    """Returns the name of the full-text index of a table on
+    PostgreSQL and MySQL.
+    """
+    return 'ix_%s_search' % table.name
+
+
+def _search_index_exists(connection, table):
+    """Returns True if the full-text index of a table exists: the FTS5
+    table on SQLite, or the index created by
+    :meth:`SQLAlchemyDatastore.create_search_index` on PostgreSQL and
+    MySQL. Always False on other databases.
+    """
+    dialect_name = connection.dialect.name
+    if dialect_name == 'sqlite':
+        return _sqlite_table_exists(connection, _fts_table_name(table))
+    if dialect_name == 'postgresql':
+        return connection.execute(
+            sa.text('SELECT 1 FROM pg_indexes WHERE indexname = :name'),
+            name=_search_index_name(table)).scalar() is not None
+    if dialect_name == 'mysql':
+        return connection.execute(
+            sa.text('SELECT 1 FROM information_schema.statistics '
+                    'WHERE table_schema = DATABASE() '
+                    'AND table_name = :table AND index_name = :name '
+                    'LIMIT 1'),
+            table=table.name, name=_search_index_name(table)).scalar() \
+            is not None
+    return False
+
+
+def _sqlite_table_exists(connection, name):
+    """Returns True if a table with a given name exists in a SQLite
+    database. `connection` can be a connection or a session.
+    """
+    return connection.execute(
+        sa.text("SELECT 1 FROM sqlite_master WHERE type = 'table' "
+                "AND name = :name"), {'name': name}).scalar() is not None
+
+
+def _get_search_rowid_column(model_class):
+    """Returns the primary key column of a model that is used as the
+    rowid of its SQLite FTS5 table. Raises a TypeError if the model
+    doesn't have a single integer primary key.
+    """
+    pk_columns = sa.orm.class_mapper(model_class).primary_key
+    if len(pk_columns) != 1 or \
+           not isinstance(pk_columns[0].type, sa.types.Integer):
+        raise TypeError('%s needs a single integer primary key to be '
+                        'searched on SQLite' % model_class.__name__)
+    return pk_columns[0]
+
+
+def _delete_from_fts_table(connection, table, rowids):
+    fts_table = connection.dialect.identifier_preparer.quote_identifier(
+        _fts_table_name(table))
+    connection.execute(
+        sa.text('DELETE FROM %s WHERE rowid = :rowid' % fts_table),
+        [{'rowid': rowid} for rowid in rowids])
+
+
+def _search_words(search):
+    """Returns the words of a search text."""
+    return re.findall(r'\w+', search, re.UNICODE)
+
+
+def _search_document(columns):
+    """Returns an expression that joins the values of the search
+    columns with spaces, treating NULLs as empty. Literal strings are
+    used rather than bound parameters so the expression is the same
+    as the one the search index is created on.
+    """
+    empty = sa.literal_column("''")
+    space = sa.literal_column("' '")
+    document = sa.func.coalesce(columns[0], empty)
+    for column in columns[1:]:
+        document = document.op('||')(space).op('||')(
+            sa.func.coalesce(column, empty))
+    return document
+
+
+def _tsvector(config, document):
+    return sa.func.to_tsvector(sa.literal_column("'%s'" % config), document)
+
+
+def _identity(value):
+    return value
+
+
+def _format_byte_length(length):
+    if length is None:
+        return None
+    return u'%d bytes' % length
+
+
+class ExactCount(object):
+    """Count strategy that counts the rows exactly, with a lean
+    ``SELECT count(pk)`` rather than counting a subquery that selects
+    every column of the model.
+    """
+    def count(self, db_session, model_class, query, filtered=False):
+        """Returns a (total, exact) tuple for a given query, or None
+        if the rows shouldn't be counted. `filtered` is True if the
+        query has been filtered by the list view.
+        """
+        return _lean_count(query, model_class), True
+
+
+class CachedCount(ExactCount):
+    """Count strategy that counts the rows exactly, but caches the
+    count for `ttl` seconds. The list view may show a slightly
+    stale total in exchange for only counting once per `ttl`.
+    """
+    def __init__(self, ttl=60):
+        self.ttl = ttl
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    def count(self, db_session, model_class, query, filtered=False):
+        statement = query.statement.compile()
+        key = (model_class, unicode(statement),
+               tuple(sorted(statement.params.items())))
+        now = time.time()
+
+        cached = self._cache.get(key)
+        if cached and cached[0] > now:
+            return cached[1]
+
+        result = super(CachedCount, self).count(
+            db_session, model_class, query, filtered)
+        self._lock.acquire()
+        try:
+            # expired entries are only dropped as the cache grows
+            # so they don't pile up for queries that aren't repeated
+            if len(self._cache) > 1000:
+                self._cache = dict((k, v) for k, v in self._cache.items()
+                                   if v[0] > now)
+            self._cache[key] = (now + self.ttl, result)
+        finally:
+            self._lock.release()
+        return result
+
+
+class EstimatedCount(ExactCount):
+    """Count strategy that uses the row count estimate from the
+    database statistics instead of counting: ``pg_class.reltuples`` on
+    PostgreSQL, ``information_schema.tables`` on MySQL and the
+    ``sqlite_stat1`` table (populated by ``ANALYZE``) on SQLite.
+
+    If no estimate is available, or the estimate is below
+    `exact_below` rows, the rows are counted exactly instead since
+    that is cheap for small tables and estimates for them tend to be
+    poor. Filtered queries are always counted exactly since the table
+    statistics can't tell how many rows match the filters.
+    """
+    def __init__(self, exact_below=10000):
+        self.exact_below = exact_below
+
+    def count(self, db_session, model_class, query, filtered=False):
+        estimate = None
+        if not filtered:
+            try:
+                estimate = _estimate_row_count(db_session, model_class)
+            except sa.exc.DBAPIError:
+                # e.g. SQLite before the first ANALYZE; the error
+                # leaves the session's transaction usable
+                pass
+
+        if estimate is None or estimate < self.exact_below:
+            return super(EstimatedCount, self).count(
+                db_session, model_class, query, filtered)
+        return estimate, False
+
+
+class NoCount(object):
+    """Count strategy that doesn't count rows at all. The list view
+    will only know whether there is a next page, not how many pages
+    there are.
+    """
+    def count(self, db_session, model_class, query, filtered=False):
+        return None
 
-def _form_for_model(model_class, db_session, exclude=None, exclude_pk=True):
+
+_exact_count = ExactCount()
+
+
+def _lean_count(query, model_class):
+    """Returns the number of rows matched by a query, counting the
+    first primary key column instead of wrapping the query in a
+    subquery.
+    """
+    pk_column = getattr(model_class, _get_pk_names(model_class)[0])
+    return query.with_entities(sa.func.count(pk_column)).\
+        order_by(None).scalar()
+
+
+def _estimate_row_count(db_session, model_class):
+    """Returns the estimated number of rows in the table of a model
+    class according to the database statistics, or None if no
+    estimate is available.
+    """
+    model_mapper = sa.orm.class_mapper(model_class)
+    table = model_mapper.local_table
+    bind = db_session.get_bind(model_mapper)
+    dialect = bind.dialect.name
+
+    if dialect == 'postgresql':
+        # an error (e.g. for a table that isn't in the search path)
+        # aborts the whole transaction on PostgreSQL, so the estimate
+        # is read in a savepoint that can be rolled back
+        connection = db_session.connection(mapper=model_mapper)
+        savepoint = connection.begin_nested()
+        try:
+            estimate = connection.execute(
+                sa.text('SELECT reltuples FROM pg_class '
+                        'WHERE oid = CAST(:table AS regclass)'),
+                {'table': table.fullname}).scalar()
+        except sa.exc.DBAPIError:
+            savepoint.rollback()
+            raise
+        savepoint.commit()
+    elif dialect == 'mysql':
+        estimate = db_session.execute(
+            sa.text('SELECT table_rows FROM information_schema.tables '
+                    'WHERE table_schema = DATABASE() '
+                    'AND table_name = :table'),
+            {'table': table.name}).scalar()
+    elif dialect == 'sqlite':
+        stat = db_session.execute(
+            sa.text('SELECT stat FROM sqlite_stat1 WHERE tbl = :table '
+                    'LIMIT 1'),
+            {'table': table.name}).scalar()
+        estimate = stat and stat.split()[0]
+    else:
+        return None
+
+    if not estimate or int(estimate) <= 0:
+        return None
+    return int(estimate)
+
+
+def _form_for_model(model_class, db_session, exclude=None, exclude_pk=True,
+                    lookup_columns=None, choice_cache=None):
     """Return a form for a given model. This will be a form generated
     by wtforms.ext.sqlalchemy.model_form, but decorated with a
     QuerySelectField for foreign keys.
@@ -190,11 +1705,74 @@ def _form_for_model(model_class, db_session, exclude=None, exclude_pk=True):
                                   sa.orm.properties.RelationshipProperty)
                     and relationship.local_side[0].name not in pk_names])
     form = model_form(model_class, exclude=exclude,
-                      converter=AdminConverter(db_session))
+                      converter=AdminConverter(db_session, lookup_columns,
+                                               choice_cache))
+
+    return form
+
+
+_import_forms = {}
+
 
+def _import_form_for_model(model_class):
+    """Returns the form that rows of a given model are validated
+    against when importing: a form of the model's columns, converted
+    like the add and edit forms but including foreign keys and an
+    optional primary key instead of relationships. Forms are cached per
+    model class, so each process only generates them once.
+    """
+    form = _import_forms.get(model_class)
+    if form is None:
+        model_mapper = sa.orm.class_mapper(model_class)
+        exclude = [prop.key for prop in model_mapper.iterate_properties
+                   if isinstance(prop, sa.orm.properties.RelationshipProperty)]
+        field_args = dict([(name, {'validators': [validators.Optional()]})
+                           for name in _get_pk_names(model_class)])
+        kwargs = {}
+        if 'exclude_fk' in inspect.getargspec(model_form)[0]:
+            kwargs.update(exclude_fk=False, exclude_pk=False)
+        form = model_form(model_class, exclude=exclude,
+                          field_args=field_args,
+                          converter=AdminConverter(None), **kwargs)
+        _import_forms[model_class] = form
     return form
 
 
+def _describe_schema(model_class):
+    """Returns a JSON serializable description of everything about a
+    model's mapper and columns that form generation depends on, for
+    fingerprinting.
+    """
+    model_mapper = sa.orm.class_mapper(model_class)
+    schema = []
+    for prop in model_mapper.iterate_properties:
+        if isinstance(prop, sa.orm.properties.ColumnProperty):
+            schema.append(['column', prop.key, [
+                [column.name, repr(column.type), column.nullable,
+                 column.primary_key,
+                 _describe_default(getattr(column, 'default', None)),
+                 sorted([foreign_key.target_fullname
+                         for foreign_key in column.foreign_keys])]
+                for column in prop.columns]])
+        elif isinstance(prop, sa.orm.properties.RelationshipProperty):
+            schema.append(['relationship', prop.key, str(prop.direction),
+                           '%s:%s' % (prop.mapper.class_.__module__,
+                                      prop.mapper.class_.__name__),
+                           [[local.name, local.nullable] for local, remote
+                            in prop.local_remote_pairs]])
+    return schema
+
+
+def _describe_default(default):
+    if default is None:
+        return None
+    arg = default.arg
+    if callable(arg):
+        return 'callable:%s.%s' % (getattr(arg, '__module__', ''),
+                                   getattr(arg, '__name__', ''))
+    return repr(arg)
+
+
 def _get_pk_names(model):
     """Return the primary key attribute names for a given model
     (either instance or class).
@@ -206,24 +1784,522 @@ def _get_pk_names(model):
                 prop.columns[0].primary_key]
 
 
-def _query_factory_for(model_class, db_session):
+def _get_secondary_key_columns(model_mapper):
+    """Returns a list of (association table, columns) tuples for the
+    many-to-many relationships of a mapper, where the columns are the
+    association table's columns for the primary key columns, in
+    order. Deleting rows of the model with a bulk delete needs to
+    delete these association rows too. Returns None if deleting rows
+    of the model needs more than that from the ORM: one-to-many
+    relationships (whose foreign keys the ORM would set to NULL),
+    delete cascades, or association tables that don't refer to the
+    primary key.
+    """
+    secondaries = []
+    for prop in model_mapper.iterate_properties:
+        if not isinstance(prop, sa.orm.properties.RelationshipProperty) or \
+               prop.viewonly:
+            continue
+        if prop.cascade.delete or \
+               prop.direction is sa.orm.interfaces.ONETOMANY:
+            return None
+        if prop.secondary is None:
+            continue
+        pairs = dict(prop.synchronize_pairs)
+        if set(pairs) != set(model_mapper.primary_key):
+            return None
+        secondaries.append(
+            (prop.secondary,
+             [pairs[column] for column in model_mapper.primary_key]))
+    return secondaries
+
+
+def _keys_criterion(columns, keys):
+    """Returns a criterion that matches the rows whose values for
+    `columns` are one of `keys`, each a tuple of values.
+    """
+    if len(columns) == 1:
+        return columns[0].in_([key[0] for key in keys])
+    return sa.or_(*[sa.and_(*[column == value
+                              for column, value in zip(columns, key)])
+                    for key in keys])
+
+
+def _order_by(columns, descending=False):
+    """Returns order by clauses for a list of columns. NULLs are left
+    wherever the database sorts them, so an index on the columns can
+    still serve the ordering; see :func:`_nulls_sort_first`.
+    """
+    if descending:
+        return [column.desc() for column in columns]
+    return [column.asc() for column in columns]
+
+
+#: dialects that sort NULLs after any other value in ascending order
+_NULLS_LAST_DIALECTS = ('postgresql', 'oracle')
+
+
+def _nulls_sort_first(dialect):
+    """Returns True if a database sorts NULLs before any other value
+    in ascending order (and so after them in descending order), as
+    SQLite, MySQL and SQL Server do. PostgreSQL and Oracle sort them
+    last instead.
+    """
+    return dialect.name not in _NULLS_LAST_DIALECTS
+
+
+def _seek_criterion(columns, values, reverse=False, nulls_first=True):
+    """Returns a criterion that matches rows whose keys come after
+    `values` in the ordering given by `columns` (or before, if
+    `reverse` is True). This is the expanded form of a row value
+    comparison like ``(a, b) > (1, 2)``, which not every database
+    supports. NULLs come before any other value if `nulls_first` is
+    True and after them otherwise, to match the database's ordering
+    in :func:`_order_by`.
+    """
+    # seeking backwards past NULLs that sort first is the same as
+    # seeking forwards past NULLs that sort last
+    nulls_before = nulls_first != reverse
+    clauses = []
+    for i, (column, value) in enumerate(zip(columns, values)):
+        # comparing to None gives IS NULL
+        equal = [prev_column == prev_value for prev_column, prev_value
+                 in zip(columns[:i], values[:i])]
+        if value is None:
+            if not nulls_before:
+                # nothing but other NULLs comes past NULL
+                continue
+            equal.append(column != None)
+        else:
+            if reverse:
+                beyond = column < value
+            else:
+                beyond = column > value
+            if not nulls_before and _is_nullable(column):
+                beyond = sa.or_(beyond, column == None)
+            equal.append(beyond)
+        clauses.append(sa.and_(*equal))
+    if not clauses:
+        return sa.literal_column('0') == 1
+    return sa.or_(*clauses)
+
+
+def _is_nullable(column):
+    """Returns True if a (mapped) column can hold NULLs."""
+    if hasattr(column, 'property'):
+        column = column.property.columns[0]
+    return bool(getattr(column, 'nullable', False))
+
+
+def _coerce_value(column, value):
+    """Coerce a raw value that came from a url parameter or a
+    pagination cursor to the python type of a given column, so it can
+    be compared against the column without defeating any index on
+    it.
+    """
+    if value is None:
+        return None
+
+    if hasattr(column, 'property'):
+        column = column.property.columns[0]
+    column_type = column.type
+
+    if isinstance(column_type, sa.types.DateTime):
+        return util.parse_datetime(value)
+    if isinstance(column_type, sa.types.Date):
+        return util.parse_datetime(value).date()
+    if isinstance(column_type, sa.types.Time):
+        return util.parse_datetime(value, ('%H:%M:%S.%f', '%H:%M:%S',
+                                       '%H:%M')).time()
+    if isinstance(column_type, sa.types.Boolean):
+        return _coerce_bool(value)
+    if isinstance(column_type, sa.types.Integer):
+        return int(value)
+    if isinstance(column_type, sa.types.Numeric):
+        if column_type.asdecimal:
+            try:
+                return decimal.Decimal(unicode(value).strip())
+            except decimal.InvalidOperation:
+                raise ValueError('invalid decimal value: %r' % value)
+        return float(value)
+    if isinstance(column_type, sa.types.String):
+        return unicode(value)
+    return value
+
+
+def _coerce_bool(value):
+    if isinstance(value, basestring):
+        return value.lower() in ('1', 'true', 'yes', 'on')
+    return bool(value)
+
+
+def _filter_kind(column):
+    """Returns the kind of filter input a column needs in the list
+    view.
+    """
+    column_type = column.property.columns[0].type
+    if isinstance(column_type, sa.types.DateTime):
+        return 'datetime'
+    if isinstance(column_type, sa.types.Date):
+        return 'date'
+    if isinstance(column_type, sa.types.Time):
+        return 'time'
+    if isinstance(column_type, sa.types.Boolean):
+        return 'boolean'
+    if isinstance(column_type, (sa.types.Integer, sa.types.Numeric)):
+        return 'number'
+    return 'text'
+
+
+def _get_indexed_column_names(model_class):
+    """Returns the attribute names of the columns of a model class
+    that lead an index, primary key or unique constraint according to
+    the table metadata. Sorting on these columns can use an index.
+    """
+    model_mapper = sa.orm.class_mapper(model_class)
+    indexed = set()
+    for table in model_mapper.tables:
+        for index in table.indexes:
+            indexed.add(list(index.columns)[0])
+        for constraint in table.constraints:
+            if isinstance(constraint, (sa.PrimaryKeyConstraint,
+                                       sa.UniqueConstraint)) and \
+                   len(constraint.columns):
+                indexed.add(list(constraint.columns)[0])
+        for column in table.columns:
+            if column.index or column.unique:
+                indexed.add(column)
+
+    return [prop.key for prop in model_mapper.iterate_properties
+            if isinstance(prop, sa.orm.properties.ColumnProperty)
+            and prop.columns[0] in indexed]
+
+
+class ChoiceCache(object):
+    """Caches the choices of relationship select fields: the instances
+    of a related model, sorted by their ``__repr__``. `max_sizes` is a
+    dict with model names as keys matched to the most rows to cache
+    for that model; the choices of other models, or of models with
+    more rows than that, are queried every time.
+
+    Cached instances are loaded with a session of their own and kept
+    detached, and :meth:`get_choices` merges them into the datastore's
+    session without querying the database. Choices expire after `ttl`
+    seconds, and the datastore drops them with :meth:`invalidate` when
+    its session changes their table.
+    """
+    def __init__(self, db_session, max_sizes, ttl=300):
+        self.db_session = db_session
+        self.max_sizes = max_sizes
+        self.ttl = ttl
+        self._choices = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get_choices(self, model_class):
+        """Returns the sorted instances of a model class, in the
+        datastore's session.
+        """
+        max_size = self.max_sizes.get(model_class.__name__)
+        if max_size is None:
+            return _sorted_choices(self.db_session.query(model_class))
+
+        now = time.time()
+        cached = self._choices.get(model_class)
+        if cached is None or cached[0] <= now:
+            generation = self._generation
+            cached = (now + self.ttl, self._load(model_class, max_size))
+            self._lock.acquire()
+            try:
+                # don't keep choices loaded before an invalidation
+                if generation == self._generation:
+                    self._choices[model_class] = cached
+            finally:
+                self._lock.release()
+
+        instances = cached[1]
+        if instances is None:
+            # too many rows to cache
+            return _sorted_choices(self.db_session.query(model_class))
+        return _merge_choices(self.db_session, model_class, instances)
+
+    def has_choices(self, model_class):
+        """Returns True if the choices of a model class are cached and
+        haven't expired.
+        """
+        cached = self._choices.get(model_class)
+        return cached is not None and cached[1] is not None and \
+            cached[0] > time.time()
+
+    def _load(self, model_class, max_size):
+        """Returns the sorted, detached instances of a model class, or
+        None if there are more than `max_size` of them. They are
+        loaded on the datastore session's connection, by a session in
+        autocommit mode so that closing it doesn't end the datastore
+        session's transaction.
+        """
+        connection = self.db_session.connection(
+            mapper=sa.orm.class_mapper(model_class))
+        session = sa.orm.Session(bind=connection, autocommit=True)
+        try:
+            instances = session.query(model_class).limit(max_size + 1).all()
+            if len(instances) > max_size:
+                return None
+            return sorted(instances, key=repr)
+        finally:
+            session.close()
+
+    def invalidate(self, tables=None):
+        """Drops the cached choices of the models mapped to any of
+        `tables`, or of every model if no tables are given.
+        """
+        self._lock.acquire()
+        try:
+            self._generation += 1
+            for model_class in self._choices.keys():
+                if tables is None or tables.intersection(
+                        sa.orm.class_mapper(model_class).tables):
+                    del self._choices[model_class]
+        finally:
+            self._lock.release()
+
+
+
+def _sorted_choices(query):
+    return sorted(query.all(), key=repr)
+
+
+def _get_changed_tables(model_mapper):
+    """Returns the tables that a flush of an instance of a mapper may
+    change: the mapper's own tables and the association tables of its
+    many-to-many relationships.
+    """
+    tables = set(model_mapper.tables)
+    for prop in model_mapper.iterate_properties:
+        if isinstance(prop, sa.orm.properties.RelationshipProperty) and \
+               prop.secondary is not None:
+            tables.add(prop.secondary)
+    return tables
+
+
+def _get_version_tables(model_class):
+    """Returns the tables whose changes change what the list and edit
+    views show for a model class: its own tables, the association
+    tables of its relationships and the tables of its related models,
+    in a stable order.
+    """
+    model_mapper = sa.orm.class_mapper(model_class)
+    tables = _get_changed_tables(model_mapper)
+    for prop in model_mapper.iterate_properties:
+        if isinstance(prop, sa.orm.properties.RelationshipProperty):
+            tables.update(prop.mapper.tables)
+    return sorted(tables, key=lambda table: table.fullname)
+
+
+def _load_detached_choices(task):
+    """Returns the sorted instances of a model class, loaded with a
+    session of their own on a given bind and then detached. `task` is
+    a (bind, model class) tuple.
+    """
+    bind, model_class = task
+    session = sa.orm.Session(bind=bind)
+    try:
+        return _sorted_choices(session.query(model_class))
+    finally:
+        session.close()
+
+
+def _merge_choices(db_session, model_class, instances):
+    """Returns the instances in a session for a list of detached
+    instances of a model class, merging those that aren't in the
+    session yet without querying the database.
+    """
+    model_mapper = sa.orm.class_mapper(model_class)
+    identity_map = db_session.identity_map
+    choices = []
+    for instance in instances:
+        existing = identity_map.get(
+            model_mapper.identity_key_from_instance(instance))
+        if existing is None:
+            existing = db_session.merge(instance, load=False)
+        choices.append(existing)
+    return choices
+
+
+def _has_thread_connections(bind):
+    """Returns True if a bind is an engine whose pool gives each
+    thread a connection of its own.
+    """
+    pool = getattr(bind, 'pool', None)
+    return pool is not None and not isinstance(
+        pool, (sa.pool.SingletonThreadPool, sa.pool.StaticPool))
+
+
+def _query_factory_for(model_class, db_session, choice_cache=None):
     """Return a query factory for a given model_class. This gives us
     an all-purpose way of generating query factories for
-    QuerySelectFields.
+    QuerySelectFields. The choices come from `choice_cache`, if
+    given.
     """
     def query_factory():
-        return sorted(db_session.query(model_class).all(), key=repr)
+        if choice_cache is not None:
+            return choice_cache.get_choices(model_class)
+        return _sorted_choices(db_session.query(model_class))
+
+    query_factory.model_class = model_class
 
+    query_factory._form_cache_spec = [
+        'query_factory', '%s:%s' % (model_class.__module__,
+                                    model_class.__name__)]
     return query_factory
 
 
+def _choice_label(instance):
+    """Returns the label of a relationship select box option: the text
+    of the related instance, whatever WTForms' default label is.
+    """
+    return unicode(instance)
+
+_choice_label._form_cache_spec = ['choice_label', None]
+
+
+def _lookup_query_for(model_class, db_session):
+    """Returns a function that returns a query of a given model class,
+    for the lookup select fields.
+    """
+    def lookup_query():
+        return db_session.query(model_class)
+
+    lookup_query._form_cache_spec = [
+        'lookup_query', '%s:%s' % (model_class.__module__,
+                                   model_class.__name__)]
+    return lookup_query
+
+
+def _format_key(values):
+    """Returns the option value for a model instance's primary key
+    values.
+    """
+    return u':'.join([unicode(value) for value in values])
+
+
+def _prefix_criterion(column, prefix):
+    """Returns a criterion that matches the rows whose values of a
+    text column start with `prefix`. This is written as a range
+    (``column >= 'ab' AND column < 'ac'``) rather than with LIKE
+    because a range can use an index on the column with any collation.
+    """
+    last = ord(prefix[-1])
+    if last == sys.maxunicode:
+        return column >= prefix
+    return sa.and_(column >= prefix,
+                   column < prefix[:-1] + unichr(last + 1))
+
+
+class LookupSelectField(wtf_fields.Field):
+    """A select field for a many-to-one relationship whose options are
+    looked up remotely (see :class:`RemoteSelectWidget`) instead of
+    being rendered into the page. `query_factory` should return a
+    query of `model_class`, which is used to find the selected
+    instance when the form is submitted, and instances are labelled
+    by their `label_column`. The form data is the primary key of the
+    selected instance, with the values of multi-column keys separated
+    by colons.
+    """
+    widget = RemoteSelectWidget()
+
+    def __init__(self, label=None, validators=None, model_class=None,
+                 query_factory=None, label_column=None, lookup_args=None,
+                 allow_blank=False, **kwargs):
+        super(LookupSelectField, self).__init__(label, validators, **kwargs)
+        self.model_class = model_class
+        self.query_factory = query_factory
+        self.label_column = label_column
+        self.lookup_args = lookup_args or {}
+        self.allow_blank = allow_blank
+        self._missing = False
+
+    def iter_choices(self):
+        if self.allow_blank:
+            yield (u'__None', u'', self.data is None)
+        if self.data is not None:
+            yield (self._get_key(self.data), self._get_label(self.data), True)
+
+    def process_formdata(self, valuelist):
+        if valuelist:
+            instances = self._find_instances(valuelist[:1])
+            self.data = instances and instances[0] or None
+
+    def pre_validate(self, form):
+        if self._missing or (self.data is None and not self.allow_blank):
+            raise ValueError(u'Not a valid choice')
+
+    def _find_instances(self, keys):
+        """Returns the instances with the given keys, in order. Keys
+        that aren't found are skipped, and set `_missing`.
+        """
+        unique_keys = []
+        for key in keys:
+            if key and key != u'__None' and key not in unique_keys:
+                unique_keys.append(key)
+        if not unique_keys:
+            self._missing = False
+            return []
+
+        pk_columns = list(sa.orm.class_mapper(self.model_class).primary_key)
+        key_values = [tuple(key.split(u':')) for key in unique_keys]
+        key_values = [values for values in key_values
+                      if len(values) == len(pk_columns)]
+        instances = {}
+        if key_values:
+            query = self.query_factory().filter(
+                _keys_criterion(pk_columns, key_values))
+            instances = dict([(self._get_key(instance), instance)
+                              for instance in query])
+        self._missing = len(instances) < len(unique_keys)
+        return [instances[key] for key in unique_keys if key in instances]
+
+    def _get_key(self, instance):
+        return _format_key(sa.orm.object_mapper(instance).
+                           primary_key_from_instance(instance))
+
+    def _get_label(self, instance):
+        return unicode(getattr(instance, self.label_column))
+
+
+class LookupSelectMultipleField(LookupSelectField):
+    """A :class:`LookupSelectField` for many-to-many relationships,
+    whose data is a list of the selected instances.
+    """
+    widget = RemoteSelectWidget(multiple=True)
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault('default', [])
+        super(LookupSelectMultipleField, self).__init__(*args, **kwargs)
+
+    def iter_choices(self):
+        for instance in self.data or []:
+            yield (self._get_key(instance), self._get_label(instance), True)
+
+    def process_formdata(self, valuelist):
+        self.data = self._find_instances(valuelist)
+
+    def pre_validate(self, form):
+        if self._missing:
+            raise ValueError(u'Not a valid choice')
+
+
 class AdminConverter(ModelConverter):
     """Subclass of the wtforms sqlalchemy Model Converter that handles
     relationship properties and uses custom widgets for date and
-    datetime objects.
+    datetime objects. Relationships to models in `lookup_columns` are
+    converted to lookup select fields.
     """
-    def __init__(self, db_session, *args, **kwargs):
+    def __init__(self, db_session, lookup_columns=None, choice_cache=None,
+                 *args, **kwargs):
         self.db_session = db_session
+        self.lookup_columns = lookup_columns or {}
+        self.choice_cache = choice_cache
         super(AdminConverter, self).__init__(*args, **kwargs)
 
     def convert(self, model, mapper, prop, field_args):
@@ -297,17 +2373,38 @@ class AdminConverter(ModelConverter):
             local_column = prop.local_remote_pairs[0][0]
             foreign_model = prop.mapper.class_
 
+            label_column = self.lookup_columns.get(foreign_model.__name__)
+            if label_column and prop.direction in (
+                    sa.orm.properties.MANYTOONE,
+                    sa.orm.properties.MANYTOMANY):
+                if prop.direction == sa.orm.properties.MANYTOONE:
+                    field_class = LookupSelectField
+                else:
+                    field_class = LookupSelectMultipleField
+                return field_class(
+                    prop.key, model_class=foreign_model,
+                    query_factory=_lookup_query_for(foreign_model,
+                                                    self.db_session),
+                    label_column=label_column,
+                    lookup_args={'model_name': model.__name__,
+                                 'field_name': prop.key},
+                    allow_blank=local_column.nullable)
+
             if prop.direction == sa.orm.properties.MANYTOONE:
                 return sa_fields.QuerySelectField(
                     prop.key,
                     query_factory=_query_factory_for(foreign_model,
-                                                     self.db_session),
+                                                     self.db_session,
+                                                     self.choice_cache),
+                    get_label=_choice_label,
                     allow_blank=local_column.nullable)
             if prop.direction == sa.orm.properties.MANYTOMANY:
                 return sa_fields.QuerySelectMultipleField(
                     prop.key,
                     query_factory=_query_factory_for(foreign_model,
-                                                     self.db_session),
+                                                     self.db_session,
+                                                     self.choice_cache),
+                    get_label=_choice_label,
                     allow_blank=local_column.nullable)
 
     @converts('Date')
@@ -20,14 +20,20 @@ $(function(){
         showSecond: true
     });
 
+    $('#list-table input.select-all').change(function(){
+        $('#list-table input[name="model_url_key"]')
+            .attr('checked', $(this).is(':checked'));
+    });
+
     function getLabelFor(id){
         return $('label[for="'+id+'"]').text();
     };
 
-    $('.edit-form select:empty')
+    $('.edit-form select:empty').not('.remote-select')
         .append('<option value="__None"></option>');
 
-    $('.edit-form select > option[value="__None"]:only-child').parent()
+    $('.edit-form select:not(.remote-select)')
+        .children('option[value="__None"]:only-child').parent()
         .attr('disabled', 'disabled')
         .attr('data-placeholder', (
             function(index, attr){
@@ -46,16 +52,103 @@ $(function(){
         .chosen({no_results_text: "No results matched",
                  allow_single_deselect: true});
 
-    $('tr.listed').on('click', function(){
+    // remote selects only render their selected options; look up
+    // the others as the user types in the chosen search field
+    $('.edit-form select.remote-select').each(function(){
+        var select = $(this),
+            search = $('#'+this.id.replace(/(:|\.)/g, '_')+'_chzn input')
+                .first(),
+            lastQuery = null,
+            timer = null;
+
+        search.on('keyup', function(){
+            var query = $.trim(search.val());
+            if (search.hasClass('default') || query === lastQuery){
+                return;
+            }
+            clearTimeout(timer);
+            timer = setTimeout(function(){
+                lastQuery = query;
+                $.getJSON(select.attr('data-lookup-url'), {q: query},
+                          function(data){
+                    if (query !== lastQuery){
+                        return;
+                    }
+                    var shown = {};
+                    select.find('option').each(function(){
+                        if (!this.selected && this.value !== '__None'){
+                            $(this).remove();
+                        } else {
+                            shown[this.value] = true;
+                        }
+                    });
+                    $.each(data.options, function(index, option){
+                        if (!shown[option.value]){
+                            select.append($('<option/>')
+                                          .val(option.value)
+                                          .text(option.label));
+                        }
+                    });
+                    select.trigger('liszt:updated');
+                    // updating chosen clears the search field, so put
+                    // the query back and let chosen filter the results
+                    search.val(query).trigger('keyup');
+                });
+            }, 250);
+        });
+    });
+
+    // clicking a row opens its edit page, except in the cell with the
+    // row's bulk delete checkbox
+    $('#list-table').on('click', 'tr.listed', function(event){
+        var target = $(event.target);
+        if (target.is('input, label') || target.closest('td.select-cell').length){
+            return;
+        }
         window.location = $(this).find('a.edit-link').attr('href');
     });
 
-    $('tr.listed').on('mouseover', function(){
+    $('#list-table').on('mouseover mouseout', 'tr.listed', function(){
         $(this).toggleClass('listed-highlight');
     });
 
-    $('tr.listed').on('mouseout', function(){
-        $(this).toggleClass('listed-highlight');
+    // page through the list in place: fetch just the rows and the
+    // pagination of the next page and swap them in
+    var pagedInPlace = false;
+
+    $('#main').on('click', '.pagination li:not(.disabled, .active) a',
+                  function(event){
+        var href = $(this).attr('href');
+        if (!$('#list-table').length || !href || href === '#'){
+            return;
+        }
+        event.preventDefault();
+        $.get(href, {fragment: 1}, function(html){
+            var fragment = $('<div/>').html(html),
+                rows = fragment.children('table').children('tbody'),
+                pagination = fragment.children('.pagination');
+            if (!rows.length || !pagination.length){
+                window.location = href;
+                return;
+            }
+            $('#list-table tbody').replaceWith(rows);
+            $('.pagination').each(function(){
+                $(this).replaceWith(pagination.clone());
+            });
+            $('#list-table input.select-all').attr('checked', false);
+            if (window.history && history.pushState){
+                history.pushState(null, '', href);
+                pagedInPlace = true;
+            }
+        }).fail(function(){
+            window.location = href;
+        });
+    });
+
+    $(window).on('popstate', function(){
+        if (pagedInPlace){
+            window.location.reload();
+        }
     });
 
 });
\ No newline at end of file
@@ -1,17 +1,52 @@
+import atexit
+import base64
+from cStringIO import StringIO
+import csv
+import datetime
+import hashlib
+from itertools import islice
 import math
+import os
+import tempfile
+
+from flask import json
+from jinja2 import FileSystemBytecodeCache
+from werkzeug.datastructures import MultiDict
+
+
+#: the operators that list view filters can use
+FILTER_OPERATORS = ('eq', 'in', 'gte', 'lt', 'null')
 
 
 # original source:  http://flask.pocoo.org/snippets/44/
 class Pagination(object):
-    def __init__(self, page, per_page, total, items):
+    """Pagination object for the list view. If `exact` is False then
+    `total` is only an estimate, and if `total` is None then the
+    number of rows isn't known at all. In either case `has_more`
+    should say whether there are any rows after this page.
+    """
+    cursor_based = False
+
+    def __init__(self, page, per_page, total, items, exact=True,
+                 has_more=None):
         self.page = page
         self.per_page = per_page
         self.total = total
         self.items = items
+        self.exact = exact and total is not None
+        self.has_more = has_more
 
     @property
     def pages(self):
-        return int(math.ceil(self.total / float(self.per_page)))
+        known_pages = self.page
+        if self.has_more:
+            known_pages += 1
+        if self.total is None:
+            return known_pages
+        pages = int(math.ceil(self.total / float(self.per_page)))
+        if self.exact:
+            return pages
+        return max(pages, known_pages)
 
     @property
     def has_prev(self):
@@ -19,17 +54,492 @@ class Pagination(object):
 
     @property
     def has_next(self):
+        if self.has_more is not None:
+            return self.has_more
         return self.page < self.pages
 
+    @property
+    def prev_num(self):
+        return self.page - 1
+
+    @property
+    def next_num(self):
+        return self.page + 1
+
     def iter_pages(self, left_edge=2, left_current=2,
                    right_current=5, right_edge=2):
         last = 0
-        for num in xrange(1, self.pages + 1):
+        pages = self.pages
+        if not self.exact:
+            # only link to pages that are known to exist
+            pages = self.page + int(bool(self.has_next))
+            right_edge = 0
+        for num in xrange(1, pages + 1):
             if num <= left_edge or \
                (num > self.page - left_current - 1 and \
                 num < self.page + right_current) or \
-               num > self.pages - right_edge:
+               num > pages - right_edge:
                 if last + 1 != num:
                     yield None
                 yield num
                 last = num
+
+
+class KeysetPagination(object):
+    """Pagination object for keyset (a.k.a. seek) pagination. Instead
+    of page numbers, pages are located by opaque cursor tokens that
+    encode the sort key of the first or last row on the neighbouring
+    page, so fetching a page costs the same no matter how deep into
+    the list it is.
+    """
+    cursor_based = True
+    page = None
+    total = None
+
+    def __init__(self, per_page, items, next_cursor=None, prev_cursor=None):
+        self.per_page = per_page
+        self.items = items
+        self.next_cursor = next_cursor
+        self.prev_cursor = prev_cursor
+
+    @property
+    def has_prev(self):
+        return self.prev_cursor is not None
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+
+class StreamedItems(object):
+    """The items of a pagination object that are made from rows as
+    they are read from the database, for streaming the list view, so
+    that they don't all have to be held in memory at once. They can
+    only be iterated over once. The first row is read ahead, so that
+    this can be tested for being empty.
+    """
+    def __init__(self, rows, make_item=None):
+        self._rows = iter(rows)
+        self._make_item = make_item or (lambda row: row)
+        self._read_ahead = None
+
+    def __nonzero__(self):
+        if self._read_ahead is None:
+            self._read_ahead = list(islice(self._rows, 1))
+        return bool(self._read_ahead)
+    __bool__ = __nonzero__
+
+    def __iter__(self):
+        self.__nonzero__()
+        for row in self._read_ahead:
+            yield self._make_item(row)
+        self._read_ahead = []
+        for row in self._rows:
+            yield self._make_item(row)
+
+
+class ListRow(object):
+    """A row of the list view when only some columns of a model are
+    loaded. `keys` are the values that identify the model instance
+    (what the datastore's get_model_keys() would return) and `values`
+    are the values of the list columns, in order.
+    """
+    def __init__(self, keys, values):
+        self.keys = keys
+        self.values = values
+
+    def __repr__(self):
+        return u', '.join([unicode(value) for value in self.values])
+
+
+class StaticFingerprints(object):
+    """Content hashes of the files in a static folder, for
+    fingerprinting their urls. Every file is hashed when this is
+    created. Files are looked up by their path relative to the folder,
+    with forward slashes.
+    """
+    def __init__(self, folder):
+        self.folder = folder
+        self._hashes = {}
+        for dirpath, dirnames, filenames in os.walk(folder):
+            for name in filenames:
+                path = os.path.join(dirpath, name)
+                filename = os.path.relpath(path, folder).replace(os.sep, '/')
+                self._hashes[filename] = (os.path.getmtime(path),
+                                          _hash_file(path))
+
+    def get(self, filename, check_mtime=False):
+        """Returns the fingerprint of a static file, or None if there
+        is no such file. If `check_mtime` is True, the file is hashed
+        again if it has been modified since it was last hashed, which
+        is handy while developing.
+        """
+        hashed = self._hashes.get(filename)
+        if hashed is None or not check_mtime:
+            return hashed and hashed[1]
+
+        path = os.path.join(self.folder, *filename.split('/'))
+        try:
+            mtime = os.path.getmtime(path)
+            if mtime != hashed[0]:
+                hashed = (mtime, _hash_file(path))
+                self._hashes[filename] = hashed
+        except (IOError, OSError):
+            return None
+        return hashed[1]
+
+
+class TemplateBytecodeCache(FileSystemBytecodeCache):
+    """A Jinja bytecode cache in a directory that may be shared by
+    several processes, so that only the first process to load a
+    template after it changes has to compile it. The directory is
+    created if it doesn't exist.
+    """
+    def __init__(self, directory):
+        if not os.path.isdir(directory):
+            try:
+                os.makedirs(directory)
+            except OSError:
+                # another process may have just created it
+                if not os.path.isdir(directory):
+                    raise
+        FileSystemBytecodeCache.__init__(self, directory)
+
+    def dump_bytecode(self, bucket):
+        # write to a temporary file first so other processes never
+        # load partly written bytecode
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            f = os.fdopen(fd, 'wb')
+            try:
+                bucket.write_bytecode(f)
+            finally:
+                f.close()
+            os.rename(temp_path, self._get_cache_filename(bucket))
+        except (IOError, OSError):
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+
+def list_templates(template_folder):
+    """Returns the names of the templates in a template folder."""
+    names = []
+    for dirpath, dirnames, filenames in os.walk(template_folder):
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            names.append(os.path.relpath(path, template_folder).
+                         replace(os.sep, '/'))
+    return sorted(names)
+
+
+def _hash_file(path, chunk_size=65536):
+    """Returns a short hex digest of a file's content."""
+    digest = hashlib.md5()
+    f = open(path, 'rb')
+    try:
+        for chunk in iter(lambda: f.read(chunk_size), ''):
+            digest.update(chunk)
+    finally:
+        f.close()
+    return digest.hexdigest()[:12]
+
+
+def truncate(value, length):
+    """Truncates a text value to `length` characters, marking it with
+    an ellipsis if anything was cut off.
+    """
+    if isinstance(value, basestring) and len(value) > length:
+        return value[:length] + u'\u2026'
+    return value
+
+
+def parse_datetime(value, formats=('%Y-%m-%dT%H:%M:%S.%f',
+                                    '%Y-%m-%dT%H:%M:%S',
+                                    '%Y-%m-%d %H:%M:%S.%f',
+                                    '%Y-%m-%d %H:%M:%S',
+                                    '%Y-%m-%d %H:%M',
+                                    '%Y-%m-%d')):
+    """Parses a string into a datetime, trying each of `formats` in
+    turn. Raises a ValueError if none of them match.
+    """
+    if isinstance(value, datetime.datetime):
+        return value
+    if isinstance(value, datetime.date):
+        return datetime.datetime(value.year, value.month, value.day)
+    for format in formats:
+        try:
+            return datetime.datetime.strptime(value, format)
+        except (TypeError, ValueError):
+            pass
+    raise ValueError('could not parse date/time value: %r' % value)
+
+
+def encode_cursor(values, direction='next'):
+    """Returns an opaque, url-safe cursor token for keyset pagination.
+    `values` are the sort key values of the row the cursor is
+    positioned at and `direction` is either 'next' (rows after that
+    row) or 'prev' (rows before it).
+    """
+    payload = json.dumps([direction, [_json_value(value)
+                                      for value in values]],
+                         separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload).rstrip('=')
+
+
+def decode_cursor(token):
+    """Returns a (direction, values) tuple for a cursor token created
+    by :func:`encode_cursor`. Raises a ValueError if the token can't
+    be decoded. Values that aren't JSON types (e.g. dates) come back
+    as strings, so they will need to be coerced by the datastore.
+    """
+    try:
+        token = str(token)
+        padded = token + '=' * (-len(token) % 4)
+        direction, values = json.loads(base64.urlsafe_b64decode(padded))
+    except (TypeError, ValueError, UnicodeError):
+        raise ValueError('invalid pagination cursor: %r' % token)
+
+    if direction not in ('next', 'prev') or not isinstance(values, list):
+        raise ValueError('invalid pagination cursor: %r' % token)
+
+    return direction, values
+
+
+def iter_csv(columns, rows, rows_per_chunk=100):
+    """Yields UTF-8 encoded chunks of a CSV file with a header of
+    `columns` followed by `rows`, without building the whole file in
+    memory.
+    """
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([_csv_value(column) for column in columns])
+    for i, row in enumerate(rows):
+        writer.writerow([_csv_value(value) for value in row])
+        if (i + 1) % rows_per_chunk == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def iter_jsonl(columns, rows, rows_per_chunk=100):
+    """Yields UTF-8 encoded chunks of a JSON lines file with one
+    object per row, keyed by `columns`.
+    """
+    lines = []
+    for row in rows:
+        lines.append(json.dumps(
+            dict(zip(columns, [_json_value(value) for value in row]))))
+        if len(lines) == rows_per_chunk:
+            yield '\n'.join(lines) + '\n'
+            lines = []
+    if lines:
+        yield '\n'.join(lines) + '\n'
+
+
+def json_object(columns, values):
+    """Returns a JSON serializable dict of column names matched to
+    values.
+    """
+    return dict(zip(columns, [_json_value(value) for value in values]))
+
+
+def json_form_data(data):
+    """Returns the form data for a dict of field names matched to
+    JSON values, as a :class:`~werkzeug.datastructures.MultiDict` of
+    the strings a form would have submitted for them. Lists give a
+    value for each item. None gives an empty value, which clears a
+    field, and false is left out, like an unchecked checkbox.
+    """
+    formdata = MultiDict()
+    for name, value in data.items():
+        if not isinstance(value, list):
+            value = [value]
+        for item in value:
+            if item is None:
+                formdata.add(name, u'')
+            elif item is not False:
+                formdata.add(name, _form_value(item))
+    return formdata
+
+
+class BulkDeleteError(Exception):
+    """Raised when the database refuses to delete a batch of a bulk
+    delete, for example because other rows still refer to it. That
+    batch is rolled back; `counts` is the list of the number of rows
+    each earlier batch deleted.
+    """
+    def __init__(self, message, counts):
+        Exception.__init__(self, message)
+        self.counts = counts
+
+
+class ImportResult(object):
+    """Summary of a bulk import: the number of `accepted` and
+    `rejected` rows, and `errors`, a list of (line number, errors)
+    tuples for the first `max_errors` rejected rows, where errors is
+    a dict of field names matched to lists of error messages.
+    """
+    def __init__(self, max_errors=100):
+        self.accepted = 0
+        self.rejected = 0
+        self.errors = []
+        self.max_errors = max_errors
+
+    def reject(self, line_number, errors):
+        self.rejected += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append((line_number, errors))
+
+
+def iter_csv_rows(file):
+    """Yields a (line number, row) tuple for each row of a UTF-8
+    encoded CSV file with a header row, where row is a dict of column
+    names matched to values. Empty values are left out. Rows that
+    can't be parsed (e.g. because of a NUL byte) or aren't UTF-8 give
+    a row of None, which won't validate; if the header row can't be
+    read, that is the only row.
+    """
+    reader = csv.reader(file)
+    header = None
+    while True:
+        try:
+            values = reader.next()
+            if header is None:
+                header = [name.decode('utf-8').strip() for name in values]
+                continue
+            row = dict([(name, value.decode('utf-8'))
+                        for name, value in zip(header, values) if value])
+        except StopIteration:
+            return
+        except (csv.Error, UnicodeDecodeError):
+            # the reader carries on from the next line
+            yield reader.line_num, None
+            if header is None:
+                return
+            continue
+        yield reader.line_num, row
+
+
+def iter_jsonl_rows(file):
+    """Yields a (line number, row) tuple for each object in a JSON
+    lines file, with the values converted to the strings a form would
+    have submitted for them. Blank lines are skipped and lines that
+    aren't JSON objects give a row of None, which won't validate.
+    """
+    for line_number, line in enumerate(file):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            row = None
+        if not isinstance(row, dict):
+            yield line_number + 1, None
+            continue
+        yield line_number + 1, dict([
+            (name, _form_value(value)) for name, value in row.items()
+            if value is not None and value is not False])
+
+
+def validate_rows(form_factory, model_class, rows, pool=None,
+                  rows_per_task=500):
+    """Validates import rows, given as (line number, row) tuples,
+    against the form that ``form_factory(model_class)`` returns.
+    Yields a (line number, data, errors) tuple for each row, where
+    data is a dict of field names matched to the form data of a valid
+    row (otherwise None) and errors is a dict of field names matched
+    to lists of error messages for an invalid row (otherwise None).
+
+    If a `pool` (a :class:`multiprocessing.pool.Pool`) is given, the
+    rows are validated by its worker processes, `rows_per_task` rows
+    per task. The form factory and model class must be importable by
+    the workers. Only a few tasks are handed to the pool at a time so
+    the rows aren't all read into memory.
+    """
+    tasks = _chunks(((form_factory, model_class, chunk) for chunk in
+                     _chunks(rows, rows_per_task)),
+                    pool and getattr(pool, '_processes', 1) * 2 or 1)
+    for window in tasks:
+        if pool is None:
+            results = map(_validate_rows_task, window)
+        else:
+            results = pool.imap(_validate_rows_task, window)
+        for validated in results:
+            for row in validated:
+                yield row
+
+
+def close_pool_at_exit(pool):
+    """Registers a :class:`multiprocessing.pool.Pool` (or
+    :class:`~multiprocessing.pool.ThreadPool`) to be closed when the
+    interpreter exits, letting its workers finish what they are doing
+    and waiting for them to exit. Returns the pool.
+    """
+    atexit.register(_close_pool, pool)
+    return pool
+
+
+def _close_pool(pool):
+    pool.close()
+    pool.join()
+
+
+def _validate_rows_task(task):
+    form_factory, model_class, rows = task
+    form_class = form_factory(model_class)
+    validated = []
+    for line_number, row in rows:
+        if row is None:
+            validated.append((line_number, None,
+                              {u'': [u'Not a valid row.']}))
+            continue
+        form = form_class(MultiDict(row))
+        if form.validate():
+            validated.append((line_number, dict(
+                [(name, field.data) for name, field in form._fields.items()]),
+                              None))
+        else:
+            validated.append((line_number, None, form.errors))
+    return validated
+
+
+def _chunks(iterable, size):
+    """Yields lists of up to `size` items from an iterable."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _form_value(value):
+    """Returns the form data string for a JSON value."""
+    if value is True:
+        return u'y'
+    if isinstance(value, basestring):
+        return value
+    return unicode(json.dumps(value))
+
+
+def _csv_value(value):
+    """Returns a value as a byte string for the csv module."""
+    if value is None:
+        return ''
+    value = _json_value(value)
+    if isinstance(value, unicode):
+        return value.encode('utf-8')
+    return str(value)
+
+
+def _json_value(value):
+    """Returns a JSON serializable version of a value."""
+    if value is None or isinstance(value, (bool, int, long, float)):
+        return value
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return unicode(value)
@@ -10,10 +10,18 @@
 from __future__ import absolute_import
 
 import datetime
+import decimal
+import glob
+import hashlib
+import inspect
+import os
+import tempfile
 import time
 
+from flask import json, url_for
 from wtforms import fields as wtf_fields
 from wtforms import widgets, validators
+from wtforms.form import BaseForm
 
 
 class TimeField(wtf_fields.Field):
@@ -75,13 +83,369 @@ class TimePickerWidget(widgets.TextInput):
         return super(TimePickerWidget, self).__call__(field, **kwargs)
 
 
+class RemoteSelectWidget(widgets.Select):
+    """Select widget for fields whose options are looked up remotely
+    as the user types. The field should only have its selected options
+    as choices; the url that the other options are looked up from is
+    added as a 'data-lookup-url' attribute, built from the field's
+    `lookup_args` for the admin blueprint's lookup view.
+    """
+    def __call__(self, field, **kwargs):
+        c = kwargs.pop('class', '') or kwargs.pop('class_', '')
+        kwargs['class'] = u'remote-select %s' % c
+        kwargs['data-lookup-url'] = url_for('.lookup', **field.lookup_args)
+        return super(RemoteSelectWidget, self).__call__(field, **kwargs)
+
+
+#: whether or not each form class that has been checked by
+#: has_file_field() has a FileField
+_file_field_forms = {}
+
+
 def has_file_field(form):
     """Test whether or not a form has a FileField in it. This is used
     to know whether or not we need to set enctype to
-    multipart/form-data.
+    multipart/form-data. The answer is cached for the form's class, so
+    the fields are only checked once.
     """
+    form_class = type(form)
+    try:
+        return _file_field_forms[form_class]
+    except KeyError:
+        pass
+
+    result = False
     for field in form:
         if isinstance(field, wtf_fields.FileField):
-            return True
+            result = True
+            break
+    _file_field_forms[form_class] = result
+    return result
+
+
+#: the field names of each form class that has been checked by
+#: get_field_names()
+_form_field_names = {}
+
+
+def get_field_names(form_class):
+    """Returns the names of the fields of a form class. The names are
+    cached for the class, so the form is only instantiated once.
+    """
+    try:
+        return _form_field_names[form_class]
+    except KeyError:
+        pass
+
+    names = list(form_class()._fields)
+    _form_field_names[form_class] = names
+    return names
+
+
+#: bump this when form generation changes in a way that should
+#: invalidate the form caches
+FORM_CACHE_VERSION = 3
+
+#: the packages whose classes form descriptions may name directly;
+#: since cache files are read back from disk, nothing else is imported
+#: when a form is loaded
+TRUSTED_MODULES = ('wtforms', 'flask_admin')
+
+#: the modules that validator and widget classes are based on
+_validator_modules = ('wtforms.validators', 'wtforms.widgets')
+
+#: builtin types that may be passed as field arguments (e.g. as the
+#: `values_formatter` of an AnyOf validator)
+_builtin_types = dict([(cls.__name__, cls) for cls in
+                       (str, unicode, int, long, float, bool)])
+
+
+class FormCache(object):
+    """A directory of generated form descriptions (see
+    :func:`dump_form`), so that forms can be rebuilt by new processes
+    without generating them again. Each description is stored under
+    the model name and a fingerprint of the model's schema, so a
+    changed schema never finds a stale form.
+    """
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        if not os.path.isdir(cache_dir):
+            try:
+                os.makedirs(cache_dir)
+            except OSError:
+                # another process may have just created it
+                if not os.path.isdir(cache_dir):
+                    raise
+
+    def get(self, model_name, fingerprint):
+        """Returns the cached form description for a model with a
+        given schema fingerprint, or None.
+        """
+        try:
+            f = open(self._path(model_name, fingerprint))
+            try:
+                return json.load(f)
+            finally:
+                f.close()
+        except (IOError, ValueError):
+            return None
+
+    def set(self, model_name, fingerprint, description):
+        """Caches a form description, replacing any descriptions
+        cached for other fingerprints of the model.
+        """
+        path = self._path(model_name, fingerprint)
+        for stale_path in glob.glob(self._path(model_name, '*')):
+            if stale_path != path:
+                try:
+                    os.remove(stale_path)
+                except OSError:
+                    pass
+
+        # write to a temporary file first so readers never see a
+        # partly written description
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir,
+                                         suffix='.tmp')
+        try:
+            f = os.fdopen(fd, 'w')
+            try:
+                json.dump(description, f)
+            finally:
+                f.close()
+            os.rename(temp_path, path)
+        except (IOError, OSError):
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+    def _path(self, model_name, fingerprint):
+        return os.path.join(self.cache_dir, '%s.%s.json' % (
+            model_name, fingerprint))
+
+
+def schema_fingerprint(schema):
+    """Returns a fingerprint of a JSON serializable description of a
+    model's schema, for keying a :class:`FormCache`.
+    """
+    return hashlib.sha1(json.dumps([FORM_CACHE_VERSION, schema],
+                                   sort_keys=True)).hexdigest()
+
 
+def dump_form(form_class):
+    """Returns a JSON serializable description of a form class and its
+    fields, which :func:`load_form` can rebuild the form from. Values
+    of field arguments can be JSON types, dates and times, decimals,
+    importable classes, validators and widgets from the
+    :data:`TRUSTED_MODULES` whose attributes can be described, and
+    callables with a `_form_cache_spec` attribute. Raises a TypeError
+    if the form can't be described.
+    """
+    fields = []
+    for name, unbound_field in _unbound_fields(form_class):
+        fields.append([name,
+                       _dump_value(unbound_field.field_class),
+                       _dump_value(list(unbound_field.args)),
+                       _dump_value(unbound_field.kwargs)])
+    return {'name': form_class.__name__,
+            'base': _dump_value(form_class.__bases__[0]),
+            'fields': fields}
+
+
+def load_form(description, resolve_callable, resolve_class=None):
+    """Returns a form class rebuilt from a description made by
+    :func:`dump_form`. `resolve_callable` is called with the
+    `_form_cache_spec` of each callable that was described, and should
+    return the callable. Fields, forms, validators and widgets are only
+    loaded from the :data:`TRUSTED_MODULES`; `resolve_class` is called
+    with the import path of any other class that was described (like
+    a model class), and should return the class or raise a ValueError.
+    Raises a ValueError if the description names anything else.
+    """
+    load = lambda value: _load_value(value, resolve_callable, resolve_class)
+    field_dict = {}
+    for name, field_class, args, kwargs in description['fields']:
+        field_class = load(field_class)
+        if not _is_subclass(field_class, wtf_fields.Field):
+            raise ValueError('not a field class: %r' % (field_class,))
+        field_dict[str(name)] = field_class(
+            *load(args),
+            **dict([(str(key), value) for key, value in
+                    load(kwargs).items()]))
+    base = load(description['base'])
+    if not _is_subclass(base, BaseForm):
+        raise ValueError('not a form class: %r' % (base,))
+    return type(str(description['name']), (base,), field_dict)
+
+
+def _unbound_fields(form_class):
+    """Returns the (name, unbound field) pairs of a form class, in the
+    order the fields were declared.
+    """
+    fields = []
+    for name in dir(form_class):
+        if name.startswith('_'):
+            continue
+        value = getattr(form_class, name)
+        if hasattr(value, '_formfield'):
+            fields.append((value.creation_counter, name, value))
+    fields.sort()
+    return [(name, value) for counter, name, value in fields]
+
+
+def _dump_value(value):
+    if value is None or isinstance(value, (bool, int, long, float,
+                                           basestring)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [_dump_value(item) for item in value]
+    if isinstance(value, dict):
+        if [key for key in value if not isinstance(key, basestring)
+                or key.startswith('__')]:
+            raise TypeError('cannot describe dict keys: %r' % value.keys())
+        return dict([(key, _dump_value(item)) for key, item in value.items()])
+    if isinstance(value, datetime.datetime):
+        return {'__datetime__': value.isoformat()}
+    if isinstance(value, datetime.date):
+        return {'__date__': value.isoformat()}
+    if isinstance(value, datetime.time):
+        return {'__time__': value.strftime('%H:%M:%S.%f')}
+    if isinstance(value, decimal.Decimal):
+        return {'__decimal__': str(value)}
+    if isinstance(value, type):
+        if _is_trusted(value) and not (
+                issubclass(value, (wtf_fields.Field, BaseForm)) or
+                _is_validator_or_widget(value)):
+            raise TypeError('cannot describe %r' % value)
+        return {'__class__': _class_path(value)}
+    if hasattr(value, '_form_cache_spec'):
+        return {'__callable__': _dump_value(value._form_cache_spec)}
+    if isinstance(value, validators.Optional) and \
+           hasattr(value, 'string_check'):
+        # Optional keeps a lambda, so describe its argument instead
+        return {'__optional__': value.string_check(u' ') == u''}
+    if hasattr(value, '__dict__') and _is_trusted(type(value)) and \
+           _is_validator_or_widget(type(value)):
+        return {'__instance__': _class_path(type(value)),
+                'attrs': _dump_value(vars(value))}
+    raise TypeError('cannot describe %r' % (value,))
+
+
+def _load_value(value, resolve_callable, resolve_class=None):
+    load = lambda value: _load_value(value, resolve_callable, resolve_class)
+    if isinstance(value, list):
+        return [load(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if '__datetime__' in value:
+        return _parse_iso(value['__datetime__'], '%Y-%m-%dT%H:%M:%S')
+    if '__date__' in value:
+        return _parse_iso(value['__date__'], '%Y-%m-%d').date()
+    if '__time__' in value:
+        return datetime.datetime.strptime(value['__time__'],
+                                          '%H:%M:%S.%f').time()
+    if '__decimal__' in value:
+        return decimal.Decimal(value['__decimal__'])
+    if '__class__' in value:
+        return _load_class(value['__class__'], resolve_class)
+    if '__callable__' in value:
+        return resolve_callable(load(value['__callable__']))
+    if '__optional__' in value:
+        return validators.Optional(strip_whitespace=value['__optional__'])
+    if '__instance__' in value:
+        cls = _import_trusted_class(value['__instance__'])
+        if not _is_validator_or_widget(cls):
+            raise ValueError('not a validator or widget class: %r' % cls)
+        obj = cls.__new__(cls)
+        obj.__dict__.update(dict([(str(key), item) for key, item in
+                                  load(value['attrs']).items()]))
+        return obj
+    if [key for key in value if key.startswith('__')]:
+        raise ValueError('unknown value: %r' % (value,))
+    return dict([(key, load(item)) for key, item in value.items()])
+
+
+def _parse_iso(value, format):
+    if '.' in value:
+        format += '.%f'
+    return datetime.datetime.strptime(value, format)
+
+
+def _class_path(cls):
+    """Returns the import path of a class. Raises a TypeError if the
+    class can't be imported by that path.
+    """
+    path = '%s:%s' % (cls.__module__, cls.__name__)
+    try:
+        imported = _import_class(path)
+    except (ImportError, AttributeError):
+        imported = None
+    if imported is not cls:
+        raise TypeError('cannot describe %r, it cannot be imported' % cls)
+    return path
+
+
+def _load_class(path, resolve_class):
+    """Returns the class for an import path in a form description:
+    fields, forms, validators and widgets from the
+    :data:`TRUSTED_MODULES`, a few builtin types, or whatever
+    `resolve_class` returns for any other path.
+    """
+    module_name, name = path.split(':')
+    if module_name in ('__builtin__', 'builtins') and \
+           name in _builtin_types:
+        return _builtin_types[name]
+    if _is_trusted_module(module_name):
+        cls = _import_trusted_class(path)
+        if not (_is_subclass(cls, (wtf_fields.Field, BaseForm)) or
+                _is_validator_or_widget(cls)):
+            raise ValueError('cannot load %r from a form cache' % cls)
+        return cls
+    if resolve_class is None:
+        raise ValueError('cannot load %r from a form cache' % path)
+    return resolve_class(path)
+
+
+def _import_trusted_class(path):
+    """Imports a class from one of the :data:`TRUSTED_MODULES`. Raises
+    a ValueError for any other path.
+    """
+    module_name, name = path.split(':')
+    if not _is_trusted_module(module_name):
+        raise ValueError('cannot load %r from a form cache' % path)
+    cls = _import_class(path)
+    if not isinstance(cls, type) or not _is_trusted(cls):
+        raise ValueError('cannot load %r from a form cache' % path)
+    return cls
+
+
+def _import_class(path):
+    module_name, name = path.split(':')
+    module = __import__(module_name, {}, {}, [name])
+    return getattr(module, name)
+
+
+def _is_trusted_module(module_name):
+    return [prefix for prefix in TRUSTED_MODULES
+            if module_name == prefix or module_name.startswith(prefix + '.')]
+
+
+def _is_trusted(cls):
+    return bool(_is_trusted_module(cls.__module__))
+
+
+def _is_subclass(value, classes):
+    return isinstance(value, type) and issubclass(value, classes)
+
+
+def _is_validator_or_widget(cls):
+    """Returns True if a class is, or is based on, a class from
+    wtforms' validators or widgets.
+    """
+    for base in inspect.getmro(cls):
+        module_name = base.__module__
+        if [prefix for prefix in _validator_modules
+                if module_name == prefix or
+                module_name.startswith(prefix + '.')]:
+            return True
     return False
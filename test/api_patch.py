@@ -0,0 +1,58 @@
+from flask import Flask
+from flask.ext import admin
+from flask.ext.admin.datastore.sqlalchemy import SQLAlchemyDatastore
+from sqlalchemy import create_engine
+from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import Boolean, Column, Integer, String
+from sqlalchemy.orm import relationship
+from sqlalchemy.schema import ForeignKey
+
+Base = declarative_base()
+
+
+# ----------------------------------------------------------------------
+# Models
+# ----------------------------------------------------------------------
+class Post(Base):
+    __tablename__ = 'post'
+
+    id = Column(Integer, primary_key=True)
+    title = Column(String(80))
+    published = Column(Boolean, default=False)
+    category_id = Column(Integer, ForeignKey('category.id'))
+
+    category = relationship('Category')
+
+    def __repr__(self):
+        return self.title
+
+
+class Category(Base):
+    __tablename__ = 'category'
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(50))
+
+    def __repr__(self):
+        return self.name
+
+
+def create_app(database_uri='sqlite://'):
+    app = Flask(__name__)
+    app.config['SECRET_KEY'] = 'not secure'
+    engine = create_engine(database_uri, convert_unicode=True)
+    app.db_session = scoped_session(sessionmaker(
+        autocommit=False, autoflush=False,
+        bind=engine))
+    datastore = SQLAlchemyDatastore(
+        (Post, Category), app.db_session)
+    admin_blueprint = admin.create_admin_blueprint(datastore)
+    app.register_blueprint(admin_blueprint, url_prefix='/admin')
+    Base.metadata.create_all(bind=engine)
+    return app
+
+
+if __name__ == '__main__':
+    app = create_app('sqlite://')
+    app.run(debug=True)
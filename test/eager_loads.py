@@ -0,0 +1,73 @@
+import sys
+
+from flask import Flask,  redirect
+from flask.ext import admin
+from flask.ext.admin.datastore.sqlalchemy import SQLAlchemyDatastore
+from sqlalchemy import create_engine
+from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import Column, Integer, String
+from sqlalchemy.orm import relationship
+from sqlalchemy.schema import ForeignKey
+
+Base = declarative_base()
+
+
+# ----------------------------------------------------------------------
+# Models
+# ----------------------------------------------------------------------
+class Course(Base):
+    __tablename__ = 'course'
+
+    id = Column(Integer, primary_key=True)
+    subject = Column(String)
+    teacher_id = Column(Integer, ForeignKey('teacher.id'), nullable=False)
+
+    teacher = relationship('Teacher', backref='courses')
+
+    def __repr__(self):
+        # touches a relationship, so listing courses lazily loads
+        # the teacher of each course unless it is eagerly loaded
+        return '%s (%s)' % (self.subject, self.teacher.name)
+
+
+class Teacher(Base):
+    __tablename__ = 'teacher'
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(120), unique=True)
+
+    def __repr__(self):
+        return self.name
+
+
+def create_app(database_uri='sqlite://', eager_loads=None):
+    app = Flask(__name__)
+    app.config['SECRET_KEY'] = 'not secure'
+    app.debug = True
+    engine = create_engine(database_uri, convert_unicode=True)
+    app.db_session = scoped_session(sessionmaker(
+        autocommit=False, autoflush=False,
+        bind=engine))
+    datastore = SQLAlchemyDatastore(
+        (Course, Teacher), app.db_session, eager_loads=eager_loads)
+    admin_blueprint = admin.create_admin_blueprint(datastore)
+    app.register_blueprint(admin_blueprint, url_prefix='/admin')
+    Base.metadata.create_all(bind=engine)
+
+    for i in range(3):
+        teacher = Teacher(name='Teacher%s' % i)
+        app.db_session.add(Course(subject='Course%s' % i, teacher=teacher))
+    app.db_session.commit()
+    app.db_session.remove()
+
+    @app.route('/')
+    def go_to_admin():
+        return redirect('/admin')
+
+    return app
+
+
+if __name__ == '__main__':
+    app = create_app('sqlite://')
+    app.run(debug=True)
@@ -0,0 +1,72 @@
+import sqlite3
+
+from flask import Flask,  redirect
+from flask.ext import admin
+from flask.ext.admin.datastore.sqlalchemy import SQLAlchemyDatastore
+from sqlalchemy import create_engine
+from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import Column, Integer, String, Text
+
+Base = declarative_base()
+
+
+# ----------------------------------------------------------------------
+# Models
+# ----------------------------------------------------------------------
+class Student(Base):
+    __tablename__ = 'student'
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(120), unique=True)
+    bio = Column(Text)
+
+    def __repr__(self):
+        return self.name
+
+
+def has_fts5():
+    """Returns True if the sqlite library has the FTS5 extension."""
+    connection = sqlite3.connect(':memory:')
+    try:
+        connection.execute('CREATE VIRTUAL TABLE test USING fts5(body)')
+    except sqlite3.OperationalError:
+        return False
+    finally:
+        connection.close()
+    return True
+
+
+def create_app(database_uri='sqlite://', search_index=True):
+    app = Flask(__name__)
+    app.config['SECRET_KEY'] = 'not secure'
+    engine = create_engine(database_uri, convert_unicode=True)
+    app.db_session = scoped_session(sessionmaker(
+        autocommit=False, autoflush=False,
+        bind=engine))
+    datastore = SQLAlchemyDatastore(
+        (Student,), app.db_session,
+        search_columns={'Student': ['name', 'bio']})
+    app.datastore = datastore
+    admin_blueprint = admin.create_admin_blueprint(datastore)
+    app.register_blueprint(admin_blueprint, url_prefix='/admin')
+    Base.metadata.create_all(bind=engine)
+
+    app.db_session.add(Student(name='Stewart', bio='Plays the tuba'))
+    app.db_session.add(Student(name='Mike', bio='Likes maths and more maths'))
+    app.db_session.add(Student(name='Jason', bio='Good at maths'))
+    app.db_session.commit()
+    if search_index and has_fts5():
+        datastore.create_search_index('Student')
+    app.db_session.remove()
+
+    @app.route('/')
+    def go_to_admin():
+        return redirect('/admin')
+
+    return app
+
+
+if __name__ == '__main__':
+    app = create_app('sqlite://')
+    app.run(debug=True)
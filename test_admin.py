@@ -1,13 +1,30 @@
 from __future__ import with_statement
 
-from datetime import datetime
+from datetime import datetime, time
+import gzip
+import os
+import re
+import shutil
+from StringIO import StringIO
 import sys
+import tempfile
+import threading
 import unittest
+from urlparse import urlsplit
+import warnings
 
-from flask import Flask
+import flask
+from flask import Flask, json
 import sqlalchemy as sa
 
 from flask.ext import admin
+from flask.ext.admin import assets, util
+from flask.ext.admin.datastore import sqlalchemy as sqlalchemy_datastore
+from flask.ext.admin.datastore.mongoalchemy import MongoAlchemyDatastore
+from flask.ext.admin.datastore.sqlalchemy import SQLAlchemyDatastore, \
+     CachedCount, EstimatedCount, LazyLoadWarning, NoCount
+from flask.ext.admin.wtforms import _file_field_forms, get_field_names, \
+    has_file_field
 from flask.ext.testing import TestCase
 
 sys.path.append('./example/')
@@ -19,9 +36,12 @@ from example.flask_sqlalchemy import flaskext_sa_simple
 from example.flask_sqlalchemy import flaskext_sa_example
 from example.flask_sqlalchemy import flaskext_sa_multi_pk
 from example.mongoalchemy import simple as ma_simple
+import test.api_patch
 import test.custom_form
 import test.deprecation
+import test.eager_loads
 import test.filefield
+import test.search
 import test.sqlalchemy_with_defaults
 from test.mongoalchemy_datastore import ConversionTest
 
@@ -357,6 +377,1559 @@ class LargePaginationTest(TestCase):
         assert '<a href="/admin/list/Student/?page=2">></a>' not in rv.data
 
 
+class SQLAlchemyAdminTestCase(TestCase):
+    """Runs the admin for the declarative example models on an
+    in-memory sqlite database. Subclasses set `datastore_options` and
+    `blueprint_options` to the options they test and add their rows
+    in `populate`.
+    """
+    TESTING = True
+    models = (simple.Course, simple.Student, simple.Teacher)
+    datastore_options = {}
+    blueprint_options = {}
+
+    def create_app(self):
+        app = self.create_admin_app()
+        self.populate(app.db_session)
+        app.db_session.commit()
+        return app
+
+    def create_admin_app(self):
+        app = Flask(__name__)
+        app.config['SECRET_KEY'] = 'not secure'
+        engine = sa.create_engine('sqlite://', convert_unicode=True)
+        app.db_session = sa.orm.scoped_session(sa.orm.sessionmaker(
+            autocommit=False, autoflush=False,
+            bind=engine))
+        self.datastore = self.create_datastore(app.db_session)
+        admin_blueprint = admin.create_admin_blueprint(
+            self.datastore, **self.blueprint_options)
+        app.register_blueprint(admin_blueprint, url_prefix='/admin')
+        simple.Base.metadata.create_all(bind=engine)
+        return app
+
+    def create_datastore(self, db_session):
+        return SQLAlchemyDatastore(self.models, db_session,
+                                   **self.datastore_options)
+
+    def populate(self, db_session):
+        pass
+
+
+class KeysetPaginationTest(SQLAlchemyAdminTestCase):
+    datastore_options = dict(keyset_columns={'Student': ['name']})
+    blueprint_options = dict(list_view_pagination=10, max_offset_page=2)
+
+    def populate(self, db_session):
+        for i in range(50):
+            db_session.add(simple.Student(name="Student%02d" % i))
+
+    def test_cursor_roundtrip(self):
+        cursor = util.encode_cursor([u'Student09', 10], 'prev')
+        self.assertEqual(util.decode_cursor(cursor),
+                         ('prev', [u'Student09', 10]))
+        self.assertRaises(ValueError, util.decode_cursor, 'garbage')
+
+    def test_offset_pages_below_limit(self):
+        rv = self.client.get('/admin/list/Student/?page=2')
+        self.assert_200(rv)
+        assert '?page=3' in rv.data
+
+    def test_deep_page_redirects_to_cursor(self):
+        rv = self.client.get('/admin/list/Student/?page=4')
+        self.assertEqual(rv.status_code, 302)
+        # werkzeug makes the redirect's location absolute
+        location = urlsplit(rv.location)
+        self.assertEqual(location.path, '/admin/list/Student/')
+        assert location.query.startswith('cursor=')
+
+        rv = self.client.get('%s?%s' % (location.path, location.query))
+        self.assert_200(rv)
+        assert 'Student30' in rv.data
+        assert 'Student39' in rv.data
+        assert 'Student29' not in rv.data
+        assert 'Student40' not in rv.data
+        assert 'next >' in rv.data
+
+    def test_prev_cursor(self):
+        datastore = SQLAlchemyDatastore((simple.Student,),
+                                        self.app.db_session)
+        pagination = datastore.create_model_keyset_pagination(
+            'Student', None, 10)
+        pagination = datastore.create_model_keyset_pagination(
+            'Student', pagination.next_cursor, 10)
+        self.assertEqual(pagination.items[0].name, 'Student10')
+        pagination = datastore.create_model_keyset_pagination(
+            'Student', pagination.prev_cursor, 10)
+        self.assertEqual([student.name for student in pagination.items],
+                         ['Student%02d' % i for i in range(10)])
+        assert not pagination.has_prev
+
+    def test_invalid_cursor_redirects(self):
+        rv = self.client.get('/admin/list/Student/?cursor=garbage')
+        self.assert_redirects(rv, '/admin/list/Student/')
+
+    def test_datastore_without_keyset_pagination(self):
+        class OffsetDatastore(SQLAlchemyDatastore):
+            supports_keyset_pagination = False
+
+            def create_model_keyset_pagination(self, *args, **kwargs):
+                raise NotImplementedError()
+
+            def get_page_cursor(self, *args, **kwargs):
+                raise NotImplementedError()
+
+        app = Flask(__name__)
+        app.config['SECRET_KEY'] = 'not secure'
+        datastore = OffsetDatastore((simple.Student,), self.app.db_session)
+        app.register_blueprint(admin.create_admin_blueprint(
+            datastore, list_view_pagination=10, keyset_pagination=True,
+            max_offset_page=2), url_prefix='/admin')
+        client = app.test_client()
+
+        rv = client.get('/admin/list/Student/?page=4')
+        self.assert_200(rv)
+        assert 'Student30' in rv.data
+        assert 'Student29' not in rv.data
+        cursor = util.encode_cursor([u'Student09', 10])
+        rv = client.get('/admin/list/Student/?cursor=' + cursor)
+        self.assert_200(rv)
+        assert 'Student00' in rv.data
+        rv = client.get('/admin/api/Student/?cursor=' + cursor)
+        self.assert_200(rv)
+        assert 'next_cursor' not in json.loads(rv.data)
+
+    def test_nullable_keyset_column(self):
+        for i in range(3):
+            self.app.db_session.add(simple.Student(name=None))
+        self.app.db_session.commit()
+        datastore = SQLAlchemyDatastore(
+            (simple.Student,), self.app.db_session,
+            keyset_columns={'Student': ['name']})
+        all_ids = [student.id for student in
+                   self.app.db_session.query(simple.Student)]
+
+        # pages of 2 put a page boundary between the NULL names and
+        # again between the last NULL and the first name
+        pages = []
+        pagination = datastore.create_model_keyset_pagination(
+            'Student', None, 2)
+        pages.append(pagination)
+        while pagination.next_cursor:
+            pagination = datastore.create_model_keyset_pagination(
+                'Student', pagination.next_cursor, 2)
+            pages.append(pagination)
+        ids = [student.id for page in pages for student in page.items]
+        self.assertEqual(sorted(ids), sorted(all_ids))
+        self.assertEqual([student.name for student in pages[1].items],
+                         [None, u'Student00'])
+
+        pagination = datastore.create_model_keyset_pagination(
+            'Student', pages[1].prev_cursor, 2)
+        self.assertEqual([student.id for student in pagination.items],
+                         [student.id for student in pages[0].items])
+        assert not pagination.has_prev
+
+    def test_seek_criterion_with_nulls_last(self):
+        # PostgreSQL sorts NULLs after other values, so seeking has to
+        # as well for the ordering to come from the index
+        for i in range(3):
+            self.app.db_session.add(simple.Student(name=None))
+        self.app.db_session.commit()
+        columns = [simple.Student.name, simple.Student.id]
+        keys = [(student.name is None, student.name, student.id)
+                for student in self.app.db_session.query(simple.Student)]
+        keys = [key[1:] for key in sorted(keys)]
+        for i, key in enumerate(keys):
+            for reverse, expected in ((False, keys[i + 1:]),
+                                      (True, keys[:i])):
+                criterion = sqlalchemy_datastore._seek_criterion(
+                    columns, key, reverse, nulls_first=False)
+                found = self.app.db_session.query(*columns).\
+                    filter(criterion).all()
+                self.assertEqual(sorted(map(tuple, found)), sorted(expected))
+
+
+class CountStrategyTest(SQLAlchemyAdminTestCase):
+    blueprint_options = dict(list_view_pagination=10)
+
+    def create_app(self):
+        self.cached_count = CachedCount(ttl=3600)
+        self.datastore_options = dict(
+            count_strategies={'Student': NoCount(),
+                              'Teacher': self.cached_count,
+                              'Course': EstimatedCount()})
+        return super(CountStrategyTest, self).create_app()
+
+    def populate(self, db_session):
+        for i in range(25):
+            db_session.add(simple.Student(name="Student%02d" % i))
+            db_session.add(simple.Teacher(name="Teacher%02d" % i))
+
+    def test_no_count(self):
+        rv = self.client.get('/admin/list/Student/?page=2')
+        assert '<a href="/admin/list/Student/?page=3">></a>' in rv.data
+        assert 'total' not in rv.data
+
+        rv = self.client.get('/admin/list/Student/?page=3')
+        assert 'Student24' in rv.data
+        assert '?page=4' not in rv.data
+
+    def test_cached_count(self):
+        rv = self.client.get('/admin/list/Teacher/')
+        assert '25 total' in rv.data
+        self.app.db_session.add(simple.Teacher(name="Mr. Kohleffel"))
+        self.app.db_session.commit()
+        rv = self.client.get('/admin/list/Teacher/')
+        assert '25 total' in rv.data
+
+    def test_estimated_count_falls_back_to_exact(self):
+        rv = self.client.get('/admin/list/Course/')
+        self.assert_200(rv)
+
+    def test_failed_estimate_keeps_the_transaction(self):
+        # there is no sqlite_stat1 table to read an estimate from
+        self.app.db_session.add(simple.Student(name="Uncommitted"))
+        self.app.db_session.flush()
+        self.assertEqual(EstimatedCount().count(
+            self.app.db_session, simple.Student,
+            self.app.db_session.query(simple.Student)), (26, True))
+        self.app.db_session.commit()
+        self.assertEqual(
+            self.app.db_session.query(simple.Student).count(), 26)
+
+    def test_inexact_pagination(self):
+        pagination = util.Pagination(2, 10, 1000, [], exact=False,
+                                     has_more=True)
+        self.assertEqual(list(pagination.iter_pages()), [1, 2, 3])
+        assert pagination.has_next
+
+
+class ListColumnsTest(SQLAlchemyAdminTestCase):
+    datastore_options = dict(
+        list_columns={'Course': ['subject', 'start_time'],
+                      'Student': ['name']},
+        list_text_length=5,
+        keyset_columns={'Student': ['name']})
+    blueprint_options = dict(list_view_pagination=2)
+
+    def populate(self, db_session):
+        teacher = simple.Teacher(name="Mrs. Jones")
+        db_session.add(teacher)
+        db_session.add(simple.Course(subject="mathematics", teacher=teacher))
+        for name in ("Stewart", "Mike", "Jason"):
+            db_session.add(simple.Student(name=name))
+
+    def test_list_columns(self):
+        rv = self.client.get('/admin/list/Course/')
+        self.assert_200(rv)
+        assert '<th>subject</th>' in rv.data
+        assert '<th>start time</th>' in rv.data
+        assert u'mathe\u2026'.encode('utf-8') in rv.data
+        assert 'mathematics' not in rv.data
+        assert '/admin/edit/Course/1/' in rv.data
+
+    def test_list_rows(self):
+        datastore = SQLAlchemyDatastore(
+            (simple.Student,), self.app.db_session,
+            list_columns={'Student': ['name']})
+        pagination = datastore.create_model_pagination('Student', 1)
+        row = pagination.items[0]
+        assert isinstance(row, util.ListRow)
+        self.assertEqual(row.keys, [1])
+        self.assertEqual(row.values, ['Stewart'])
+
+    def test_keyset_with_list_columns(self):
+        rv = self.client.get('/admin/list/Student/?cursor=' +
+                             util.encode_cursor(['Jason', 3]))
+        self.assert_200(rv)
+        assert 'Mike' in rv.data
+        # names are truncated to list_text_length here as well
+        assert u'Stewa\u2026'.encode('utf-8') in rv.data
+        assert 'Stewart' not in rv.data
+        assert 'Jason' not in rv.data
+
+
+class LazyLoadWarningTest(TestCase):
+    TESTING = True
+
+    def create_app(self):
+        return test.eager_loads.create_app('sqlite://')
+
+    def test_lazy_loads_warn(self):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            rv = self.client.get('/admin/list/Course/')
+        self.assert_200(rv)
+        assert [warning for warning in caught
+                if issubclass(warning.category, LazyLoadWarning)]
+
+    def test_find_model_instance_loads_form_relationships(self):
+        datastore = SQLAlchemyDatastore(
+            (test.eager_loads.Course, test.eager_loads.Teacher),
+            self.app.db_session)
+        field_names = get_field_names(datastore.get_model_form('Course'))
+        self.assertEqual(sorted(field_names), ['subject', 'teacher'])
+        self.app.db_session.remove()
+        course = datastore.find_model_instance('Course', [1],
+                                               load=field_names)
+        assert 'teacher' in course.__dict__
+
+
+class EagerLoadTest(TestCase):
+    TESTING = True
+
+    def create_app(self):
+        return test.eager_loads.create_app(
+            'sqlite://', eager_loads={'Course': ['teacher']})
+
+    def test_eager_loads_dont_warn(self):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            rv = self.client.get('/admin/list/Course/')
+        self.assert_200(rv)
+        assert 'Course1 (Teacher1)' in rv.data
+        assert not [warning for warning in caught
+                    if issubclass(warning.category, LazyLoadWarning)]
+
+    def test_find_model_instance_eager_loads(self):
+        datastore = SQLAlchemyDatastore(
+            (test.eager_loads.Course, test.eager_loads.Teacher),
+            self.app.db_session, eager_loads={'Course': {'teacher': 'joined'}})
+        course = datastore.find_model_instance('Course', [1])
+        assert 'teacher' in course.__dict__
+
+
+class SortTest(TestCase):
+    TESTING = True
+
+    def create_app(self):
+        app = simple.create_app('sqlite://')
+        teacher = simple.Teacher(name="Mrs. Jones")
+        for name in ("Stewart", "Mike", "Jason"):
+            app.db_session.add(simple.Student(name=name))
+        app.db_session.add(simple.Course(subject="maths", teacher=teacher))
+        app.db_session.add(simple.Course(subject="art", teacher=teacher))
+        app.db_session.commit()
+        return app
+
+    def test_sortable_columns(self):
+        datastore = SQLAlchemyDatastore(
+            (simple.Course, simple.Student), self.app.db_session,
+            sortable_columns={'Course': ['subject']})
+        self.assertEqual(sorted(datastore.get_sortable_columns('Student')),
+                         ['id', 'name'])
+        self.assertEqual(datastore.get_sortable_columns('Course'),
+                         ['subject'])
+
+    def test_sort_descending(self):
+        rv = self.client.get('/admin/list/Student/?sort=name&dir=desc')
+        self.assert_200(rv)
+        assert rv.data.index('Stewart') < rv.data.index('Mike') < \
+               rv.data.index('Jason')
+
+    def test_sort_ascending(self):
+        rv = self.client.get('/admin/list/Student/?sort=name&dir=asc')
+        assert rv.data.index('Jason') < rv.data.index('Mike') < \
+               rv.data.index('Stewart')
+
+    def test_unindexed_sort_is_ignored(self):
+        rv = self.client.get('/admin/list/Course/?sort=subject')
+        self.assert_200(rv)
+        assert rv.data.index('maths') < rv.data.index('art')
+
+    def test_keyset_sort(self):
+        datastore = SQLAlchemyDatastore((simple.Student,),
+                                        self.app.db_session)
+        pagination = datastore.create_model_keyset_pagination(
+            'Student', None, 2, sort='name', sort_desc=True)
+        self.assertEqual([student.name for student in pagination.items],
+                         ['Stewart', 'Mike'])
+        pagination = datastore.create_model_keyset_pagination(
+            'Student', pagination.next_cursor, 2, sort='name',
+            sort_desc=True)
+        self.assertEqual([student.name for student in pagination.items],
+                         ['Jason'])
+        pagination = datastore.create_model_keyset_pagination(
+            'Student', pagination.prev_cursor, 2, sort='name',
+            sort_desc=True)
+        self.assertEqual([student.name for student in pagination.items],
+                         ['Stewart', 'Mike'])
+
+
+class FilterTest(TestCase):
+    TESTING = True
+
+    def create_app(self):
+        app = simple.create_app('sqlite://')
+        teacher = simple.Teacher(name="Mrs. Jones")
+        for name in ("Stewart", "Mike", "Jason"):
+            app.db_session.add(simple.Student(name=name))
+        app.db_session.add(simple.Course(subject="maths", teacher=teacher,
+                                         start_time=time(9, 0)))
+        app.db_session.add(simple.Course(subject="art", teacher=teacher))
+        app.db_session.commit()
+        return app
+
+    def create_datastore(self):
+        return SQLAlchemyDatastore(
+            (simple.Course, simple.Student), self.app.db_session,
+            list_filters={'Course': ['subject', 'start_time']})
+
+    def test_filter_columns(self):
+        datastore = self.create_datastore()
+        self.assertEqual(sorted(datastore.get_filter_columns('Student')),
+                         [('id', 'number'), ('name', 'text')])
+        self.assertEqual(datastore.get_filter_columns('Course'),
+                         [('subject', 'text'), ('start_time', 'time')])
+
+    def test_filter_eq(self):
+        rv = self.client.get('/admin/list/Student/?flt_name__eq=Mike')
+        self.assert_200(rv)
+        assert 'Mike' in rv.data
+        assert 'Jason' not in rv.data
+        assert 'Stewart' not in rv.data
+
+    def test_filter_in(self):
+        rv = self.client.get('/admin/list/Student/?flt_id__in=1,3')
+        assert 'Stewart' in rv.data
+        assert 'Mike' not in rv.data
+        assert 'Jason' in rv.data
+
+    def test_filter_range_and_null(self):
+        datastore = self.create_datastore()
+        pagination = datastore.create_model_pagination(
+            'Course', 1, filters=[('start_time', 'null', '1')])
+        self.assertEqual([course.subject for course in pagination.items],
+                         ['art'])
+        pagination = datastore.create_model_pagination(
+            'Course', 1, filters=[('start_time', 'gte', '08:00:00'),
+                                  ('start_time', 'lt', '10:00:00')])
+        self.assertEqual([course.subject for course in pagination.items],
+                         ['maths'])
+        self.assertEqual(pagination.total, 1)
+
+    def test_keyset_filter(self):
+        datastore = self.create_datastore()
+        pagination = datastore.create_model_keyset_pagination(
+            'Student', None, 1, filters=[('id', 'gte', '2')])
+        self.assertEqual([student.name for student in pagination.items],
+                         ['Mike'])
+        pagination = datastore.create_model_keyset_pagination(
+            'Student', pagination.next_cursor, 1,
+            filters=[('id', 'gte', '2')])
+        self.assertEqual([student.name for student in pagination.items],
+                         ['Jason'])
+        assert not pagination.has_next
+
+    def test_unfilterable_column_is_ignored(self):
+        rv = self.client.get('/admin/list/Course/?flt_subject__eq=art')
+        self.assert_200(rv)
+        assert 'maths' in rv.data
+
+    def test_invalid_filter_value(self):
+        rv = self.client.get('/admin/list/Student/?flt_id__eq=abc&sort=name')
+        self.assertStatus(rv, 302)
+        assert 'flt_id__eq' not in rv.location
+        assert 'sort=name' in rv.location
+        rv = self.client.get(rv.location)
+        assert 'Invalid filter' in rv.data
+
+    def test_invalid_page_shows_first_page(self):
+        rv = self.client.get('/admin/list/Student/?page=abc&sort=name')
+        self.assert_200(rv)
+        assert 'Invalid filter' not in rv.data
+        assert 'Jason' in rv.data
+
+
+class SearchTest(TestCase):
+    TESTING = True
+
+    def create_app(self):
+        return test.search.create_app('sqlite://')
+
+    def setUp(self):
+        if not test.search.has_fts5():
+            self.skipTest('SQLite was built without FTS5')
+
+    def search(self, text, **kwargs):
+        pagination = self.app.datastore.create_model_pagination(
+            'Student', 1, search=text, **kwargs)
+        return [student.name for student in pagination.items]
+
+    def test_search_is_ranked(self):
+        self.assertEqual(self.search('maths'), ['Mike', 'Jason'])
+        self.assertEqual(self.search('maths', sort='name'),
+                         ['Jason', 'Mike'])
+
+    def test_search_prefix(self):
+        self.assertEqual(self.search('tub'), ['Stewart'])
+        self.assertEqual(self.search('"!'), [])
+
+    def test_index_kept_in_sync(self):
+        self.search('maths')
+        session = self.app.db_session
+        session.add(test.search.Student(name='Anna', bio='Tuba player'))
+        mike = session.query(test.search.Student).filter_by(name='Mike').one()
+        mike.bio = 'Likes art'
+        jason = session.query(test.search.Student).\
+            filter_by(name='Jason').one()
+        session.delete(jason)
+        session.commit()
+        self.assertEqual(sorted(self.search('tuba')), ['Anna', 'Stewart'])
+        self.assertEqual(self.search('maths'), [])
+        self.assertEqual(self.search('art'), ['Mike'])
+
+    def test_search_view(self):
+        rv = self.client.get('/admin/list/Student/?q=tuba')
+        self.assert_200(rv)
+        assert 'Stewart' in rv.data
+        assert 'Mike' not in rv.data
+        rv = self.client.get('/admin/list/Student/?q=bassoon')
+        assert 'No student matches' in rv.data
+
+    def test_missing_index_is_not_searched(self):
+        app = test.search.create_app('sqlite://', search_index=False)
+        assert not app.datastore.has_search_index('Student')
+        rv = app.test_client().get('/admin/list/Student/?q=tuba')
+        assert 'search index has not been created' in rv.data
+        assert 'Stewart' in rv.data
+        assert 'Mike' in rv.data
+        self.assertRaises(ValueError, app.datastore.create_model_pagination,
+                          'Student', 1, search='tuba')
+        assert not app.datastore.has_search_index('Student')
+
+
+class ExportTest(TestCase):
+    TESTING = True
+
+    def create_app(self):
+        app = simple.create_app('sqlite://')
+        for name in ("Stewart", "Mike", "Jason"):
+            app.db_session.add(simple.Student(name=name))
+        app.db_session.commit()
+        return app
+
+    def test_export_csv(self):
+        rv = self.client.get('/admin/export/Student/?format=csv&sort=name')
+        self.assert_200(rv)
+        self.assertEqual(rv.headers['Content-Disposition'],
+                         'attachment; filename=Student.csv')
+        self.assertEqual(rv.data.splitlines(),
+                         ['id,name', '3,Jason', '2,Mike', '1,Stewart'])
+
+    def test_export_jsonl_with_filters_and_columns(self):
+        rv = self.client.get('/admin/export/Student/?format=jsonl'
+                             '&columns=name&flt_id__gte=2')
+        self.assert_200(rv)
+        self.assertEqual([json.loads(line) for line in rv.data.splitlines()],
+                         [{'name': 'Mike'}, {'name': 'Jason'}])
+
+    def test_export_invalid_column(self):
+        rv = self.client.get('/admin/export/Student/?columns=courses')
+        self.assertStatus(rv, 302)
+
+    def test_export_unknown_format(self):
+        rv = self.client.get('/admin/export/Student/?format=xls')
+        self.assert_400(rv)
+
+    def test_iter_csv_chunks(self):
+        chunks = list(util.iter_csv(['a', 'b'],
+                                    [(i, u'\xe9') for i in range(5)],
+                                    rows_per_chunk=2))
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual(''.join(chunks).splitlines()[1], '0,\xc3\xa9')
+
+
+class BulkDeleteTest(TestCase):
+    TESTING = True
+
+    def create_app(self):
+        app = simple.create_app('sqlite://')
+        students = [simple.Student(name='Student%s' % i) for i in range(5)]
+        teacher = simple.Teacher(name="Mrs. Jones")
+        app.db_session.add(simple.Teacher(name="Mr. Smith"))
+        app.db_session.add(simple.Course(subject="maths", teacher=teacher,
+                                         students=students))
+        app.db_session.commit()
+        return app
+
+    def test_bulk_delete_in_batches(self):
+        datastore = SQLAlchemyDatastore(
+            (simple.Course, simple.Student, simple.Teacher),
+            self.app.db_session)
+        counts = datastore.delete_model_instances(
+            'Student', [['1'], ['2'], ['3'], ['4'], ['42']], batch_size=2)
+        self.assertEqual(counts, [2, 2, 0])
+        session = self.app.db_session
+        self.assertEqual(session.query(simple.Student).count(), 1)
+        # the association rows go along with the students
+        self.assertEqual(session.execute(
+            simple.course_student_association_table.count()).scalar(), 1)
+
+    def test_bulk_delete_through_session(self):
+        datastore = SQLAlchemyDatastore(
+            (simple.Course, simple.Student, simple.Teacher),
+            self.app.db_session)
+        # teachers have a one-to-many relationship, so they are
+        # deleted by the ORM
+        teacher = self.app.db_session.query(simple.Teacher).\
+            filter_by(name="Mr. Smith").one()
+        counts = datastore.delete_model_instances('Teacher',
+                                                  [[str(teacher.id)]])
+        self.assertEqual(counts, [1])
+        self.assertEqual(
+            [teacher.name for teacher in
+             self.app.db_session.query(simple.Teacher)], ["Mrs. Jones"])
+
+    def test_bulk_delete_refused_by_database(self):
+        # Mrs. Jones still teaches a course, whose teacher_id can't be
+        # NULL
+        teacher = self.app.db_session.query(simple.Teacher).\
+            filter_by(name="Mrs. Jones").one()
+        rv = self.client.post('/admin/delete/Teacher/',
+                              data={'model_url_key': [str(teacher.id)]})
+        self.assertStatus(rv, 302)
+        rv = self.client.get(rv.location)
+        assert 'Teacher could not be deleted' in rv.data
+        assert '0 of 1 selected Teacher deleted before the error' in rv.data
+        self.assertEqual(self.app.db_session.query(simple.Teacher).count(), 2)
+
+    def test_bulk_delete_view(self):
+        rv = self.client.post('/admin/delete/Student/',
+                              data={'model_url_key': ['1', '3']})
+        self.assertStatus(rv, 302)
+        rv = self.client.get(rv.location)
+        assert '2 of 2 selected Student deleted' in rv.data
+        assert 'Student0' not in rv.data
+        assert 'Student1' in rv.data
+
+    def test_row_checkboxes_are_outside_row_navigation(self):
+        # admin.js doesn't open the edit page for clicks in the
+        # select-cell, so that the checkboxes can be ticked; to check
+        # by hand, tick a row's checkbox on a list page and it should
+        # stay on the page
+        rv = self.client.get('/admin/list/Student/')
+        student = self.app.db_session.query(simple.Student).first()
+        assert '<td class="select-cell"><input type="checkbox" ' \
+            'name="model_url_key" value="%s"></td>' % student.id in rv.data
+        with open(os.path.join(os.path.dirname(admin.__file__), 'static',
+                               'js', 'admin.js')) as f:
+            assert "closest('td.select-cell')" in f.read()
+
+    def test_bulk_delete_invalid_keys(self):
+        rv = self.client.post('/admin/delete/Student/',
+                              data={'model_url_key': ['one']})
+        rv = self.client.get(rv.location)
+        assert 'No Student has been deleted' in rv.data
+        self.assertEqual(self.app.db_session.query(simple.Student).count(), 5)
+
+
+class ImportTest(TestCase):
+    TESTING = True
+
+    def create_app(self):
+        app = simple.create_app('sqlite://')
+        app.db_session.add(simple.Student(name="Stewart"))
+        app.db_session.add(simple.Teacher(name="Mrs. Jones"))
+        app.db_session.commit()
+        self.datastore = SQLAlchemyDatastore(
+            (simple.Course, simple.Student, simple.Teacher),
+            app.db_session)
+        return app
+
+    def test_import_csv_rows(self):
+        rows = util.iter_csv_rows(StringIO(
+            'name\nMike\nJason\nStewart\nAnna\n'))
+        result = self.datastore.import_model_rows('Student', rows,
+                                                  batch_size=2)
+        self.assertEqual(result.accepted, 3)
+        self.assertEqual(result.rejected, 1)
+        # the duplicate name is found by retrying its batch row by row
+        self.assertEqual(result.errors[0][0], 4)
+        self.assertEqual(
+            sorted([student.name for student in
+                    self.app.db_session.query(simple.Student)]),
+            ['Anna', 'Jason', 'Mike', 'Stewart'])
+
+    def test_import_csv_rows_that_cannot_be_read(self):
+        rows = util.iter_csv_rows(StringIO(
+            'name\nMike\nJos\xe9\nNul\x00l\nAnna\n'))
+        result = self.datastore.import_model_rows('Student', rows)
+        self.assertEqual(result.accepted, 2)
+        self.assertEqual(sorted([line_number for line_number, errors
+                                 in result.errors]), [3, 4])
+        rows = util.iter_csv_rows(StringIO('n\xe4me\nMike\n'))
+        self.assertEqual(list(rows), [(1, None)])
+
+    def test_import_jsonl_rows_are_validated(self):
+        rows = util.iter_jsonl_rows(StringIO(
+            '{"subject": "maths", "teacher_id": 1}\n'
+            '\n'
+            '{"subject": "art"}\n'
+            '[1, 2]\n'
+            '{"subject": "music", "teacher_id": 1, "id": 10}\n'))
+        result = self.datastore.import_model_rows('Course', rows)
+        self.assertEqual(result.accepted, 2)
+        # the row without a teacher is rejected by the database
+        self.assertEqual(sorted([line_number for line_number, errors
+                                 in result.errors]), [3, 4])
+        course = self.app.db_session.query(simple.Course).get(10)
+        self.assertEqual(course.subject, 'music')
+        self.assertEqual(course.teacher.name, 'Mrs. Jones')
+
+    def test_import_view(self):
+        rv = self.client.get('/admin/import/Student/')
+        self.assert_200(rv)
+        rv = self.client.post('/admin/import/Student/', data={
+            'format': 'csv',
+            'file': (StringIO('name\nMike\n'), 'students.csv')})
+        self.assert_200(rv)
+        assert '1 Student rows imported, 0 rejected.' in rv.data
+        self.assertEqual(self.app.db_session.query(simple.Student).count(), 2)
+
+
+class LookupTest(SQLAlchemyAdminTestCase):
+    datastore_options = dict(
+        lookup_columns={'Teacher': 'name', 'Student': 'name'})
+    blueprint_options = dict(lookup_limit=2)
+
+    def populate(self, db_session):
+        for name in ("Mrs. Jones", "Mr. Smith", "Mr. Simpson"):
+            db_session.add(simple.Teacher(name=name))
+        for name in ("Stewart", "Mike", "Jason"):
+            db_session.add(simple.Student(name=name))
+
+    def test_lookup(self):
+        rv = self.client.get('/admin/lookup/Course/teacher/?q=Mr.%20S')
+        self.assert_200(rv)
+        self.assertEqual(json.loads(rv.data)['options'], [
+            {'value': '3', 'label': 'Mr. Simpson'},
+            {'value': '2', 'label': 'Mr. Smith'}])
+        rv = self.client.get('/admin/lookup/Course/students/?q=&limit=10')
+        self.assertEqual(
+            [option['label'] for option in json.loads(rv.data)['options']],
+            ['Jason', 'Mike'])
+
+    def test_lookup_of_unknown_field(self):
+        rv = self.client.get('/admin/lookup/Course/subject/?q=m')
+        self.assert_404(rv)
+        rv = self.client.get('/admin/lookup/Nothing/teacher/?q=m')
+        self.assert_404(rv)
+
+    def test_only_selected_options_are_rendered(self):
+        rv = self.client.get('/admin/add/Course/')
+        assert 'remote-select' in rv.data
+        assert '/admin/lookup/Course/teacher/' in rv.data
+        assert 'Mrs. Jones' not in rv.data
+        assert 'Stewart' not in rv.data
+
+        rv = self.client.post('/admin/add/Course/',
+                              data=dict(subject='maths', teacher='2',
+                                        students=['1', '3']))
+        self.assert_redirects(rv, '/admin/list/Course/')
+        course = self.app.db_session.query(simple.Course).one()
+        self.assertEqual(course.teacher.name, 'Mr. Smith')
+        self.assertEqual(sorted([student.name for student in course.students]),
+                         ['Jason', 'Stewart'])
+
+        rv = self.client.get('/admin/edit/Course/%s/' % course.id)
+        assert 'Mr. Smith' in rv.data
+        assert 'Mrs. Jones' not in rv.data
+        assert 'Stewart' in rv.data
+        assert 'Mike' not in rv.data
+
+    def test_unknown_keys_are_invalid(self):
+        rv = self.client.post('/admin/add/Course/',
+                              data=dict(subject='maths', teacher='99'))
+        self.assert_200(rv)
+        assert 'Not a valid choice' in rv.data
+        self.assertEqual(self.app.db_session.query(simple.Course).count(), 0)
+
+
+class ChoiceCacheTest(TestCase):
+    TESTING = True
+
+    def create_app(self):
+        app = simple.create_app('sqlite://')
+        teacher = simple.Teacher(name="Mrs. Jones")
+        app.db_session.add(simple.Teacher(name="Mr. Smith"))
+        app.db_session.add(simple.Course(subject="maths", teacher=teacher))
+        app.db_session.commit()
+        return app
+
+    def create_datastore(self, max_size=10):
+        return SQLAlchemyDatastore(
+            (simple.Course, simple.Student, simple.Teacher),
+            self.app.db_session, cached_choices={'Teacher': max_size})
+
+    def get_choice_names(self, datastore):
+        return [teacher.name for teacher
+                in datastore.choice_cache.get_choices(simple.Teacher)]
+
+    def test_choices_are_cached(self):
+        datastore = self.create_datastore()
+        self.assertEqual(self.get_choice_names(datastore),
+                         ['Mr. Smith', 'Mrs. Jones'])
+        # changes that don't go through the session aren't noticed
+        self.app.db_session.execute(simple.Teacher.__table__.delete().where(
+            simple.Teacher.name == 'Mr. Smith'))
+        self.app.db_session.commit()
+        self.app.db_session.remove()
+        self.assertEqual(self.get_choice_names(datastore),
+                         ['Mr. Smith', 'Mrs. Jones'])
+        datastore.choice_cache.invalidate()
+        self.assertEqual(self.get_choice_names(datastore), ['Mrs. Jones'])
+
+    def test_commits_invalidate_choices(self):
+        datastore = self.create_datastore()
+        self.get_choice_names(datastore)
+        self.app.db_session.add(simple.Teacher(name="Ms. Brown"))
+        self.app.db_session.commit()
+        self.assertEqual(self.get_choice_names(datastore),
+                         ['Mr. Smith', 'Mrs. Jones', 'Ms. Brown'])
+        smith = self.app.db_session.query(simple.Teacher).\
+            filter_by(name="Mr. Smith").one()
+        datastore.delete_model_instance('Teacher', [smith.id])
+        self.assertEqual(self.get_choice_names(datastore),
+                         ['Mrs. Jones', 'Ms. Brown'])
+
+    def test_large_tables_are_not_cached(self):
+        datastore = self.create_datastore(max_size=1)
+        self.assertEqual(self.get_choice_names(datastore),
+                         ['Mr. Smith', 'Mrs. Jones'])
+        self.assertEqual(datastore.choice_cache._choices[simple.Teacher][1],
+                         None)
+
+    def test_edit_form_selects_cached_choice(self):
+        datastore = self.create_datastore()
+        self.get_choice_names(datastore)
+        self.app.db_session.remove()
+        course = datastore.find_model_instance(
+            'Course', datastore.get_model_keys(
+                self.app.db_session.query(simple.Course).one()))
+        form = datastore.get_model_form('Course')(obj=course)
+        self.assertEqual([label for value, label, selected
+                          in form.teacher.iter_choices() if selected],
+                         ['Mrs. Jones'])
+        for teacher in form.teacher.query_factory():
+            assert teacher in self.app.db_session
+
+
+class ChoiceLoadTest(TestCase):
+    TESTING = True
+
+    def create_app(self):
+        # an in-memory database would share one connection between
+        # threads, so the choices would be left to load as needed
+        fd, self.db_path = tempfile.mkstemp(suffix='.db')
+        os.close(fd)
+        app = simple.create_app('sqlite:///' + self.db_path)
+        teacher = simple.Teacher(name="Mrs. Jones")
+        for name in ("Stewart", "Mike"):
+            app.db_session.add(simple.Student(name=name))
+        app.db_session.add(simple.Course(subject="maths", teacher=teacher))
+        app.db_session.commit()
+        app.db_session.remove()
+        return app
+
+    def tearDown(self):
+        self.app.db_session.remove()
+        os.remove(self.db_path)
+
+    def test_choices_load_concurrently(self):
+        datastore = SQLAlchemyDatastore(
+            (simple.Course, simple.Student, simple.Teacher),
+            self.app.db_session)
+        engine = self.app.db_session.get_bind(
+            sa.orm.class_mapper(simple.Course))
+        threads = set()
+
+        def before_cursor_execute(*args, **kwargs):
+            threads.add(threading.current_thread())
+        sa.event.listen(engine, 'before_cursor_execute',
+                        before_cursor_execute)
+
+        course = self.app.db_session.query(simple.Course).one()
+        form = datastore.get_model_form('Course')(obj=course)
+        threads.clear()
+        datastore.load_form_choices(form)
+        assert threading.current_thread() not in threads
+        self.assertEqual([student.name for student in form.students.query],
+                         ['Mike', 'Stewart'])
+        for student in form.students.query:
+            assert student in self.app.db_session
+        # the loaded choices are labelled by text, not by instance
+        self.assertEqual([label for value, label, selected
+                          in form.students.iter_choices()],
+                         [u'Mike', u'Stewart'])
+        self.assertEqual([label for value, label, selected
+                          in form.teacher.iter_choices() if selected],
+                         [u'Mrs. Jones'])
+
+
+class ConditionalGetTest(SQLAlchemyAdminTestCase):
+    blueprint_options = dict(conditional_get=True)
+
+    def populate(self, db_session):
+        db_session.add(simple.Student(name="Stewart"))
+
+    def get(self, url, etag=None):
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = '"%s"' % etag
+        return self.client.get(url, headers=headers)
+
+    def test_unchanged_list_is_not_modified(self):
+        rv = self.get('/admin/list/Student/')
+        self.assert_200(rv)
+        etag = rv.headers['ETag'].strip('"')
+        rv = self.get('/admin/list/Student/', etag)
+        self.assertEqual(rv.status_code, 304)
+        self.assertEqual(rv.data, '')
+        rv = self.get('/admin/list/Student/?sort=name', etag)
+        self.assert_200(rv)
+
+    def test_changes_give_a_new_etag(self):
+        rv = self.get('/admin/list/Student/')
+        etag = rv.headers['ETag'].strip('"')
+        self.app.db_session.add(simple.Student(name="Mike"))
+        self.app.db_session.commit()
+        rv = self.get('/admin/list/Student/', etag)
+        self.assert_200(rv)
+        assert 'Mike' in rv.data
+        assert rv.headers['ETag'].strip('"') != etag
+
+    def test_related_changes_give_the_edit_page_a_new_etag(self):
+        teacher = simple.Teacher(name="Mrs. Jones")
+        self.app.db_session.add(simple.Course(subject="maths",
+                                              teacher=teacher))
+        self.app.db_session.commit()
+        rv = self.get('/admin/edit/Course/1/')
+        etag = rv.headers['ETag'].strip('"')
+        self.assertEqual(self.get('/admin/edit/Course/1/', etag).status_code,
+                         304)
+        teacher.name = "Mrs. Smith"
+        self.app.db_session.commit()
+        rv = self.get('/admin/edit/Course/1/', etag)
+        self.assert_200(rv)
+        assert 'Mrs. Smith' in rv.data
+
+    def test_datastores_without_versions_give_no_etag(self):
+        self.datastore.get_model_version = lambda model_name: None
+        rv = self.get('/admin/list/Student/')
+        self.assert_200(rv)
+        assert 'ETag' not in rv.headers
+
+    def test_pages_with_flashed_messages_are_rendered(self):
+        rv = self.get('/admin/list/Student/')
+        etag = rv.headers['ETag'].strip('"')
+        with self.client.session_transaction() as session:
+            session['_flashes'] = [('success', 'Student updated')]
+        rv = self.get('/admin/list/Student/', etag)
+        self.assert_200(rv)
+        assert 'Student updated' in rv.data
+
+
+class StaticFingerprintTest(TestCase):
+    TESTING = True
+
+    def create_app(self):
+        return simple.create_app('sqlite://')
+
+    def test_static_urls_are_fingerprinted(self):
+        fingerprint = util.StaticFingerprints(os.path.join(
+            os.path.dirname(admin.__file__), 'static')).get('css/style.css')
+        with self.app.test_request_context():
+            url = flask.url_for('admin.static', filename='css/style.css')
+        self.assertEqual(url, '/admin/static/css/style.css?v=%s' % fingerprint)
+
+        rv = self.client.get('/admin/static/css/style.css?v=%s' % fingerprint)
+        self.assert_200(rv)
+        assert 'immutable' in rv.headers['Cache-Control']
+        rv = self.client.get('/admin/static/css/style.css?v=0')
+        assert 'immutable' not in rv.headers.get('Cache-Control', '')
+
+    def test_changed_files_are_hashed_again(self):
+        folder = tempfile.mkdtemp()
+        try:
+            path = os.path.join(folder, 'style.css')
+            with open(path, 'w') as f:
+                f.write('body {}')
+            fingerprints = util.StaticFingerprints(folder)
+            fingerprint = fingerprints.get('style.css')
+            self.assertEqual(fingerprints.get('missing.css'), None)
+
+            with open(path, 'w') as f:
+                f.write('body { color: red; }')
+            os.utime(path, (0, 0))
+            self.assertEqual(fingerprints.get('style.css'), fingerprint)
+            assert fingerprints.get('style.css', check_mtime=True) != \
+                fingerprint
+        finally:
+            shutil.rmtree(folder)
+
+
+class AssetBundleTest(TestCase):
+    TESTING = True
+
+    def create_app(self):
+        return simple.create_app('sqlite://')
+
+    def test_bundles_are_up_to_date(self):
+        static_folder = os.path.join(os.path.dirname(admin.__file__),
+                                     'static')
+        for bundle in assets.BUNDLES:
+            with open(os.path.join(static_folder, bundle)) as f:
+                self.assertEqual(
+                    f.read().decode('utf-8'),
+                    assets.build_bundle(static_folder, bundle),
+                    '%s is out of date, run python -m flask_admin.assets'
+                    % bundle)
+
+    def test_pages_include_the_bundles(self):
+        rv = self.client.get('/admin/')
+        assert '/admin/static/css/admin.bundle.css?v=' in rv.data
+        assert '/admin/static/js/admin.bundle.js?v=' in rv.data
+        self.assertEqual(rv.data.count('<link rel="stylesheet"'), 1)
+        assert 'fonts.googleapis.com' not in rv.data
+        # Modernizr is left out of the bundle so it runs in the head,
+        # and only old IE, which needs it, loads it
+        html = re.sub(r'(?s)<!--\[if .*?<!\[endif\]-->', '', rv.data)
+        self.assertEqual(html.count('<script src='), 1)
+        assert 'modernizr' not in html
+        assert rv.data.index('modernizr') < rv.data.index('</head>')
+        assert 'http://' not in rv.data
+        assert 'https://' not in rv.data
+
+    def test_debug_pages_include_the_bundled_files(self):
+        self.app.debug = True
+        rv = self.client.get('/admin/')
+        assert 'admin.bundle' not in rv.data
+        for filenames in assets.BUNDLES.values():
+            for filename in filenames:
+                assert '/admin/static/%s?v=' % filename in rv.data
+
+    def test_css_urls_are_rebased(self):
+        css = u"a { background: url('images/x.png') }\n" \
+              u"b { background: url(data:image/png;base64,AA==) }\n" \
+              u"/* comment */ c { background: url(http://x/y.png) }"
+        self.assertEqual(
+            assets.minify_css(assets.rebase_css_urls(css, 'css/Aristo',
+                                                     'css')),
+            u"a{background: url(Aristo/images/x.png)}"
+            u"b{background: url(data:image/png;base64,AA==)}"
+            u"c{background: url(http://x/y.png)}")
+
+
+class StaticCompressionTest(TestCase):
+    TESTING = True
+
+    def create_app(self):
+        return simple.create_app('sqlite://')
+
+    def create_sendfile_app(self, **kwargs):
+        app = Flask(__name__)
+        datastore = SQLAlchemyDatastore((simple.Student,),
+                                        self.app.db_session)
+        app.register_blueprint(admin.create_admin_blueprint(
+            datastore, **kwargs), url_prefix='/admin')
+        return app
+
+    def read_static(self, filename):
+        path = os.path.join(os.path.dirname(admin.__file__), 'static',
+                            filename)
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def test_compressed_files_are_up_to_date(self):
+        for filename in assets.BUNDLES['js/admin.bundle.js']:
+            if filename.endswith('.min.js'):
+                self.assertEqual(
+                    gzip.GzipFile(fileobj=StringIO(
+                        self.read_static(filename + '.gz'))).read(),
+                    self.read_static(filename))
+
+    def test_gzip_is_served_when_accepted(self):
+        rv = self.client.get('/admin/static/js/admin.bundle.js',
+                             headers={'Accept-Encoding': 'gzip, deflate'})
+        self.assert_200(rv)
+        self.assertEqual(rv.headers['Content-Encoding'], 'gzip')
+        assert 'Accept-Encoding' in rv.headers['Vary']
+        self.assertEqual(
+            gzip.GzipFile(fileobj=StringIO(rv.data)).read(),
+            self.read_static('js/admin.bundle.js'))
+
+    def test_identity_is_served_otherwise(self):
+        rv = self.client.get('/admin/static/js/admin.bundle.js',
+                             headers={'Accept-Encoding': 'gzip;q=0'})
+        self.assert_200(rv)
+        assert 'Content-Encoding' not in rv.headers
+        assert 'Accept-Encoding' in rv.headers['Vary']
+        self.assertEqual(rv.data, self.read_static('js/admin.bundle.js'))
+
+        rv = self.client.get('/admin/static/css/style.css',
+                             headers={'Accept-Encoding': 'gzip'})
+        assert 'Content-Encoding' not in rv.headers
+        assert 'Vary' not in rv.headers
+        self.assert_404(self.client.get('/admin/static/../__init__.py'))
+
+    def test_x_sendfile(self):
+        client = self.create_sendfile_app(
+            static_sendfile='x-sendfile').test_client()
+        rv = client.get('/admin/static/js/admin.bundle.js',
+                        headers={'Accept-Encoding': 'gzip'})
+        self.assertEqual(rv.data, '')
+        assert 'javascript' in rv.headers['Content-Type']
+        self.assertEqual(rv.headers['Content-Encoding'], 'gzip')
+        assert rv.headers['X-Sendfile'].endswith(
+            os.path.join('static', 'js', 'admin.bundle.js.gz'))
+
+    def test_x_accel_redirect(self):
+        client = self.create_sendfile_app(
+            static_sendfile='x-accel-redirect',
+            static_accel_prefix='/_admin_static/').test_client()
+        rv = client.get('/admin/static/css/style.css')
+        self.assertEqual(rv.data, '')
+        self.assertEqual(rv.headers['X-Accel-Redirect'],
+                         '/_admin_static/css/style.css')
+        self.assertRaises(ValueError, self.create_sendfile_app,
+                          static_sendfile='x-accel-redirect')
+
+
+class APITest(SQLAlchemyAdminTestCase):
+    blueprint_options = dict(api_max_per_page=2)
+
+    def populate(self, db_session):
+        teacher = simple.Teacher(name="Mrs. Jones")
+        db_session.add(simple.Course(subject="Maths", teacher=teacher))
+        for name in ("Stewart", "Mike", "Jason"):
+            db_session.add(simple.Student(name=name))
+
+    def send_json(self, url, data, method='POST'):
+        return self.client.open(url, method=method, data=json.dumps(data),
+                                content_type='application/json')
+
+    def get_key(self, model_class, **kwargs):
+        instance = self.app.db_session.query(model_class).\
+            filter_by(**kwargs).one()
+        return str(instance.id)
+
+    def test_list(self):
+        rv = self.client.get('/admin/api/Student/?fields=name&per_page=10')
+        self.assert_200(rv)
+        self.assertEqual(rv.headers['Content-Type'], 'application/json')
+        data = json.loads(rv.data)
+        self.assertEqual([item['name'] for item in data['items']],
+                         ['Stewart', 'Mike'])
+        self.assertEqual(sorted(data['items'][0].keys()), ['_key', 'name'])
+        self.assertEqual(data['total'], 3)
+        assert data['has_next']
+
+        rv = self.client.get('/admin/api/Student/?page=2')
+        data = json.loads(rv.data)
+        self.assertEqual(data['items'], [
+            {'_key': self.get_key(simple.Student, name="Jason"),
+             'id': int(self.get_key(simple.Student, name="Jason")),
+             'name': 'Jason'}])
+        assert not data['has_next']
+
+    def test_list_by_cursor(self):
+        rv = self.client.get('/admin/api/Student/?fields=name&cursor=')
+        data = json.loads(rv.data)
+        self.assertEqual(len(data['items']), 2)
+        rv = self.client.get('/admin/api/Student/?fields=name&cursor=%s'
+                             % data['next_cursor'])
+        data = json.loads(rv.data)
+        self.assertEqual(data['items'][0]['name'], 'Jason')
+        self.assertEqual(data['next_cursor'], None)
+
+    def test_invalid_list_args(self):
+        self.assert_400(self.client.get('/admin/api/Student/?fields=oops'))
+        self.assert_400(self.client.get('/admin/api/Student/?cursor=oops'))
+        self.assert_404(self.client.get('/admin/api/Nothing/'))
+
+    def test_detail(self):
+        key = self.get_key(simple.Student, name="Mike")
+        rv = self.client.get('/admin/api/Student/%s/?fields=name' % key)
+        self.assert_200(rv)
+        self.assertEqual(json.loads(rv.data), {'_key': key, 'name': 'Mike'})
+        self.assert_404(self.client.get('/admin/api/Student/100/'))
+
+    def test_add(self):
+        rv = self.send_json('/admin/api/Student/', {'name': 'Sarah'})
+        self.assertEqual(rv.status_code, 201)
+        key = self.get_key(simple.Student, name="Sarah")
+        self.assertEqual(json.loads(rv.data)['_key'], key)
+        assert rv.headers['Location'].endswith('/admin/api/Student/%s/' % key)
+
+        teacher_key = self.get_key(simple.Teacher, name="Mrs. Jones")
+        rv = self.send_json('/admin/api/Course/', {
+            'subject': 'Art', 'teacher': teacher_key,
+            'students': [key]})
+        self.assertEqual(rv.status_code, 201)
+        course = self.app.db_session.query(simple.Course).\
+            filter_by(subject='Art').one()
+        self.assertEqual([student.name for student in course.students],
+                         ['Sarah'])
+
+    def test_invalid_add(self):
+        rv = self.send_json('/admin/api/Course/', {'subject': 'Art'})
+        self.assert_400(rv)
+        assert 'teacher' in json.loads(rv.data)['errors']
+        self.assertEqual(
+            self.app.db_session.query(simple.Course).count(), 1)
+
+    def test_update_only_changes_given_fields(self):
+        key = self.get_key(simple.Course, subject="Maths")
+        rv = self.send_json('/admin/api/Course/%s/' % key,
+                            {'subject': 'Algebra'}, method='PATCH')
+        self.assert_200(rv)
+        self.assertEqual(json.loads(rv.data)['subject'], 'Algebra')
+        self.app.db_session.remove()
+        course = self.app.db_session.query(simple.Course).one()
+        self.assertEqual(course.subject, 'Algebra')
+        self.assertEqual(course.teacher.name, 'Mrs. Jones')
+
+    def test_delete(self):
+        key = self.get_key(simple.Student, name="Mike")
+        rv = self.client.open('/admin/api/Student/%s/' % key,
+                              method='DELETE')
+        self.assertEqual(rv.status_code, 204)
+        rv = self.client.open('/admin/api/Student/%s/' % key,
+                              method='DELETE')
+        self.assert_404(rv)
+
+
+class APIPatchTest(TestCase):
+    TESTING = True
+
+    def create_app(self):
+        app = test.api_patch.create_app('sqlite://')
+        category = test.api_patch.Category(name="News")
+        app.db_session.add(test.api_patch.Post(
+            title="Hello", published=True, category=category))
+        app.db_session.commit()
+        return app
+
+    def patch_post(self, data):
+        post = self.app.db_session.query(test.api_patch.Post).one()
+        rv = self.client.open('/admin/api/Post/%s/' % post.id,
+                              method='PATCH', data=json.dumps(data),
+                              content_type='application/json')
+        self.assert_200(rv)
+        self.app.db_session.remove()
+        return self.app.db_session.query(test.api_patch.Post).one()
+
+    def test_null_clears_relationship(self):
+        post = self.patch_post({'category': None})
+        self.assertEqual(post.category, None)
+        self.assertEqual(post.title, 'Hello')
+        self.assertEqual(post.published, True)
+
+    def test_false_unchecks_boolean(self):
+        post = self.patch_post({'published': False})
+        self.assertEqual(post.published, False)
+        self.assertEqual(post.category.name, 'News')
+
+    def test_null_clears_text(self):
+        post = self.patch_post({'title': None, 'published': False})
+        assert not post.title
+        self.assertEqual(post.published, False)
+
+
+class ListFragmentTest(TestCase):
+    TESTING = True
+
+    def create_app(self):
+        app = simple.create_app('sqlite://', pagination=2)
+        for name in ("Stewart", "Mike", "Jason"):
+            app.db_session.add(simple.Student(name=name))
+        app.db_session.commit()
+        return app
+
+    def test_fragment(self):
+        rv = self.client.get('/admin/list/Student/?page=2&fragment=1')
+        self.assert_200(rv)
+        assert rv.data.lstrip().startswith('<table>')
+        assert '<tbody>' in rv.data
+        assert 'Jason' in rv.data
+        assert 'Stewart' not in rv.data
+        self.assertEqual(rv.data.count('class="pagination"'), 1)
+        assert '/admin/list/Student/?page=1' in rv.data
+        assert 'fragment' not in rv.data
+        assert 'navbar' not in rv.data
+        assert '<script' not in rv.data
+
+    def test_xhr_gets_a_fragment(self):
+        rv = self.client.get('/admin/list/Student/',
+                             headers={'X-Requested-With': 'XMLHttpRequest'})
+        assert 'Stewart' in rv.data
+        assert 'navbar' not in rv.data
+        assert 'X-Requested-With' in rv.headers['Vary']
+
+        rv = self.client.get('/admin/list/Student/')
+        assert 'Stewart' in rv.data
+        assert 'navbar' in rv.data
+        self.assertEqual(rv.data.count('class="pagination"'), 2)
+
+
+class StreamedListTest(SQLAlchemyAdminTestCase):
+    datastore_options = dict(count_strategies={'Student': NoCount()})
+    blueprint_options = dict(list_view_pagination=10, stream_list_view=True)
+
+    def populate(self, db_session):
+        for i in range(25):
+            db_session.add(simple.Student(name="Student%02d" % i))
+
+    def test_streamed_items(self):
+        pagination = self.datastore.create_model_pagination(
+            'Student', 3, per_page=10, stream=True)
+        assert isinstance(pagination.items, util.StreamedItems)
+        assert pagination.items
+        self.assertEqual([student.name for student in pagination.items],
+                         ['Student%02d' % i for i in range(20, 25)])
+        self.assertEqual(list(pagination.items), [])
+        assert not pagination.has_next
+
+        pagination = self.datastore.create_model_pagination(
+            'Student', 2, per_page=10, stream=True)
+        assert pagination.has_next
+        pagination = self.datastore.create_model_pagination(
+            'Student', 4, per_page=10, stream=True)
+        assert not pagination.items
+
+    def test_streamed_list_view(self):
+        rv = self.client.get('/admin/list/Student/?page=2')
+        self.assert_200(rv)
+        assert 'Student10' in rv.data
+        assert 'Student19' in rv.data
+        assert 'Student20' not in rv.data
+        assert '<a href="/admin/list/Student/?page=3">></a>' in rv.data
+        assert rv.data.rstrip().endswith('</html>')
+
+        rv = self.client.get('/admin/list/Student/?page=4')
+        self.assert_200(rv)
+        assert 'edit-link' not in rv.data
+
+    def test_stream_queries_are_not_lazy_loads(self):
+        engine = self.app.db_session.get_bind(
+            sa.orm.class_mapper(simple.Student))
+        queries = []
+
+        def before_cursor_execute(*args, **kwargs):
+            queries.append(args[2])
+        sa.event.listen(engine, 'before_cursor_execute',
+                        before_cursor_execute)
+
+        pagination = self.datastore.create_model_pagination(
+            'Student', 2, per_page=10, stream=True)
+        del queries[:]
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            with self.datastore.warn_lazy_loads('Student'):
+                self.assertEqual(len(list(pagination.items)), 10)
+        # the rows are selected while the list is rendered, but that
+        # isn't a lazy load
+        assert queries
+        assert not [warning for warning in caught
+                    if issubclass(warning.category, LazyLoadWarning)]
+
+        self.app.debug = True
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            rv = self.client.get('/admin/list/Student/?page=2')
+            self.assert_200(rv)
+            assert 'Student19' in rv.data
+        assert not [warning for warning in caught
+                    if issubclass(warning.category, LazyLoadWarning)]
+
+
+class TemplateCacheTest(SQLAlchemyAdminTestCase):
+    models = (simple.Student,)
+
+    def create_app(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.blueprint_options = dict(template_cache_dir=self.cache_dir,
+                                      precompile_templates=True)
+        return super(TemplateCacheTest, self).create_app()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def test_templates_are_precompiled_into_the_cache(self):
+        template_names = util.list_templates(os.path.join(
+            os.path.dirname(admin.__file__), 'templates'))
+        assert 'admin/list.html' in template_names
+        cached = [name for name in os.listdir(self.cache_dir)
+                  if name.endswith('.cache')]
+        self.assertEqual(len(cached), len(template_names))
+
+        # a second app loads them from the cache
+        app = self.create_admin_app()
+        self.assertEqual(sorted(os.listdir(self.cache_dir)), sorted(cached))
+        rv = app.test_client().get('/admin/list/Student/')
+        self.assertEqual(rv.status_code, 200)
+
+    def test_existing_bytecode_caches_are_kept(self):
+        app = Flask(__name__)
+        bytecode_cache = util.TemplateBytecodeCache(self.cache_dir)
+        app.jinja_env.bytecode_cache = bytecode_cache
+        app.register_blueprint(admin.create_admin_blueprint(
+            SQLAlchemyDatastore((simple.Student,), self.app.db_session),
+            template_cache_dir=os.path.join(self.cache_dir, 'other')))
+        assert app.jinja_env.bytecode_cache is bytecode_cache
+
+
+class RequestMemoTest(SQLAlchemyAdminTestCase):
+    def create_datastore(self, db_session):
+        datastore = super(RequestMemoTest, self).create_datastore(db_session)
+        self.calls = []
+        for name in ('list_model_names', 'get_model_form'):
+            setattr(datastore, name, self.counted(getattr(datastore, name)))
+        return datastore
+
+    def populate(self, db_session):
+        db_session.add(simple.Student(name="Stewart"))
+
+    def counted(self, method):
+        def wrapper(*args):
+            self.calls.append(method.__name__)
+            return method(*args)
+        wrapper.__name__ = method.__name__
+        return wrapper
+
+    def test_datastore_lookups_are_memoized_per_request(self):
+        self.assert_200(self.client.get('/admin/list/Student/'))
+        self.assertEqual(self.calls, ['list_model_names'])
+        student = self.app.db_session.query(simple.Student).one()
+        self.assert_200(self.client.get('/admin/edit/Student/%s/'
+                                        % student.id))
+        self.assertEqual(self.calls, ['list_model_names'] * 2 +
+                         ['get_model_form'])
+
+    def test_nav_is_sorted(self):
+        rv = self.client.get('/admin/')
+        links = ['<a href="/admin/list/%s/?page=1">%s</a>'
+                 % (name, name.lower())
+                 for name in ('Course', 'Student', 'Teacher')]
+        positions = [rv.data.index(link) for link in links]
+        self.assertEqual(positions, sorted(positions))
+        rv = self.client.get('/admin/list/Course/')
+        for link in links:
+            assert link in rv.data
+
+
+class LazyFormTest(TestCase):
+    TESTING = True
+
+    def create_app(self):
+        return simple.create_app('sqlite://')
+
+    def create_datastore(self, **kwargs):
+        return SQLAlchemyDatastore(
+            (simple.Course, simple.Student, simple.Teacher),
+            self.app.db_session, **kwargs)
+
+    def test_forms_are_generated_on_first_use(self):
+        datastore = self.create_datastore()
+        self.assertEqual(datastore.form_dict, {})
+        form = datastore.get_model_form('Student')
+        assert datastore.get_model_form('Student') is form
+        self.assertEqual(datastore.form_dict.keys(), ['Student'])
+
+    def test_custom_forms_are_not_generated(self):
+        datastore = self.create_datastore(
+            model_forms={'Student': test.custom_form.UserForm})
+        assert datastore.get_model_form('Student') is \
+            test.custom_form.UserForm
+
+    def test_forms_are_generated_once_across_threads(self):
+        datastore = self.create_datastore()
+        forms = []
+
+        def get_form():
+            forms.append(datastore.get_model_form('Course'))
+        threads = [threading.Thread(target=get_form) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(set(forms)), 1)
+
+    def test_has_file_field_is_cached_per_form_class(self):
+        form_class = test.custom_form.UserForm
+        assert not has_file_field(form_class())
+        self.assertEqual(_file_field_forms[form_class], False)
+
+
+class FormCacheTest(TestCase):
+    TESTING = True
+
+    def create_app(self):
+        self.cache_dir = tempfile.mkdtemp()
+        return simple.create_app('sqlite://')
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def create_datastore(self):
+        return SQLAlchemyDatastore(
+            (simple.Course, simple.Student, simple.Teacher),
+            self.app.db_session, form_cache_dir=self.cache_dir)
+
+    def test_forms_are_rebuilt_from_cache(self):
+        generated = self.create_datastore().get_model_form('Course')
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+        def fail(*args, **kwargs):
+            raise AssertionError('the form should come from the cache')
+        form_for_model = sqlalchemy_datastore._form_for_model
+        sqlalchemy_datastore._form_for_model = fail
+        try:
+            cached = self.create_datastore().get_model_form('Course')
+        finally:
+            sqlalchemy_datastore._form_for_model = form_for_model
+
+        assert cached is not generated
+        self.assertEqual(
+            [(field.name, type(field)) for field in cached()],
+            [(field.name, type(field)) for field in generated()])
+        teacher = simple.Teacher(name="Mrs. Jones")
+        self.app.db_session.add(teacher)
+        self.app.db_session.commit()
+        self.assertEqual(list(cached().teacher.query_factory()), [teacher])
+
+    def test_schema_changes_invalidate_the_cache(self):
+        datastore = self.create_datastore()
+        datastore.get_model_form('Course')
+        datastore.exclude_pks = False
+        datastore.form_dict.clear()
+        form = datastore.get_model_form('Course')
+        assert 'id' in [field.name for field in form()]
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+    def test_untrusted_cache_files_are_ignored(self):
+        self.create_datastore().get_model_form('Course')
+        path = os.path.join(self.cache_dir, os.listdir(self.cache_dir)[0])
+        description = json.load(open(path))
+        name, field_class, args, kwargs = description['fields'][0]
+        tampered = [
+            dict(description, base={'__class__': 'os:system'}),
+            dict(description, fields=[
+                [name, {'__class__': 'subprocess:Popen'}, args, kwargs]]),
+            dict(description, fields=[
+                [name, field_class, args,
+                 dict(kwargs, widget={'__object__': 'subprocess:Popen',
+                                      'attrs': {}})]]),
+        ]
+        for tampered_description in tampered:
+            json.dump(tampered_description, open(path, 'w'))
+            form = self.create_datastore().get_model_form('Course')
+            assert 'teacher' in [field.name for field in form()]
+            self.assertEqual(json.load(open(path)), description)
+
+
 class FileFieldTest(TestCase):
     TESTING = True
 
@@ -442,6 +2015,50 @@ class MASimpleTest(TestCase):
         self.assertEqual(self.app.db_session.query(ma_simple.Teacher).count(), 1)
         self.assert_redirects(rv, '/admin/list/Teacher/')
 
+    def test_keyset_pagination_with_nulls(self):
+        # documents with a null subject and without one sort first
+        collection = self.app.db_session.db[
+            ma_simple.Course.get_collection_name()]
+        collection.insert({'subject': None})
+        collection.insert({})
+        self.app.db_session.insert(ma_simple.Course(
+                subject="Art",
+                start_date=datetime(2011, 8, 12),
+                end_date=datetime(2011, 12, 16)))
+        datastore = MongoAlchemyDatastore(
+            (ma_simple.Course,), self.app.db_session,
+            sortable_columns={'Course': ['mongo_id', 'subject']})
+
+        for sort_desc in (False, True):
+            expected = [None, None, 'Art', 'Maths']
+            if sort_desc:
+                expected.reverse()
+
+            subjects = []
+            cursor = None
+            while True:
+                pagination = datastore.create_model_keyset_pagination(
+                    'Course', cursor, per_page=1, sort='subject',
+                    sort_desc=sort_desc)
+                subjects.extend(getattr(item, 'subject', None)
+                                for item in pagination.items)
+                cursor = pagination.next_cursor
+                if not cursor:
+                    break
+            self.assertEqual(subjects, expected)
+
+            # and back again from the last page
+            subjects = []
+            cursor = pagination.prev_cursor
+            while cursor:
+                pagination = datastore.create_model_keyset_pagination(
+                    'Course', cursor, per_page=1, sort='subject',
+                    sort_desc=sort_desc)
+                subjects[:0] = [getattr(item, 'subject', None)
+                                for item in pagination.items]
+                cursor = pagination.prev_cursor
+            self.assertEqual(subjects, expected[:-1])
+
     def test_delete(self):
         student_query = self.app.db_session.query(ma_simple.Student)
         self.assertEqual(student_query.count(), 3)
@@ -469,6 +2086,32 @@ def suite():
     suite.addTest(unittest.makeSuite(ExcludePKsFalseTest))
     suite.addTest(unittest.makeSuite(SmallPaginationTest))
     suite.addTest(unittest.makeSuite(LargePaginationTest))
+    suite.addTest(unittest.makeSuite(KeysetPaginationTest))
+    suite.addTest(unittest.makeSuite(CountStrategyTest))
+    suite.addTest(unittest.makeSuite(ListColumnsTest))
+    suite.addTest(unittest.makeSuite(LazyLoadWarningTest))
+    suite.addTest(unittest.makeSuite(EagerLoadTest))
+    suite.addTest(unittest.makeSuite(SortTest))
+    suite.addTest(unittest.makeSuite(FilterTest))
+    suite.addTest(unittest.makeSuite(SearchTest))
+    suite.addTest(unittest.makeSuite(ExportTest))
+    suite.addTest(unittest.makeSuite(BulkDeleteTest))
+    suite.addTest(unittest.makeSuite(ImportTest))
+    suite.addTest(unittest.makeSuite(LazyFormTest))
+    suite.addTest(unittest.makeSuite(FormCacheTest))
+    suite.addTest(unittest.makeSuite(LookupTest))
+    suite.addTest(unittest.makeSuite(ChoiceCacheTest))
+    suite.addTest(unittest.makeSuite(ChoiceLoadTest))
+    suite.addTest(unittest.makeSuite(ConditionalGetTest))
+    suite.addTest(unittest.makeSuite(StaticFingerprintTest))
+    suite.addTest(unittest.makeSuite(AssetBundleTest))
+    suite.addTest(unittest.makeSuite(StaticCompressionTest))
+    suite.addTest(unittest.makeSuite(APITest))
+    suite.addTest(unittest.makeSuite(APIPatchTest))
+    suite.addTest(unittest.makeSuite(ListFragmentTest))
+    suite.addTest(unittest.makeSuite(StreamedListTest))
+    suite.addTest(unittest.makeSuite(TemplateCacheTest))
+    suite.addTest(unittest.makeSuite(RequestMemoTest))
     suite.addTest(unittest.makeSuite(FileFieldTest))
     suite.addTest(unittest.makeSuite(DeprecationTest))
     suite.addTest(unittest.makeSuite(ConversionTest))